@@ -1,6 +1,7 @@
 import asyncio
 import builtins as _builtins
 import json
+import math
 import os
 import re
 import shutil
@@ -8,9 +9,14 @@ import sys
 import uuid
 import time
 import secrets
+import random
 import base64
+import hashlib
+import heapq
+import http.cookiejar
 import mimetypes
-from collections import defaultdict
+import multiprocessing
+from collections import defaultdict, deque
 from contextlib import asynccontextmanager, AsyncExitStack
 from pathlib import Path
 from typing import Optional, Dict, List
@@ -19,7 +25,7 @@ from urllib.parse import urlsplit
 
 import uvicorn
 from camoufox.async_api import AsyncCamoufox
-from fastapi import FastAPI, HTTPException, Depends, status, Form, Request, Response
+from fastapi import FastAPI, HTTPException, Depends, status, Form, Request, Response, WebSocket, WebSocketDisconnect
 from starlette.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.security import APIKeyHeader
 
@@ -987,96 +993,342 @@ def find_chrome_executable() -> Optional[str]:
     return None
 
 
-async def get_recaptcha_v3_token_with_chrome(config: dict) -> Optional[str]:
-    try:
-        from playwright.async_api import async_playwright  # type: ignore
-    except Exception:
+_BROWSER_FETCH_POOL_REAPER_TASK: Optional[asyncio.Task] = None
+
+
+# Resource blocking for bridge-controlled pages: they only need lmarena.ai's JS, the anti-bot scripts and `fetch`.
+# Playwright `request.resource_type` values blocked by default.
+_DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+# URL substrings blocked regardless of type (analytics/telemetry beacons).
+_DEFAULT_BLOCKED_URL_PATTERNS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "/cdn-cgi/rum",
+    "sentry.io",
+    "posthog",
+    "clarity.ms",
+    "hotjar",
+)
+# Anti-bot/captcha resources are never blocked, whatever their type (Turnstile and reCAPTCHA render images/fonts).
+_RESOURCE_BLOCKING_ALLOWLIST = (
+    "challenges.cloudflare.com",
+    "/cdn-cgi/challenge-platform/",
+    "/recaptcha/",
+    "recaptcha.net",
+)
+# Counters for /api/v1/health. Aborted requests are never sent, so their size is unknown; counts are per type.
+BROWSER_RESOURCE_BLOCKING_STATS: Dict[str, int] = defaultdict(int)
+
+
+def _get_resource_blocking_policy(config: dict) -> Optional[dict]:
+    if not bool(config.get("browser_resource_blocking_enabled", True)):
         return None
 
-    chrome_path = find_chrome_executable()
-    if not chrome_path:
+    def _lowered(key: str, default: tuple) -> tuple:
+        value = config.get(key)
+        if not isinstance(value, list):
+            return default
+        return tuple(str(v).strip().lower() for v in value if str(v or "").strip())
+
+    return {
+        "types": frozenset(_lowered("browser_blocked_resource_types", _DEFAULT_BLOCKED_RESOURCE_TYPES)),
+        "patterns": _lowered("browser_blocked_url_patterns", _DEFAULT_BLOCKED_URL_PATTERNS),
+        "allow": _RESOURCE_BLOCKING_ALLOWLIST + _lowered("browser_resource_allowlist", ()),
+    }
+
+
+def _resource_block_reason(url: str, resource_type: str, policy: dict) -> Optional[str]:
+    """Return why a request should be blocked under `policy` (its resource type or "url"), or None to allow it."""
+    url = str(url or "").lower()
+    if not url.startswith("http") or any(p in url for p in policy["allow"]):
         return None
+    resource_type = str(resource_type or "").lower()
+    if resource_type in policy["types"]:
+        return resource_type
+    if any(p in url for p in policy["patterns"]):
+        return "url"
+    return None
 
-    profile_dir = Path(CONFIG_FILE).with_name("chrome_grecaptcha")
 
-    cf_clearance = str(config.get("cf_clearance") or "").strip()
-    cf_bm = str(config.get("cf_bm") or "").strip()
-    cfuvid = str(config.get("cfuvid") or "").strip()
-    provisional_user_id = str(config.get("provisional_user_id") or "").strip()
-    user_agent = normalize_user_agent_value(config.get("user_agent"))
-    recaptcha_sitekey, recaptcha_action = get_recaptcha_settings(config)
+async def _continue_or_block_route(route, policy: Optional[dict]) -> None:
+    reason = None
+    if policy is not None:
+        try:
+            request = route.request
+            reason = _resource_block_reason(request.url, request.resource_type, policy)
+        except Exception:
+            reason = None
+    try:
+        if reason is None:
+            BROWSER_RESOURCE_BLOCKING_STATS["allowed"] += 1
+            await route.continue_()
+        else:
+            BROWSER_RESOURCE_BLOCKING_STATS["blocked"] += 1
+            BROWSER_RESOURCE_BLOCKING_STATS[f"blocked_{reason}"] += 1
+            await route.abort("blockedbyclient")
+    except Exception:
+        # The page/context may be gone already.
+        pass
 
-    cookies = []
-    if cf_clearance:
-        cookies.append({"name": "cf_clearance", "value": cf_clearance, "domain": ".lmarena.ai", "path": "/"})
-    if cf_bm:
-        cookies.append({"name": "__cf_bm", "value": cf_bm, "domain": ".lmarena.ai", "path": "/"})
-    if cfuvid:
-        cookies.append({"name": "_cfuvid", "value": cfuvid, "domain": ".lmarena.ai", "path": "/"})
-    if provisional_user_id:
-        cookies.append(
-            {"name": "provisional_user_id", "value": provisional_user_id, "domain": ".lmarena.ai", "path": "/"}
-        )
 
-    async with async_playwright() as p:
-        context = await p.chromium.launch_persistent_context(
-            user_data_dir=str(profile_dir),
-            executable_path=chrome_path,
-            headless=False,  # Headful for better reCAPTCHA score/warmup
-            user_agent=user_agent or None,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-first-run",
-                "--no-default-browser-check",
-            ],
-        )
+async def _install_resource_blocking(target, config: dict) -> bool:
+    """
+    Apply the resource-blocking policy to a Playwright page or browser context via route interception.
+
+    Note that routing disables the browser's HTTP cache for the routed target, which is why the pooled/warm pages
+    matter: they load the SPA once.
+    """
+    policy = _get_resource_blocking_policy(config)
+    if policy is None:
+        return False
+
+    async def _handle(route) -> None:
+        await _continue_or_block_route(route, policy)
+
+    try:
+        await target.route("**/*", _handle)
+        return True
+    except Exception as e:
+        debug_print(f"⚠️ Resource blocking unavailable: {e}")
+        return False
+
+
+async def _add_missing_arena_cookies(context, desired_cookies: list[dict]) -> None:
+    """Inject config cookies into the persistent Chrome profile without clobbering the profile's own ones."""
+    if not desired_cookies:
+        return
+    try:
+        existing_names: set[str] = set()
         try:
-            # Small stealth tweak: reduces bot-detection surface for reCAPTCHA v3 scoring.
-            try:
-                await context.add_init_script(
-                    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
-                )
-            except Exception:
-                pass
+            existing = await _get_arena_context_cookies(context)
+            for c in existing or []:
+                name = c.get("name")
+                if name:
+                    existing_names.add(str(name))
+        except Exception:
+            existing_names = set()
 
-            if cookies:
-                try:
-                    existing_names: set[str] = set()
-                    try:
-                        existing = await _get_arena_context_cookies(context)
-                        for c in existing or []:
-                            name = c.get("name")
-                            if name:
-                                existing_names.add(str(name))
-                    except Exception:
-                        existing_names = set()
+        cookies_to_add: list[dict] = []
+        for c in desired_cookies:
+            name = str(c.get("name") or "")
+            if not name:
+                continue
+            # Always ensure the auth cookie matches the selected upstream token.
+            if name == "arena-auth-prod-v1":
+                cookies_to_add.append(c)
+                continue
 
-                    cookies_to_add: list[dict] = []
-                    for c in cookies:
-                        name = str(c.get("name") or "")
-                        if not name:
-                            continue
-                        # Always ensure the auth cookie matches the selected upstream token.
-                        if name == "arena-auth-prod-v1":
-                            cookies_to_add.append(c)
-                            continue
+            # Do NOT overwrite/inject Cloudflare or reCAPTCHA cookies in the persistent profile.
+            # The profile manages these itself; injecting stale ones from config causes 403s.
+            if name in ("cf_clearance", "__cf_bm", "_GRECAPTCHA"):
+                continue
 
-                        # Do NOT overwrite/inject Cloudflare or reCAPTCHA cookies in the persistent profile.
-                        # The profile manages these itself; injecting stale ones from config causes 403s.
-                        if name in ("cf_clearance", "__cf_bm", "_GRECAPTCHA"):
-                            continue
+            # Avoid overwriting existing Cloudflare/session cookies in the persistent profile.
+            if name in existing_names:
+                continue
+            cookies_to_add.append(c)
 
-                        # Avoid overwriting existing Cloudflare/session cookies in the persistent profile.
-                        if name in existing_names:
-                            continue
-                        cookies_to_add.append(c)
+        if cookies_to_add:
+            await context.add_cookies(cookies_to_add)
+    except Exception:
+        pass
 
-                    if cookies_to_add:
-                        await context.add_cookies(cookies_to_add)
-                except Exception:
-                    pass
 
-            page = await context.new_page()
+async def _mint_recaptcha_v3_token_in_chrome_page(page, sitekey: str, action: str) -> Optional[str]:
+    await page.wait_for_function(
+        "window.grecaptcha && ("
+        "(window.grecaptcha.enterprise && typeof window.grecaptcha.enterprise.execute === 'function') || "
+        "typeof window.grecaptcha.execute === 'function'"
+        ")",
+        timeout=60000,
+    )
+    token = await page.evaluate(
+        """({sitekey, action}) => new Promise((resolve, reject) => {
+          const g = (window.grecaptcha?.enterprise && typeof window.grecaptcha.enterprise.execute === 'function')
+            ? window.grecaptcha.enterprise
+            : window.grecaptcha;
+          if (!g || typeof g.execute !== 'function') return reject('NO_GRECAPTCHA');
+          try {
+            g.execute(sitekey, { action }).then(resolve).catch((err) => reject(String(err)));
+          } catch (e) { reject(String(e)); }
+        })""",
+        {"sitekey": sitekey, "action": action},
+    )
+    if isinstance(token, str) and token:
+        return token
+    return None
+
+
+class BrowserPageLease:
+    """A warm lmarena.ai page in a pooled browser context (Chrome or Camoufox), held by one caller at a time."""
+
+    def __init__(self, page, context) -> None:
+        self.page = page
+        self.context = context
+        self.uses = 0
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        # Where the page's `reportChunk` binding delivers lines for the current lease; chunks tagged with a
+        # different channel belong to an earlier (abandoned) fetch and are dropped.
+        self.chunk_sink: Optional[asyncio.Queue] = None
+        self.chunk_channel = ""
+        # Per-lease state read by `ChromeContextPool.lease`.
+        self.healthy = True
+        self.handed_off = False
+
+    async def _report_chunk(self, source, line: str, channel: Optional[str] = None) -> None:
+        sink = self.chunk_sink
+        if sink is None or (channel is not None and channel != self.chunk_channel):
+            return
+        if line and line.strip():
+            await sink.put(line)
+
+
+class ChromeContextPool:
+    """
+    Keeps the Chrome persistent profile (`chrome_grecaptcha`) open with a few warm lmarena.ai pages.
+
+    A Chrome profile can only be opened by one process, so every Chrome user (the fetch transport and the
+    side-channel minter) shares one persistent context and leases pages from it. Pages are navigated, past
+    Turnstile and warmed up once; returning a lease keeps the page for the next caller until it hits
+    `chrome_fetch_pool_max_uses`, fails a health check, or sits idle past `chrome_fetch_pool_idle_seconds`.
+
+    Cookies are shared by all pages, so requests for different arena-auth tokens take turns while sending
+    (see `begin_send`); requests for the same token run concurrently.
+    """
+
+    SETTINGS_PREFIX = "chrome_fetch_pool"
+    LABEL = "Chrome"
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._browser_cm = None
+        self._context = None
+        self._context_key: Optional[tuple] = None
+        self._last_active = 0.0
+        self._idle: list[BrowserPageLease] = []
+        self._leased: set[BrowserPageLease] = set()
+        self._closing: set[asyncio.Task] = set()
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._send_cond: Optional[asyncio.Condition] = None
+        self._sending = 0
+        self._auth_cookie = ""
+        self.stats: Dict[str, int] = {
+            "launches": 0,
+            "pages_created": 0,
+            "leases": 0,
+            "reused": 0,
+            "recycled": 0,
+            "unhealthy": 0,
+            "idle_closed": 0,
+        }
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # Playwright objects are tied to the loop that created them; start over on a new one.
+        self._loop = loop
+        self._browser_cm = None
+        self._context = None
+        self._context_key = None
+        self._idle = []
+        self._leased = set()
+        self._closing = set()
+        self._launch_lock = asyncio.Lock()
+        self._send_cond = asyncio.Condition()
+        self._sending = 0
+        self._auth_cookie = ""
+
+    @classmethod
+    def _settings(cls, config: Optional[dict] = None) -> dict:
+        config = config if config is not None else _get_config_snapshot()
+        prefix = cls.SETTINGS_PREFIX
+        try:
+            idle_seconds = max(0.0, float(config.get(f"{prefix}_idle_seconds", 300)))
+        except (TypeError, ValueError):
+            idle_seconds = 300.0
+        return {
+            "enabled": bool(config.get(f"{prefix}_enabled", True)),
+            "size": _coerce_positive_int(config.get(f"{prefix}_size"), 2),
+            "max_uses": _coerce_positive_int(config.get(f"{prefix}_max_uses"), 50),
+            "idle_seconds": idle_seconds,
+        }
+
+    async def _close_page(self, lease: BrowserPageLease) -> None:
+        try:
+            await lease.page.close()
+        except Exception:
+            pass
+
+    async def _close_context(self) -> None:
+        context, cm = self._context, self._browser_cm
+        self._context = None
+        self._context_key = None
+        self._browser_cm = None
+        idle, self._idle = self._idle, []
+        for lease in idle:
+            await self._close_page(lease)
+        if context is not None:
+            try:
+                await context.close()
+            except Exception as e:
+                debug_print(f"  ⚠️ Error closing {self.LABEL} context: {e}")
+        if cm is not None:
+            try:
+                await cm.__aexit__(None, None, None)
+            except Exception:
+                pass
+
+    async def _ensure_context(self, *, chrome_path: str, headless: bool, user_agent: str):
+        from playwright.async_api import async_playwright  # type: ignore
+
+        key = (chrome_path, bool(headless), user_agent or "")
+        if self._context is not None and key != self._context_key and not self._leased:
+            debug_print("♻️ Chrome launch options changed; relaunching pooled context")
+            await self._close_context()
+        if self._context is not None:
+            return self._context
+
+        profile_dir = Path(CONFIG_FILE).with_name("chrome_grecaptcha")
+        cm = async_playwright()
+        p = await cm.__aenter__()
+        try:
+            context = await p.chromium.launch_persistent_context(
+                user_data_dir=str(profile_dir),
+                executable_path=chrome_path,
+                headless=bool(headless),
+                user_agent=user_agent or None,
+                args=[
+                    "--disable-blink-features=AutomationControlled",
+                    "--no-first-run",
+                    "--no-default-browser-check",
+                ],
+            )
+        except BaseException:
+            try:
+                await cm.__aexit__(None, None, None)
+            except Exception:
+                pass
+            raise
+        # Small stealth tweak: reduces bot-detection surface for reCAPTCHA v3 scoring.
+        try:
+            await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
+        except Exception:
+            pass
+        await _install_resource_blocking(context, _get_config_snapshot())
+        self._browser_cm = cm
+        self._context = context
+        self._context_key = key
+        self.stats["launches"] += 1
+        return context
+
+    async def _new_page(self, context, config: dict, *, headless: bool, desired_cookies: list[dict]) -> BrowserPageLease:
+        await _add_missing_arena_cookies(context, desired_cookies)
+        page = await context.new_page()
+        lease = BrowserPageLease(page, context)
+        try:
             await _maybe_apply_camoufox_window_mode(
                 page,
                 config,
@@ -1086,68 +1338,370 @@ async def get_recaptcha_v3_token_with_chrome(config: dict) -> Optional[str]:
             )
             await page.goto("https://lmarena.ai/?mode=direct", wait_until="domcontentloaded", timeout=120000)
 
-            # Best-effort: if we land on a Cloudflare challenge page, try clicking Turnstile.
+            # Best-effort: if we land on a Cloudflare challenge page, try clicking Turnstile before minting tokens.
             try:
-                for _ in range(5):
+                for i in range(10): # Up to 30 seconds
                     title = await page.title()
                     if "Just a moment" not in title:
                         break
+                    debug_print(f"  ⏳ Waiting for Cloudflare challenge in Chrome... (attempt {i+1}/10)")
                     await click_turnstile(page)
-                    await asyncio.sleep(2)
+                    await asyncio.sleep(3)
+                try:
+                    await page.wait_for_load_state("domcontentloaded", timeout=15000)
+                except Exception:
+                    pass
             except Exception:
                 pass
 
             # Light warm-up (often improves reCAPTCHA v3 score vs firing immediately).
             try:
                 await page.mouse.move(100, 100)
+                await asyncio.sleep(0.5)
                 await page.mouse.wheel(0, 200)
                 await asyncio.sleep(1)
                 await page.mouse.move(200, 300)
+                await asyncio.sleep(0.5)
                 await page.mouse.wheel(0, 300)
-                await asyncio.sleep(3) # Increased "Human" pause
+                await asyncio.sleep(2) # Reduced "Human" pause for faster response
             except Exception:
                 pass
 
-            # Persist updated cookies/UA from this real browser context (often refreshes arena-auth-prod-v1).
+            # Persist updated cookies/UA from this browser context (helps keep auth + cf cookies fresh).
             try:
                 fresh_cookies = await _get_arena_context_cookies(context, page_url=str(getattr(page, "url", "") or ""))
+                _capture_ephemeral_arena_auth_token_from_cookies(fresh_cookies)
                 try:
                     ua_now = await page.evaluate("() => navigator.userAgent")
                 except Exception:
-                    ua_now = user_agent
+                    ua_now = normalize_user_agent_value(config.get("user_agent"))
                 if _upsert_browser_session_into_config(config, fresh_cookies, user_agent=ua_now):
                     save_config(config)
             except Exception:
                 pass
 
-            await page.wait_for_function(
-                "window.grecaptcha && ("
-                "(window.grecaptcha.enterprise && typeof window.grecaptcha.enterprise.execute === 'function') || "
-                "typeof window.grecaptcha.execute === 'function'"
-                ")",
-                timeout=60000,
-            )
+            await page.expose_binding("reportChunk", lease._report_chunk)
+        except BaseException:
+            await self._close_page(lease)
+            raise
+        self.stats["pages_created"] += 1
+        return lease
 
-            token = await page.evaluate(
-                """({sitekey, action}) => new Promise((resolve, reject) => {
-                  const g = (window.grecaptcha?.enterprise && typeof window.grecaptcha.enterprise.execute === 'function')
-                    ? window.grecaptcha.enterprise
-                    : window.grecaptcha;
-                  if (!g || typeof g.execute !== 'function') return reject('NO_GRECAPTCHA');
-                  try {
-                    g.execute(sitekey, { action }).then(resolve).catch((err) => reject(String(err)));
-                  } catch (e) { reject(String(e)); }
-                })""",
-                {"sitekey": recaptcha_sitekey, "action": recaptcha_action},
-            )
-            if isinstance(token, str) and token:
-                return token
-            return None
-        except Exception as e:
-            debug_print(f"⚠️ Chrome reCAPTCHA retrieval failed: {e}")
-            return None
+    @staticmethod
+    def _is_healthy(lease: BrowserPageLease) -> bool:
+        try:
+            if lease.page.is_closed():
+                return False
+            return "lmarena.ai" in str(lease.page.url or "")
+        except Exception:
+            return False
+
+    async def acquire(
+        self,
+        config: dict,
+        *,
+        chrome_path: str = "",
+        headless: bool = False,
+        desired_cookies: Optional[list[dict]] = None,
+    ) -> BrowserPageLease:
+        """Lease a warm page, launching Chrome and/or opening a new page only when no idle one is usable."""
+        self._bind_loop()
+        user_agent = normalize_user_agent_value(config.get("user_agent"))
+        async with self._launch_lock:
+            context = await self._ensure_context(chrome_path=chrome_path, headless=headless, user_agent=user_agent)
+            lease: Optional[BrowserPageLease] = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if candidate.context is context and self._is_healthy(candidate):
+                    lease = candidate
+                    break
+                self.stats["unhealthy"] += 1
+                await self._close_page(candidate)
+            if lease is not None:
+                self.stats["reused"] += 1
+                self._leased.add(lease)
+        if lease is None:
+            try:
+                lease = await self._new_page(context, config, headless=headless, desired_cookies=desired_cookies or [])
+            except Exception:
+                # A context that can't open pages (e.g. the browser crashed) is relaunched by the next caller.
+                if not self._leased:
+                    async with self._launch_lock:
+                        if self._context is context and not self._leased:
+                            await self._close_context()
+                raise
+            self._leased.add(lease)
+        lease.uses += 1
+        lease.healthy = True
+        lease.handed_off = False
+        self.stats["leases"] += 1
+        self._last_active = time.monotonic()
+        return lease
+
+    @asynccontextmanager
+    async def lease(self, config: dict, **kwargs):
+        """
+        `acquire` + `release` around a block. Set `lease.healthy = False` to discard the page afterwards, or
+        `lease.handed_off = True` when something else (e.g. a still-running stream) will release it.
+        """
+        lease = await self.acquire(config, **kwargs)
+        try:
+            yield lease
+        except BaseException:
+            lease.healthy = False
+            raise
         finally:
-            await context.close()
+            if not lease.handed_off:
+                await self.release(lease, healthy=lease.healthy)
+
+    async def release(self, lease: BrowserPageLease, *, healthy: bool = True) -> None:
+        self._leased.discard(lease)
+        lease.chunk_sink = None
+        lease.chunk_channel = ""
+        lease.last_used = time.monotonic()
+        self._last_active = lease.last_used
+        settings = self._settings()
+        keep = (
+            settings["enabled"]
+            and healthy
+            and lease.context is self._context
+            and lease.uses < settings["max_uses"]
+            and len(self._idle) < settings["size"]
+        )
+        if keep:
+            self._idle.append(lease)
+            return
+        self.stats["recycled"] += 1
+        await self._close_page(lease)
+        if not settings["enabled"] and not self._leased and not self._idle:
+            await self._close_context()
+
+    def release_soon(self, lease: BrowserPageLease, *, healthy: bool = True) -> None:
+        """Release from a sync callback (e.g. when a streamed in-page fetch finishes)."""
+        task = asyncio.create_task(self.release(lease, healthy=healthy))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+        task.add_done_callback(_consume_background_task_exception)
+
+    async def begin_send(self, lease: BrowserPageLease, desired_cookies: list[dict], auth_cookie: str) -> None:
+        """
+        Apply cookies for a request about to be sent from `lease`.
+
+        All pages share one cookie jar, so a request for a different auth token waits until in-flight sends for
+        the current one have received their response headers.
+        """
+        async with self._send_cond:
+            if auth_cookie:
+                while self._sending and self._auth_cookie and self._auth_cookie != auth_cookie:
+                    await self._send_cond.wait()
+            await _add_missing_arena_cookies(lease.context, desired_cookies)
+            if auth_cookie:
+                self._auth_cookie = auth_cookie
+            self._sending += 1
+
+    async def end_send(self) -> None:
+        async with self._send_cond:
+            self._sending = max(0, self._sending - 1)
+            if not self._sending:
+                self._auth_cookie = ""
+            self._send_cond.notify_all()
+
+    async def shrink_idle(self) -> None:
+        """Close pages idle past `<prefix>_idle_seconds`, and the browser itself once nothing is left."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        settings = self._settings()
+        now = time.monotonic()
+        keep: list[BrowserPageLease] = []
+        for lease in self._idle:
+            if now - lease.last_used > settings["idle_seconds"]:
+                self.stats["idle_closed"] += 1
+                await self._close_page(lease)
+            else:
+                keep.append(lease)
+        self._idle = keep
+        if (
+            self._context is not None
+            and not self._idle
+            and not self._leased
+            and now - self._last_active > settings["idle_seconds"]
+        ):
+            debug_print(f"💤 Closing idle pooled {self.LABEL} context")
+            async with self._launch_lock:
+                if not self._leased and not self._idle:
+                    await self._close_context()
+
+    async def close(self) -> None:
+        if self._loop is not asyncio.get_running_loop():
+            return
+        for lease in list(self._leased):
+            await self._close_page(lease)
+        self._leased.clear()
+        await self._close_context()
+
+    def snapshot(self) -> dict:
+        return {
+            "running": self._context is not None,
+            "idle_pages": len(self._idle),
+            "leased_pages": len(self._leased),
+            **self.stats,
+        }
+
+
+CHROME_FETCH_POOL = ChromeContextPool()
+
+
+class CamoufoxContextPool(ChromeContextPool):
+    """
+    Keeps one Camoufox browser open with a few warm lmarena.ai pages for the Camoufox fetch transport.
+
+    Same leasing rules as the Chrome pool (see `ChromeContextPool`), configured via `camoufox_fetch_pool_*`. The
+    context is not persistent, so config cookies are only seeded when the browser doesn't have them yet.
+    """
+
+    SETTINGS_PREFIX = "camoufox_fetch_pool"
+    LABEL = "Camoufox"
+
+    async def _ensure_context(self, *, chrome_path: str, headless: bool, user_agent: str):
+        key = (bool(headless), user_agent or "")
+        if self._context is not None and key != self._context_key and not self._leased:
+            debug_print("♻️ Camoufox launch options changed; relaunching pooled browser")
+            await self._close_context()
+        if self._context is not None:
+            return self._context
+
+        cm = AsyncCamoufox(headless=bool(headless), main_world_eval=True)
+        browser = await cm.__aenter__()
+        try:
+            context = await browser.new_context(user_agent=user_agent or None)
+        except BaseException:
+            try:
+                await cm.__aexit__(None, None, None)
+            except Exception:
+                pass
+            raise
+        # Small stealth tweak: reduces bot-detection surface for reCAPTCHA v3 scoring.
+        try:
+            await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
+        except Exception:
+            pass
+        await _install_resource_blocking(context, _get_config_snapshot())
+        self._browser_cm = cm
+        self._context = context
+        self._context_key = key
+        self.stats["launches"] += 1
+        return context
+
+    async def _new_page(self, context, config: dict, *, headless: bool, desired_cookies: list[dict]) -> BrowserPageLease:
+        try:
+            existing = await _get_arena_context_cookies(context)
+            existing_names = {str(c.get("name") or "") for c in existing or []}
+            missing = [c for c in desired_cookies if str(c.get("name") or "") not in existing_names]
+            if missing:
+                await context.add_cookies(missing)
+        except Exception:
+            pass
+        page = await context.new_page()
+        lease = BrowserPageLease(page, context)
+        try:
+            await _maybe_apply_camoufox_window_mode(
+                page,
+                config,
+                mode_key="camoufox_fetch_window_mode",
+                marker="LMArenaBridge Camoufox Fetch",
+                headless=bool(headless),
+            )
+            debug_print("  🦊 Navigating to lmarena.ai...")
+            try:
+                await asyncio.wait_for(
+                    page.goto("https://lmarena.ai/?mode=direct", wait_until="domcontentloaded", timeout=60000),
+                    timeout=70.0,
+                )
+            except Exception:
+                pass
+
+            # Try to handle Cloudflare Turnstile if present
+            try:
+                for _ in range(5):
+                    title = await page.title()
+                    if "Just a moment" not in title:
+                        break
+                    await click_turnstile(page)
+                    await asyncio.sleep(2)
+            except Exception:
+                pass
+
+            # Persist cookies
+            try:
+                fresh_cookies = await _get_arena_context_cookies(context, page_url=str(getattr(page, "url", "") or ""))
+                _capture_ephemeral_arena_auth_token_from_cookies(fresh_cookies)
+                try:
+                    ua_now = await page.evaluate("() => navigator.userAgent")
+                except Exception:
+                    ua_now = normalize_user_agent_value(config.get("user_agent"))
+                if _upsert_browser_session_into_config(config, fresh_cookies, user_agent=ua_now):
+                    save_config(config)
+            except Exception:
+                pass
+
+            await page.expose_binding("reportChunk", lease._report_chunk)
+        except BaseException:
+            await self._close_page(lease)
+            raise
+        self.stats["pages_created"] += 1
+        return lease
+
+
+CAMOUFOX_FETCH_POOL = CamoufoxContextPool()
+
+
+async def browser_fetch_pool_reaper_task() -> None:
+    while True:
+        await asyncio.sleep(30)
+        for pool in (CHROME_FETCH_POOL, CAMOUFOX_FETCH_POOL):
+            try:
+                await pool.shrink_idle()
+            except Exception as e:
+                debug_print(f"⚠️ {pool.LABEL} pool reaper error: {e}")
+
+
+async def get_recaptcha_v3_token_with_chrome(config: dict) -> Optional[str]:
+    try:
+        from playwright.async_api import async_playwright  # type: ignore
+    except Exception:
+        return None
+
+    chrome_path = find_chrome_executable()
+    if not chrome_path:
+        return None
+
+    cf_clearance = str(config.get("cf_clearance") or "").strip()
+    cf_bm = str(config.get("cf_bm") or "").strip()
+    cfuvid = str(config.get("cfuvid") or "").strip()
+    provisional_user_id = str(config.get("provisional_user_id") or "").strip()
+    recaptcha_sitekey, recaptcha_action = get_recaptcha_settings(config)
+
+    cookies = []
+    if cf_clearance:
+        cookies.append({"name": "cf_clearance", "value": cf_clearance, "domain": ".lmarena.ai", "path": "/"})
+    if cf_bm:
+        cookies.append({"name": "__cf_bm", "value": cf_bm, "domain": ".lmarena.ai", "path": "/"})
+    if cfuvid:
+        cookies.append({"name": "_cfuvid", "value": cfuvid, "domain": ".lmarena.ai", "path": "/"})
+    if provisional_user_id:
+        cookies.append(
+            {"name": "provisional_user_id", "value": provisional_user_id, "domain": ".lmarena.ai", "path": "/"}
+        )
+
+    try:
+        # Headful for better reCAPTCHA score/warmup.
+        async with CHROME_FETCH_POOL.lease(
+            config, chrome_path=chrome_path, headless=False, desired_cookies=cookies
+        ) as lease:
+            return await _mint_recaptcha_v3_token_in_chrome_page(lease.page, recaptcha_sitekey, recaptcha_action)
+    except Exception as e:
+        debug_print(f"⚠️ Chrome reCAPTCHA retrieval failed: {e}")
+        return None
 
 
 def is_execution_context_destroyed_error(exc: BaseException) -> bool:
@@ -1195,6 +1749,11 @@ async def _cancel_background_task(task: Optional["asyncio.Task"], *, timeout_sec
     task.cancel()
     try:
         await asyncio.wait_for(task, timeout=float(timeout_seconds))
+    except asyncio.CancelledError:
+        # The task's own cancellation is expected; only propagate if we were cancelled ourselves.
+        current = asyncio.current_task()
+        if current is not None and current.cancelling():
+            raise
     except Exception:
         pass
 
@@ -1286,6 +1845,15 @@ class BrowserFetchStreamResponse:
 USERSCRIPT_PROXY_LAST_POLL_AT: float = 0.0
 _USERSCRIPT_PROXY_QUEUE: Optional[asyncio.Queue] = None
 _USERSCRIPT_PROXY_JOBS: dict[str, dict] = {}
+# Expiry heap for `_USERSCRIPT_PROXY_JOBS`: (deadline_monotonic, job_id, phase). Entries are invalidated lazily;
+# only the one matching a job's `_expiry_deadline` counts.
+_USERSCRIPT_PROXY_JOB_DEADLINES: list[tuple] = []
+USERSCRIPT_PROXY_JOB_EXPIRY_STATS: Dict[str, int] = defaultdict(int)
+_USERSCRIPT_PROXY_JOB_PHASES = ("queued", "picked_up", "signup", "fetch", "done")
+# Only set inside Camoufox proxy farm worker processes: job updates are sent back to the parent over this
+# multiprocessing queue instead of being applied to a local job (see `CamoufoxProxyFarm`).
+_CAMOUFOX_PROXY_FARM_CHUNK_SINK = None
+_CAMOUFOX_PROXY_FARM_WORKER_INDEX: Optional[int] = None
 
 def _touch_userscript_poll(now: Optional[float] = None) -> None:
     """
@@ -1331,44 +1899,114 @@ def _userscript_proxy_is_active(config: Optional[dict] = None) -> bool:
     return delta <= float(active_window)
 
 
-def _userscript_proxy_check_secret(request: Request) -> None:
-    cfg = get_config()
+def _userscript_proxy_secret_ok(provided: Optional[str], config: Optional[dict] = None) -> bool:
+    cfg = config or get_config()
     secret = str(cfg.get("userscript_proxy_secret") or "").strip()
-    if secret and request.headers.get("X-LMBridge-Secret") != secret:
+    return (not secret) or provided == secret
+
+
+def _userscript_proxy_check_secret(request: Request) -> None:
+    if not _userscript_proxy_secret_ok(request.headers.get("X-LMBridge-Secret")):
         raise HTTPException(status_code=401, detail="Invalid userscript proxy secret")
 
 
-def _cleanup_userscript_proxy_jobs(config: Optional[dict] = None) -> None:
-    cfg = config or get_config()
-    ttl_seconds = 90
+def _claim_userscript_proxy_job(job_id: object) -> Optional[dict]:
+    """Mark a queued job as handed to a poller; None if it has already been cleaned up."""
+    job = _USERSCRIPT_PROXY_JOBS.get(str(job_id))
+    if not isinstance(job, dict):
+        return None
+    # Mark as picked up as soon as we hand the job to a poller so the server-side pickup timeout
+    # doesn't trip while the poller/browser is starting.
+    try:
+        picked = job.get("picked_up_event")
+        if isinstance(picked, asyncio.Event) and not picked.is_set():
+            picked.set()
+            if not job.get("picked_up_at_monotonic"):
+                job["picked_up_at_monotonic"] = time.monotonic()
+        if str(job.get("phase") or "") == "queued":
+            job["phase"] = "picked_up"
+    except Exception:
+        pass
+    _schedule_userscript_proxy_job_expiry(str(job_id), job)
+    return job
+
+
+def _get_userscript_proxy_job_timeouts(config: Optional[dict] = None) -> dict:
+    """
+    How long a job may stay in each phase before it is dropped from `_USERSCRIPT_PROXY_JOBS` (for "done", how
+    long a finished job is kept around). Defaults derive from the legacy `userscript_proxy_job_ttl_seconds`;
+    `userscript_proxy_job_<phase>_timeout_seconds` overrides a single phase.
+    """
+    cfg = config if config is not None else _get_config_snapshot()
     try:
         ttl_seconds = int(cfg.get("userscript_proxy_job_ttl_seconds", 90))
     except Exception:
         ttl_seconds = 90
     ttl_seconds = max(10, min(ttl_seconds, 600))
-
-    now = time.time()
-    expired: list[str] = []
-    for job_id, job in list(_USERSCRIPT_PROXY_JOBS.items()):
-        created_at = float(job.get("created_at") or 0.0)
-        done = bool(job.get("done"))
-        picked_up = False
+    defaults = {
+        "queued": ttl_seconds,
+        "picked_up": ttl_seconds,
+        "signup": ttl_seconds * 5,
+        "fetch": ttl_seconds * 5,
+        "done": ttl_seconds,
+    }
+    timeouts = {}
+    for phase, default in defaults.items():
         try:
-            picked_up_event = job.get("picked_up_event")
-            if isinstance(picked_up_event, asyncio.Event):
-                picked_up = bool(picked_up_event.is_set())
-        except Exception:
-            picked_up = False
-        if done and (now - created_at) > ttl_seconds:
-            expired.append(job_id)
-        # If a job was never picked up, expire it even if not marked done (stuck/abandoned queue entries).
-        elif (not done) and (not picked_up) and (now - created_at) > ttl_seconds:
-            expired.append(job_id)
-        # Safety: even if picked up, expire if it's been in-flight for too long (e.g. browser crash).
-        elif (not done) and picked_up and (now - created_at) > (ttl_seconds * 5):
-            expired.append(job_id)
-    for job_id in expired:
+            value = float(cfg.get(f"userscript_proxy_job_{phase}_timeout_seconds", default))
+        except (TypeError, ValueError):
+            value = float(default)
+        timeouts[phase] = max(1.0, min(value, 3600.0))
+    return timeouts
+
+
+def _userscript_proxy_job_expiry_phase(job: dict) -> str:
+    if job.get("done"):
+        return "done"
+    phase = str(job.get("phase") or "queued")
+    return phase if phase in _USERSCRIPT_PROXY_JOB_PHASES else "fetch"
+
+
+def _schedule_userscript_proxy_job_expiry(job_id: str, job: dict, config: Optional[dict] = None) -> None:
+    """(Re)arm a job's deadline for the phase it is in now; a no-op if that phase is already armed."""
+    if _CAMOUFOX_PROXY_FARM_CHUNK_SINK is not None:
+        # Farm worker processes only hold borrowed copies of jobs; the parent expires them.
+        return
+    phase = _userscript_proxy_job_expiry_phase(job)
+    if job.get("_expiry_phase") == phase:
+        return
+    deadline = time.monotonic() + _get_userscript_proxy_job_timeouts(config)[phase]
+    job["_expiry_phase"] = phase
+    job["_expiry_deadline"] = deadline
+    heapq.heappush(_USERSCRIPT_PROXY_JOB_DEADLINES, (deadline, str(job_id), phase))
+
+
+def _cleanup_userscript_proxy_jobs(config: Optional[dict] = None) -> None:
+    """Drop jobs that outstayed their current phase's timeout; amortized O(log n) per job."""
+    now = time.monotonic()
+    heap = _USERSCRIPT_PROXY_JOB_DEADLINES
+    while heap and heap[0][0] <= now:
+        deadline, job_id, phase = heapq.heappop(heap)
+        job = _USERSCRIPT_PROXY_JOBS.get(job_id)
+        if not isinstance(job, dict) or job.get("_expiry_deadline") != deadline:
+            continue  # superseded by a later phase, or already gone
+        if _userscript_proxy_job_expiry_phase(job) != phase:
+            # The phase changed somewhere that doesn't re-arm the deadline; give the new phase its full budget.
+            _schedule_userscript_proxy_job_expiry(job_id, job, config)
+            continue
         _USERSCRIPT_PROXY_JOBS.pop(job_id, None)
+        USERSCRIPT_PROXY_JOB_EXPIRY_STATS[phase] += 1
+        if phase != "done":
+            debug_print(f"⚠️ Userscript proxy job {job_id[:8]} expired in phase {phase}.")
+            USERSCRIPT_PROXY_SCHEDULER.release(job_id, job, error=True)
+
+
+def get_userscript_proxy_job_stats() -> dict:
+    return {
+        "active": len(_USERSCRIPT_PROXY_JOBS),
+        "pending_deadlines": len(_USERSCRIPT_PROXY_JOB_DEADLINES),
+        "expired": {phase: int(USERSCRIPT_PROXY_JOB_EXPIRY_STATS.get(phase, 0)) for phase in _USERSCRIPT_PROXY_JOB_PHASES},
+    }
 
 
 def _mark_userscript_proxy_inactive() -> None:
@@ -1405,28 +2043,308 @@ async def _finalize_userscript_proxy_job(job_id: str, *, error: Optional[str] =
             _USERSCRIPT_PROXY_JOBS.pop(jid, None)
         return
 
-    job["_finalized"] = True
-    job["done"] = True
+    job["_finalized"] = True
+    job["done"] = True
+
+    done_event = job.get("done_event")
+    if isinstance(done_event, asyncio.Event):
+        done_event.set()
+    status_event = job.get("status_event")
+    if isinstance(status_event, asyncio.Event):
+        status_event.set()
+
+    q = job.get("lines_queue")
+    if isinstance(q, asyncio.Queue):
+        try:
+            q.put_nowait(None)
+        except Exception:
+            try:
+                await q.put(None)
+            except Exception:
+                pass
+
+    USERSCRIPT_PROXY_SCHEDULER.release(jid, job, error=bool(job.get("error")))
+    _schedule_userscript_proxy_job_expiry(jid, job)
+
+    if remove:
+        _USERSCRIPT_PROXY_JOBS.pop(jid, None)
+
+
+class UserscriptProxyScheduler:
+    """
+    Hands userscript-proxy jobs to registered pollers (HTTP long-poll or WebSocket) by observed performance.
+
+    A poller registers with an id and a capacity and holds up to that many jobs at once. When a job is queued
+    while several pollers are waiting, the one with the lowest score gets it: EWMAs of its pickup latency (job
+    handed over -> first push) and fetch-start latency (-> upstream status), plus a penalty for its error rate.
+    Pollers that have not been scored yet go first so new tabs/machines get tried.
+
+    A poller that misses its heartbeat (no poll or push for `userscript_proxy_poller_heartbeat_timeout_seconds`)
+    is dropped: jobs it had not started streaming go back on the queue, the rest fail so their requests fall
+    back. Pollers without an id keep taking jobs straight off the queue, as does the internal Camoufox worker.
+    """
+
+    EWMA_ALPHA = 0.3
+    ERROR_PENALTY_SECONDS = 10.0
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pollers: Dict[str, dict] = {}
+        self._waiters: list[tuple] = []
+        self._waiter_added: Optional[asyncio.Event] = None
+        self._dispatch_task: Optional["asyncio.Task"] = None
+        self.stats: Dict[str, int] = {"assigned": 0, "requeued": 0, "failed_on_drop": 0, "pollers_expired": 0}
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # Futures/events are tied to the loop that created them; start over on a new one.
+        self._loop = loop
+        self._pollers = {}
+        self._waiters = []
+        self._waiter_added = asyncio.Event()
+        self._dispatch_task = None
+
+    @staticmethod
+    def _settings(config: Optional[dict] = None) -> dict:
+        config = config if config is not None else _get_config_snapshot()
+        try:
+            heartbeat_timeout = max(5.0, float(config.get("userscript_proxy_poller_heartbeat_timeout_seconds", 45)))
+        except (TypeError, ValueError):
+            heartbeat_timeout = 45.0
+        return {"heartbeat_timeout_seconds": heartbeat_timeout}
+
+    def register(self, poller_id: str, capacity: object = None) -> dict:
+        self._bind_loop()
+        poller = self._pollers.get(poller_id)
+        if poller is None:
+            poller = {
+                "capacity": 1,
+                "in_flight": {},
+                "last_seen": time.monotonic(),
+                "polling": 0,
+                "pickup_ewma": None,
+                "fetch_ewma": None,
+                "error_ewma": 0.0,
+                "jobs": 0,
+                "errors": 0,
+                "slot_freed": asyncio.Event(),
+            }
+            self._pollers[poller_id] = poller
+        poller["capacity"] = max(1, min(_coerce_positive_int(capacity, poller["capacity"]), 32))
+        poller["last_seen"] = time.monotonic()
+        return poller
+
+    def touch(self, poller_id: str) -> None:
+        poller = self._pollers.get(poller_id)
+        if poller is not None:
+            poller["last_seen"] = time.monotonic()
+
+    def _score(self, poller: dict) -> float:
+        return (
+            float(poller["pickup_ewma"] or 0.0)
+            + float(poller["fetch_ewma"] or 0.0)
+            + float(poller["error_ewma"]) * self.ERROR_PENALTY_SECONDS
+        )
+
+    def _ewma(self, previous: Optional[float], sample: float) -> float:
+        if previous is None:
+            return sample
+        return previous + self.EWMA_ALPHA * (sample - previous)
 
-    done_event = job.get("done_event")
-    if isinstance(done_event, asyncio.Event):
-        done_event.set()
-    status_event = job.get("status_event")
-    if isinstance(status_event, asyncio.Event):
-        status_event.set()
+    def _free_slots(self, poller: dict) -> int:
+        in_flight = poller["in_flight"]
+        for job_id in list(in_flight):
+            job = _USERSCRIPT_PROXY_JOBS.get(job_id)
+            if not isinstance(job, dict) or job.get("done"):
+                in_flight.pop(job_id, None)
+        return poller["capacity"] - len(in_flight)
 
-    q = job.get("lines_queue")
-    if isinstance(q, asyncio.Queue):
+    def _assign(self, poller_id: str, job_id: object) -> Optional[dict]:
+        job = _claim_userscript_proxy_job(job_id)
+        if job is None:
+            return None
+        now = time.monotonic()
+        job["_poller_id"] = poller_id
+        job["_poller_assigned_at_monotonic"] = now
+        poller = self._pollers[poller_id]
+        poller["in_flight"][str(job_id)] = now
+        poller["jobs"] += 1
+        self.stats["assigned"] += 1
+        return job
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatch_task is None or self._dispatch_task.done():
+            self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+
+    async def acquire(self, poller_id: str, timeout_seconds: float) -> list[tuple]:
+        """Wait up to `timeout_seconds` for jobs; returns as many (job_id, job) pairs as the poller has room for."""
+        self._bind_loop()
+        poller = self._pollers.get(poller_id) or self.register(poller_id)
+        poller["polling"] += 1
         try:
-            q.put_nowait(None)
-        except Exception:
+            deadline = time.monotonic() + max(0.0, float(timeout_seconds))
+            while self._free_slots(poller) <= 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                poller["slot_freed"].clear()
+                try:
+                    await asyncio.wait_for(poller["slot_freed"].wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    return []
+
+            self._ensure_dispatcher()
+            future = asyncio.get_running_loop().create_future()
+            waiter = (poller_id, future)
+            self._waiters.append(waiter)
+            self._waiter_added.set()
             try:
-                await q.put(None)
-            except Exception:
-                pass
+                await asyncio.wait({future}, timeout=max(0.0, deadline - time.monotonic()))
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self._requeue(future.result()[0], poller)
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            if not future.done() or future.cancelled():
+                future.cancel()
+                return []
+
+            claimed = [future.result()]
+            queue = _get_userscript_proxy_queue()
+            while self._free_slots(poller) > 0:
+                try:
+                    job_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                job = self._assign(poller_id, job_id)
+                if job is not None:
+                    claimed.append((str(job_id), job))
+            return claimed
+        finally:
+            poller["polling"] -= 1
+            poller["last_seen"] = time.monotonic()
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            await self._expire_pollers()
+            if not any(not future.done() for _, future in self._waiters):
+                self._waiter_added.clear()
+                try:
+                    await asyncio.wait_for(self._waiter_added.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            queue = _get_userscript_proxy_queue()
+            try:
+                job_id = await asyncio.wait_for(queue.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
+            candidates = [w for w in self._waiters if not w[1].done() and w[0] in self._pollers]
+            if not candidates:
+                queue.put_nowait(job_id)
+                continue
+            best = min(candidates, key=lambda w: self._score(self._pollers[w[0]]))
+            job = self._assign(best[0], job_id)
+            if job is None:
+                continue
+            self._waiters.remove(best)
+            best[1].set_result((str(job_id), job))
+
+    def _requeue(self, job_id: str, poller: Optional[dict] = None) -> None:
+        if poller is not None:
+            poller["in_flight"].pop(job_id, None)
+        job = _USERSCRIPT_PROXY_JOBS.get(job_id)
+        if not isinstance(job, dict) or job.get("done"):
+            return
+        job.pop("_poller_id", None)
+        job.pop("_poller_assigned_at_monotonic", None)
+        job["phase"] = "queued"
+        _schedule_userscript_proxy_job_expiry(job_id, job)
+        _get_userscript_proxy_queue().put_nowait(job_id)
+        self.stats["requeued"] += 1
+
+    def observe(self, job_id: str, job: dict, chunk: object) -> None:
+        """Record a push from the poller holding `job_id` (also serves as its heartbeat)."""
+        poller_id = job.get("_poller_id")
+        poller = self._pollers.get(poller_id) if poller_id else None
+        if poller is None:
+            return
+        now = time.monotonic()
+        poller["last_seen"] = now
+        assigned_at = float(job.get("_poller_assigned_at_monotonic") or now)
+        if not job.get("_poller_first_push_at_monotonic"):
+            job["_poller_first_push_at_monotonic"] = now
+            poller["pickup_ewma"] = self._ewma(poller["pickup_ewma"], now - assigned_at)
+        if isinstance(chunk, dict) and not job.get("_poller_fetch_started"):
+            if isinstance(chunk.get("status"), int) or chunk.get("upstream_fetch_started") or chunk.get("fetch_started"):
+                job["_poller_fetch_started"] = True
+                poller["fetch_ewma"] = self._ewma(poller["fetch_ewma"], now - assigned_at)
+        if job.get("done"):
+            self.release(job_id, job, error=bool(job.get("error")))
+
+    def release(self, job_id: str, job: dict, *, error: bool = False) -> None:
+        poller_id = job.get("_poller_id")
+        poller = self._pollers.get(poller_id) if poller_id else None
+        if poller is None or poller["in_flight"].pop(job_id, None) is None:
+            return
+        if error:
+            poller["errors"] += 1
+        poller["error_ewma"] = self._ewma(poller["error_ewma"], 1.0 if error else 0.0)
+        poller["slot_freed"].set()
+
+    async def drop(self, poller_id: str, reason: str) -> None:
+        poller = self._pollers.pop(poller_id, None)
+        if poller is None:
+            return
+        for _, future in [w for w in self._waiters if w[0] == poller_id]:
+            future.cancel()
+        for job_id in list(poller["in_flight"]):
+            job = _USERSCRIPT_PROXY_JOBS.get(job_id)
+            if not isinstance(job, dict) or job.get("done"):
+                continue
+            if job.get("_poller_first_push_at_monotonic"):
+                # Already streaming: re-running it elsewhere would duplicate output.
+                self.stats["failed_on_drop"] += 1
+                await _finalize_userscript_proxy_job(job_id, error=reason)
+            else:
+                self._requeue(job_id, poller)
+
+    async def _expire_pollers(self) -> None:
+        timeout = self._settings()["heartbeat_timeout_seconds"]
+        now = time.monotonic()
+        for poller_id, poller in list(self._pollers.items()):
+            if poller["polling"] > 0 or (now - poller["last_seen"]) <= timeout:
+                continue
+            debug_print(f"⚠️ Userscript proxy poller {poller_id} missed its heartbeat; dropping it.")
+            self.stats["pollers_expired"] += 1
+            await self.drop(poller_id, "userscript proxy poller missed heartbeat")
+
+    async def close(self) -> None:
+        task, self._dispatch_task = self._dispatch_task, None
+        await _cancel_background_task(task)
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        pollers = {}
+        for poller_id, poller in self._pollers.items():
+            pollers[poller_id] = {
+                "capacity": poller["capacity"],
+                "in_flight": len(poller["in_flight"]),
+                "jobs": poller["jobs"],
+                "errors": poller["errors"],
+                "pickup_latency_seconds": poller["pickup_ewma"],
+                "fetch_start_latency_seconds": poller["fetch_ewma"],
+                "error_rate": round(float(poller["error_ewma"]), 3),
+                "last_seen_seconds_ago": round(now - poller["last_seen"], 3),
+            }
+        return {**self.stats, "pollers": pollers}
 
-    if remove:
-        _USERSCRIPT_PROXY_JOBS.pop(jid, None)
+
+USERSCRIPT_PROXY_SCHEDULER = UserscriptProxyScheduler()
 
 
 class UserscriptProxyStreamResponse:
@@ -1767,6 +2685,7 @@ async def fetch_lmarena_stream_via_userscript_proxy(
         "error": None,
     }
     _USERSCRIPT_PROXY_JOBS[job_id] = job
+    _schedule_userscript_proxy_job_expiry(job_id, job, config)
     await _get_userscript_proxy_queue().put(job_id)
     return UserscriptProxyStreamResponse(job_id, timeout_seconds=timeout_seconds)
 
@@ -1829,8 +2748,6 @@ async def fetch_lmarena_stream_via_chrome(
     if auth_token:
         desired_cookies.extend(_arena_auth_cookie_specs(auth_token))
 
-    user_agent = normalize_user_agent_value(config.get("user_agent"))
-
     fetch_url = _normalize_userscript_proxy_url(url)
 
     def _is_recaptcha_validation_failed(status: int, text: object) -> bool:
@@ -1846,140 +2763,22 @@ async def fetch_lmarena_stream_via_chrome(
 
     max_recaptcha_attempts = max(1, min(int(max_recaptcha_attempts), 10))
 
-    profile_dir = Path(CONFIG_FILE).with_name("chrome_grecaptcha")
-    async with async_playwright() as p:
-        context = await p.chromium.launch_persistent_context(
-            user_data_dir=str(profile_dir),
-            executable_path=chrome_path,
-            headless=bool(headless),
-            user_agent=user_agent or None,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-first-run",
-                "--no-default-browser-check",
-            ],
-        )
-        try:
-            # Small stealth tweak: reduces bot-detection surface for reCAPTCHA v3 scoring.
-            try:
-                await context.add_init_script(
-                    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
-                )
-            except Exception:
-                pass
-
-            if desired_cookies:
-                try:
-                    existing_names: set[str] = set()
-                    try:
-                        existing = await _get_arena_context_cookies(context)
-                        for c in existing or []:
-                            name = c.get("name")
-                            if name:
-                                existing_names.add(str(name))
-                    except Exception:
-                        existing_names = set()
-
-                    cookies_to_add: list[dict] = []
-                    for c in desired_cookies:
-                        name = str(c.get("name") or "")
-                        if not name:
-                            continue
-                        # Always ensure the auth cookie matches the selected upstream token.
-                        if name == "arena-auth-prod-v1":
-                            cookies_to_add.append(c)
-                            continue
-
-                        # Do NOT overwrite/inject Cloudflare or reCAPTCHA cookies in the persistent profile.
-                        # The profile manages these itself; injecting stale ones from config causes 403s.
-                        if name in ("cf_clearance", "__cf_bm", "_GRECAPTCHA"):
-                            continue
-
-                        # Avoid overwriting existing Cloudflare/session cookies in the persistent profile.
-                        if name in existing_names:
-                            continue
-                        cookies_to_add.append(c)
-
-                    if cookies_to_add:
-                        await context.add_cookies(cookies_to_add)
-                except Exception:
-                    pass
-
-            page = await context.new_page()
-            await _maybe_apply_camoufox_window_mode(
-                page,
-                config,
-                mode_key="chrome_fetch_window_mode",
-                marker="LMArenaBridge Chrome Fetch",
-                headless=bool(headless),
-            )
-            await page.goto("https://lmarena.ai/?mode=direct", wait_until="domcontentloaded", timeout=120000)
-
-            # Best-effort: if we land on a Cloudflare challenge page, try clicking Turnstile before minting tokens.
-            try:
-                for i in range(10): # Up to 30 seconds
-                    title = await page.title()
-                    if "Just a moment" not in title:
-                        break
-                    debug_print(f"  ⏳ Waiting for Cloudflare challenge in Chrome... (attempt {i+1}/10)")
-                    await click_turnstile(page)
-                    await asyncio.sleep(3)
-                try:
-                    await page.wait_for_load_state("domcontentloaded", timeout=15000)
-                except Exception:
-                    pass
-            except Exception:
-                pass
-
-            # Light warm-up (often improves reCAPTCHA v3 score vs firing immediately).
-            try:
-                await page.mouse.move(100, 100)
-                await asyncio.sleep(0.5)
-                await page.mouse.wheel(0, 200)
-                await asyncio.sleep(1)
-                await page.mouse.move(200, 300)
-                await asyncio.sleep(0.5)
-                await page.mouse.wheel(0, 300)
-                await asyncio.sleep(2) # Reduced "Human" pause for faster response
-            except Exception:
-                pass
-
-            # Persist updated cookies/UA from this browser context (helps keep auth + cf cookies fresh).
-            try:
-                fresh_cookies = await _get_arena_context_cookies(context, page_url=str(getattr(page, "url", "") or ""))
-                _capture_ephemeral_arena_auth_token_from_cookies(fresh_cookies)
-                try:
-                    ua_now = await page.evaluate("() => navigator.userAgent")
-                except Exception:
-                    ua_now = user_agent
-                if _upsert_browser_session_into_config(config, fresh_cookies, user_agent=ua_now):
-                    save_config(config)
-            except Exception:
-                pass
+    auth_cookie = next(
+        (str(c.get("value") or "") for c in desired_cookies if c.get("name") == "arena-auth-prod-v1"),
+        "",
+    )
 
+    async with CHROME_FETCH_POOL.lease(
+        config,
+        chrome_path=chrome_path,
+        headless=bool(headless),
+        desired_cookies=desired_cookies,
+    ) as lease:
+        page = lease.page
+        sending = False
+        try:
             async def _mint_recaptcha_v3_token() -> Optional[str]:
-                await page.wait_for_function(
-                    "window.grecaptcha && ("
-                    "(window.grecaptcha.enterprise && typeof window.grecaptcha.enterprise.execute === 'function') || "
-                    "typeof window.grecaptcha.execute === 'function'"
-                    ")",
-                    timeout=60000,
-                )
-                token = await page.evaluate(
-                    """({sitekey, action}) => new Promise((resolve, reject) => {
-                      const g = (window.grecaptcha?.enterprise && typeof window.grecaptcha.enterprise.execute === 'function')
-                        ? window.grecaptcha.enterprise
-                        : window.grecaptcha;
-                      if (!g || typeof g.execute !== 'function') return reject('NO_GRECAPTCHA');
-                      try {
-                        g.execute(sitekey, { action }).then(resolve).catch((err) => reject(String(err)));
-                      } catch (e) { reject(String(e)); }
-                    })""",
-                    {"sitekey": recaptcha_sitekey, "action": recaptcha_action},
-                )
-                if isinstance(token, str) and token:
-                    return token
-                return None
+                return await _mint_recaptcha_v3_token_in_chrome_page(page, recaptcha_sitekey, recaptcha_action)
 
             async def _mint_recaptcha_v2_token() -> Optional[str]:
                 """
@@ -2030,15 +2829,10 @@ async def fetch_lmarena_stream_via_chrome(
 
             lines_queue: asyncio.Queue = asyncio.Queue()
             done_event: asyncio.Event = asyncio.Event()
+            # The page's `reportChunk` binding (installed once per pooled page) feeds this lease's queue.
+            lease.chunk_sink = lines_queue
 
-            # Buffer for splitlines handling in browser
-            async def _report_chunk(source, line: str):
-                if line and line.strip():
-                    await lines_queue.put(line)
-
-            await page.expose_binding("reportChunk", _report_chunk)
-
-            fetch_script = """async ({url, method, body, extraHeaders, timeoutMs}) => {
+            fetch_script = """async ({url, method, body, extraHeaders, timeoutMs, channel}) => {
               const controller = new AbortController();
               const timer = setTimeout(() => controller.abort('timeout'), timeoutMs);
               try {
@@ -2061,7 +2855,7 @@ async def fetch_lmarena_stream_via_chrome(
 
                 // Send initial status and headers
                 if (window.reportChunk) {
-                    await window.reportChunk(JSON.stringify({ __type: 'meta', status: res.status, headers }));
+                    await window.reportChunk(JSON.stringify({ __type: 'meta', status: res.status, headers }), channel);
                 }
 
                 if (res.body) {
@@ -2077,17 +2871,17 @@ async def fetch_lmarena_stream_via_chrome(
                     buffer = parts.pop() || '';
                     for (const line of parts) {
                         if (line.trim() && window.reportChunk) {
-                            await window.reportChunk(line);
+                            await window.reportChunk(line, channel);
                         }
                     }
                     if (done) break;
                   }
                   if (buffer.trim() && window.reportChunk) {
-                      await window.reportChunk(buffer);
+                      await window.reportChunk(buffer, channel);
                   }
                 } else {
                   const text = await res.text();
-                  if (window.reportChunk) await window.reportChunk(text);
+                  if (window.reportChunk) await window.reportChunk(text, channel);
                 }
                 return { __streaming: true };
               } catch (e) {
@@ -2110,7 +2904,11 @@ async def fetch_lmarena_stream_via_chrome(
                 has_v3 = isinstance(payload, dict) and bool(payload.get("recaptchaV3Token"))
                 
                 if isinstance(payload, dict) and not has_v2 and (attempt > 0 or not has_v3):
+                    mint_started_at = time.monotonic()
                     current_recaptcha_token = await _mint_recaptcha_v3_token()
+                    RECAPTCHA_SOURCE_STATS.record_mint(
+                        "in_page", current_recaptcha_token, (time.monotonic() - mint_started_at) * 1000.0
+                    )
                     if current_recaptcha_token:
                         payload["recaptchaV3Token"] = current_recaptcha_token
 
@@ -2124,6 +2922,10 @@ async def fetch_lmarena_stream_via_chrome(
 
                 body = json.dumps(payload) if payload is not None else ""
                 
+                # Tag this attempt's chunks so a cancelled earlier fetch still running in the page can't leak into it.
+                lease.chunk_channel = uuid.uuid4().hex
+                await CHROME_FETCH_POOL.begin_send(lease, desired_cookies, auth_cookie)
+                sending = True
                 # Start fetch task
                 fetch_task = asyncio.create_task(page.evaluate(
                     fetch_script,
@@ -2133,6 +2935,7 @@ async def fetch_lmarena_stream_via_chrome(
                         "body": body,
                         "extraHeaders": extra_headers,
                         "timeoutMs": int(timeout_seconds * 1000),
+                        "channel": lease.chunk_channel,
                     },
                 ))
 
@@ -2156,6 +2959,9 @@ async def fetch_lmarena_stream_via_chrome(
                                 break
                     except asyncio.TimeoutError:
                         continue
+                # Cookies are only read when the request is sent; another auth token may go next.
+                sending = False
+                await CHROME_FETCH_POOL.end_send()
                 
                 if fetch_task.done() and meta is None:
                     try:
@@ -2185,7 +2991,11 @@ async def fetch_lmarena_stream_via_chrome(
                     await asyncio.sleep(sleep_seconds)
                     continue
 
-                if not _is_recaptcha_validation_failed(status_code, result.get("text")):
+                recaptcha_rejected = _is_recaptcha_validation_failed(status_code, result.get("text"))
+                if token_for_headers and (recaptcha_rejected or status_code < 400):
+                    record_recaptcha_token_outcome(token_for_headers, not recaptcha_rejected)
+
+                if not recaptcha_rejected:
                     # Success or non-recaptcha error. 
                     # If success, start a task to wait for fetch_task to finish and set done_event.
                     if status_code < 400:
@@ -2211,9 +3021,12 @@ async def fetch_lmarena_stream_via_chrome(
                                 done_event.set()
                             except Exception:
                                 pass
+                            # The page stays leased until the in-page stream ends.
+                            CHROME_FETCH_POOL.release_soon(lease)
 
                         try:
                             fetch_task.add_done_callback(_on_fetch_task_done)
+                            lease.handed_off = True
                         except Exception:
                             pass
                         
@@ -2263,10 +3076,12 @@ async def fetch_lmarena_stream_via_chrome(
             )
             return response
         except Exception as e:
+            lease.healthy = False
             debug_print(f"??? Chrome fetch transport failed: {e}")
             return None
         finally:
-            await context.close()
+            if sending:
+                await CHROME_FETCH_POOL.end_send()
 
 
 async def fetch_lmarena_stream_via_camoufox(
@@ -2316,8 +3131,6 @@ async def fetch_lmarena_stream_via_camoufox(
     if auth_token:
         desired_cookies.extend(_arena_auth_cookie_specs(auth_token))
 
-    user_agent = normalize_user_agent_value(config.get("user_agent"))
-
     fetch_url = _normalize_userscript_proxy_url(url)
 
     def _is_recaptcha_validation_failed(status: int, text: object) -> bool:
@@ -2331,6 +3144,11 @@ async def fetch_lmarena_stream_via_camoufox(
             return False
         return isinstance(body, dict) and body.get("error") == "recaptcha validation failed"
 
+    auth_cookie = next(
+        (str(c.get("value") or "") for c in desired_cookies if c.get("name") == "arena-auth-prod-v1"),
+        "",
+    )
+
     try:
         # Default to headful for better Turnstile/reCAPTCHA reliability; allow override via config.
         try:
@@ -2339,62 +3157,14 @@ async def fetch_lmarena_stream_via_camoufox(
         except Exception:
             headless = False
 
-        async with AsyncCamoufox(headless=headless, main_world_eval=True) as browser:
-            context = await browser.new_context(user_agent=user_agent or None)
-            # Small stealth tweak: reduces bot-detection surface for reCAPTCHA v3 scoring.
-            try:
-                await context.add_init_script(
-                    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
-                )
-            except Exception:
-                pass
-            if desired_cookies:
-                try:
-                    await context.add_cookies(desired_cookies)
-                except Exception:
-                    pass
-
-            page = await context.new_page()
-            await _maybe_apply_camoufox_window_mode(
-                page,
-                config,
-                mode_key="camoufox_fetch_window_mode",
-                marker="LMArenaBridge Camoufox Fetch",
-                headless=headless,
-            )
-              
-            debug_print(f"  🦊 Navigating to lmarena.ai...")
-            try:
-                await asyncio.wait_for(
-                    page.goto("https://lmarena.ai/?mode=direct", wait_until="domcontentloaded", timeout=60000),
-                    timeout=70.0,
-                )
-            except Exception:
-                pass
-
-            # Try to handle Cloudflare Turnstile if present
-            try:
-                for _ in range(5):
-                    title = await page.title()
-                    if "Just a moment" not in title:
-                        break
-                    await click_turnstile(page)
-                    await asyncio.sleep(2)
-            except Exception:
-                pass
-            
-            # Persist cookies
-            try:
-                fresh_cookies = await _get_arena_context_cookies(context, page_url=str(getattr(page, "url", "") or ""))
-                _capture_ephemeral_arena_auth_token_from_cookies(fresh_cookies)
-                try:
-                    ua_now = await page.evaluate("() => navigator.userAgent")
-                except Exception:
-                    ua_now = user_agent
-                if _upsert_browser_session_into_config(config, fresh_cookies, user_agent=ua_now):
-                    save_config(config)
-            except Exception:
-                pass
+        # Pages come warm from the pool (navigated, past Turnstile, cookies persisted); a streamed response keeps
+        # its page leased until the in-page fetch finishes instead of closing the browser under it.
+        async with CAMOUFOX_FETCH_POOL.lease(
+            config,
+            headless=headless,
+            desired_cookies=desired_cookies,
+        ) as lease:
+            page = lease.page
 
             async def _mint_recaptcha_v3_token() -> Optional[str]:
                 # Wait for grecaptcha using wrappedJSObject
@@ -2504,14 +3274,10 @@ async def fetch_lmarena_stream_via_camoufox(
 
             lines_queue: asyncio.Queue = asyncio.Queue()
             done_event: asyncio.Event = asyncio.Event()
+            # The page's `reportChunk` binding (installed once per pooled page) feeds this lease's queue.
+            lease.chunk_sink = lines_queue
 
-            async def _report_chunk(source, line: str):
-                if line and line.strip():
-                    await lines_queue.put(line)
-
-            await page.expose_binding("reportChunk", _report_chunk)
-
-            fetch_script = """async ({url, method, body, extraHeaders, timeoutMs}) => {
+            fetch_script = """async ({url, method, body, extraHeaders, timeoutMs, channel}) => {
               const controller = new AbortController();
               const timer = setTimeout(() => controller.abort('timeout'), timeoutMs);
               try {
@@ -2534,7 +3300,7 @@ async def fetch_lmarena_stream_via_camoufox(
 
                 // Send initial status and headers
                 if (window.reportChunk) {
-                    await window.reportChunk(JSON.stringify({ __type: 'meta', status: res.status, headers }));
+                    await window.reportChunk(JSON.stringify({ __type: 'meta', status: res.status, headers }), channel);
                 }
 
                 if (res.body) {
@@ -2550,17 +3316,17 @@ async def fetch_lmarena_stream_via_camoufox(
                     buffer = parts.pop() || '';
                     for (const line of parts) {
                         if (line.trim() && window.reportChunk) {
-                            await window.reportChunk(line);
+                            await window.reportChunk(line, channel);
                         }
                     }
                     if (done) break;
                   }
                   if (buffer.trim() && window.reportChunk) {
-                      await window.reportChunk(buffer);
+                      await window.reportChunk(buffer, channel);
                   }
                 } else {
                   const text = await res.text();
-                  if (window.reportChunk) await window.reportChunk(text);
+                  if (window.reportChunk) await window.reportChunk(text, channel);
                 }
                 return { __streaming: true };
               } catch (e) {
@@ -2582,12 +3348,16 @@ async def fetch_lmarena_stream_via_camoufox(
                 has_v3 = isinstance(payload, dict) and bool(payload.get("recaptchaV3Token"))
                 
                 if isinstance(payload, dict) and not has_v2 and (attempt > 0 or not has_v3):
+                    mint_started_at = time.monotonic()
                     try:
                         current_recaptcha_token = await _mint_recaptcha_v3_token()
                         if current_recaptcha_token:
                             payload["recaptchaV3Token"] = current_recaptcha_token
                     except Exception as e:
                         debug_print(f"  ⚠️ Error minting token in Camoufox: {e}")
+                    RECAPTCHA_SOURCE_STATS.record_mint(
+                        "in_page", current_recaptcha_token, (time.monotonic() - mint_started_at) * 1000.0
+                    )
 
                 extra_headers = {}
                 token_for_headers = current_recaptcha_token
@@ -2598,35 +3368,43 @@ async def fetch_lmarena_stream_via_camoufox(
                     extra_headers["X-Recaptcha-Action"] = recaptcha_action
 
                 body = json.dumps(payload) if payload is not None else ""
-                
-                # Execute fetch
-                fetch_task = asyncio.create_task(page.evaluate(
-                    fetch_script,
-                    {
-                        "url": fetch_url,
-                        "method": http_method,
-                        "body": body,
-                        "extraHeaders": extra_headers,
-                        "timeoutMs": int(timeout_seconds * 1000),
-                    },
-                ))
 
-                # Wait for initial meta (status/headers) OR task completion
-                meta = None
-                while not fetch_task.done():
-                    try:
-                        item = await asyncio.wait_for(lines_queue.get(), timeout=0.1)
-                        if isinstance(item, str) and item.startswith('{"__type":"meta"'):
-                            meta = json.loads(item)
-                            break
-                        else:
-                            if not item.startswith('{"__type":"meta"'):
-                                await lines_queue.put(item)
-                                meta = {"status": 200, "headers": {}}
+                # Tag this attempt's chunks so a cancelled earlier fetch still running in the page can't leak into it.
+                lease.chunk_channel = uuid.uuid4().hex
+                await CAMOUFOX_FETCH_POOL.begin_send(lease, desired_cookies, auth_cookie)
+                try:
+                    # Execute fetch
+                    fetch_task = asyncio.create_task(page.evaluate(
+                        fetch_script,
+                        {
+                            "url": fetch_url,
+                            "method": http_method,
+                            "body": body,
+                            "extraHeaders": extra_headers,
+                            "timeoutMs": int(timeout_seconds * 1000),
+                            "channel": lease.chunk_channel,
+                        },
+                    ))
+
+                    # Wait for initial meta (status/headers) OR task completion
+                    meta = None
+                    while not fetch_task.done():
+                        try:
+                            item = await asyncio.wait_for(lines_queue.get(), timeout=0.1)
+                            if isinstance(item, str) and item.startswith('{"__type":"meta"'):
+                                meta = json.loads(item)
                                 break
-                    except asyncio.TimeoutError:
-                        continue
-                
+                            else:
+                                if not item.startswith('{"__type":"meta"'):
+                                    await lines_queue.put(item)
+                                    meta = {"status": 200, "headers": {}}
+                                    break
+                        except asyncio.TimeoutError:
+                            continue
+                finally:
+                    # Cookies are only read when the request is sent; another auth token may go next.
+                    await CAMOUFOX_FETCH_POOL.end_send()
+
                 if fetch_task.done() and meta is None:
                     try:
                         res = fetch_task.result()
@@ -2646,17 +3424,35 @@ async def fetch_lmarena_stream_via_camoufox(
                     await asyncio.sleep(5)
                     continue
 
-                if not _is_recaptcha_validation_failed(status_code, result.get("text")):
+                recaptcha_rejected = _is_recaptcha_validation_failed(status_code, result.get("text"))
+                if token_for_headers and (recaptcha_rejected or status_code < 400):
+                    record_recaptcha_token_outcome(token_for_headers, not recaptcha_rejected)
+
+                if not recaptcha_rejected:
                     if status_code < 400:
+                        # Buffered body (the in-page script didn't stream through `reportChunk`).
+                        candidate_body = result.get("text") if isinstance(result, dict) else None
+                        if isinstance(candidate_body, str) and candidate_body:
+                            return BrowserFetchStreamResponse(
+                                status_code=status_code,
+                                headers=result.get("headers", {}) if isinstance(result, dict) else {},
+                                text=candidate_body,
+                                method=http_method,
+                                url=url,
+                            )
+
                         def _on_fetch_task_done(task: "asyncio.Task") -> None:
                             _consume_background_task_exception(task)
                             try:
                                 done_event.set()
                             except Exception:
                                 pass
+                            # The page stays leased until the in-page stream ends.
+                            CAMOUFOX_FETCH_POOL.release_soon(lease)
 
                         try:
                             fetch_task.add_done_callback(_on_fetch_task_done)
+                            lease.handed_off = True
                         except Exception:
                             pass
                         
@@ -2817,7 +3613,153 @@ async def fetch_via_proxy_queue(
         debug_print(f"❌ Proxy Task Exception: {e}")
         return None
 
-    return None
+    return None
+
+class RecaptchaSourceStats:
+    """Per-source reCAPTCHA mint latency and downstream acceptance (EWMA)."""
+
+    def __init__(self) -> None:
+        self.mint_latency_ms: Optional[float] = None
+        self.acceptance_rate = 1.0
+        self.observed_at = time.monotonic()
+        self.counts: Dict[str, int] = defaultdict(int)
+
+    @property
+    def samples(self) -> int:
+        return self.counts["accepted"] + self.counts["rejected"] + self.counts["mint_failed"]
+
+    def current_acceptance_rate(self, half_life_seconds: float, now: Optional[float] = None) -> float:
+        """Acceptance rate with the shortfall halved every `half_life_seconds` without new observations."""
+        if half_life_seconds <= 0:
+            return self.acceptance_rate
+        elapsed = max(0.0, (time.monotonic() if now is None else now) - self.observed_at)
+        return 1.0 - (1.0 - self.acceptance_rate) * (0.5 ** (elapsed / half_life_seconds))
+
+
+class RecaptchaSourceTelemetry:
+    """
+    Tracks where reCAPTCHA v3 tokens come from and how they fare upstream.
+
+    Sources: "chrome" and "camoufox" (side-channel mints), "in_page" (minted inside a browser fetch transport) and
+    "userscript" (minted by the proxy worker's own fetch script, so only its outcome is visible). Tokens are tagged
+    at mint time so a later "recaptcha validation failed" can be attributed to the source that produced it.
+    """
+
+    ALPHA = 0.2
+    MAX_TAGGED_TOKENS = 256
+    # A disqualified source only gets fallback traffic, so it would never produce the samples needed to requalify.
+    # Let its acceptance rate drift back towards 1.0 while it sits idle so it is periodically retried.
+    RECOVERY_HALF_LIFE_SECONDS = 300.0
+
+    def __init__(self) -> None:
+        self.sources: Dict[str, RecaptchaSourceStats] = {}
+        self._token_sources: Dict[str, str] = {}
+
+    def _stats(self, source: str) -> RecaptchaSourceStats:
+        stats = self.sources.get(source)
+        if stats is None:
+            stats = RecaptchaSourceStats()
+            self.sources[source] = stats
+        return stats
+
+    def _observe(self, stats: RecaptchaSourceStats, outcome: str) -> None:
+        now = time.monotonic()
+        stats.counts[outcome] += 1
+        target = 1.0 if outcome == "accepted" else 0.0
+        rate = stats.current_acceptance_rate(self.RECOVERY_HALF_LIFE_SECONDS, now)
+        stats.acceptance_rate = rate + self.ALPHA * (target - rate)
+        stats.observed_at = now
+
+    def record_mint(self, source: str, token: Optional[str], latency_ms: float) -> None:
+        stats = self._stats(source)
+        if not token:
+            self._observe(stats, "mint_failed")
+            return
+        stats.counts["minted"] += 1
+        if stats.mint_latency_ms is None:
+            stats.mint_latency_ms = float(latency_ms)
+        else:
+            stats.mint_latency_ms += self.ALPHA * (float(latency_ms) - stats.mint_latency_ms)
+        self._token_sources.pop(token, None)
+        self._token_sources[token] = source
+        while len(self._token_sources) > self.MAX_TAGGED_TOKENS:
+            self._token_sources.pop(next(iter(self._token_sources)))
+
+    def source_of(self, token: Optional[str]) -> Optional[str]:
+        return self._token_sources.get(str(token or "")) if token else None
+
+    def record_outcome(self, accepted: bool, *, token: Optional[str] = None, source: Optional[str] = None) -> Optional[str]:
+        """Attribute an upstream accept/reject to the token's source (or `source` when the token isn't visible)."""
+        if token:
+            source = self._token_sources.pop(str(token), None) or source
+        if not source:
+            return None
+        self._observe(self._stats(source), "accepted" if accepted else "rejected")
+        return source
+
+    def qualifies(self, source: str, config: Optional[dict] = None) -> bool:
+        """Sources with too few samples get the benefit of the doubt."""
+        config = config if config is not None else _get_config_snapshot()
+        stats = self.sources.get(source)
+        if stats is None:
+            return True
+        min_samples = _coerce_positive_int(config.get("recaptcha_source_min_samples"), 5)
+        if stats.samples < min_samples:
+            return True
+        try:
+            threshold = float(config.get("recaptcha_source_min_success_rate", 0.5))
+        except (TypeError, ValueError):
+            threshold = 0.5
+        return stats.current_acceptance_rate(self.RECOVERY_HALF_LIFE_SECONDS) >= threshold
+
+    def prefer_token_over(self, token: Optional[str], alternative: str, config: Optional[dict] = None) -> bool:
+        """True when `token` comes from a healthy source and minting via `alternative` doesn't meet the threshold."""
+        source = self.source_of(token)
+        if source is None:
+            return False
+        return self.qualifies(source, config) and not self.qualifies(alternative, config)
+
+    def rank(self, candidates: list[str], config: Optional[dict] = None) -> list[str]:
+        """
+        Order `candidates` fastest-first among sources meeting the success threshold, then the rest.
+
+        Untried sources sort ahead of measured ones (so each gets explored); ties keep the caller's order.
+        """
+        config = config if config is not None else _get_config_snapshot()
+
+        def _key(source: str) -> tuple:
+            stats = self.sources.get(source)
+            latency = stats.mint_latency_ms if stats is not None and stats.mint_latency_ms is not None else 0.0
+            return (not self.qualifies(source, config), latency)
+
+        return sorted(candidates, key=_key)
+
+    def snapshot(self) -> dict:
+        return {
+            source: {
+                "mint_latency_ms": int(stats.mint_latency_ms) if stats.mint_latency_ms is not None else None,
+                "acceptance_rate": round(stats.current_acceptance_rate(self.RECOVERY_HALF_LIFE_SECONDS), 3),
+                **stats.counts,
+            }
+            for source, stats in self.sources.items()
+        }
+
+
+RECAPTCHA_SOURCE_STATS = RecaptchaSourceTelemetry()
+
+
+def record_recaptcha_token_outcome(token: Optional[str], accepted: bool, *, source: Optional[str] = None) -> None:
+    """Record whether upstream accepted a reCAPTCHA token; see `RecaptchaSourceTelemetry`."""
+    try:
+        attributed = RECAPTCHA_SOURCE_STATS.record_outcome(accepted, token=token, source=source)
+    except Exception:
+        return
+    if attributed == "camoufox":
+        if accepted:
+            RECAPTCHA_MINTING_SESSION.note_acceptance()
+        else:
+            RECAPTCHA_MINTING_SESSION.note_rejection()
+
 
 async def get_recaptcha_v3_token() -> Optional[str]:
     """
@@ -2826,146 +3768,519 @@ async def get_recaptcha_v3_token() -> Optional[str]:
     bypassing Promise serialization issues in the Main World bridge.
     """
     global RECAPTCHA_TOKEN, RECAPTCHA_EXPIRY
-    debug_print("🔐 Starting reCAPTCHA v3 token retrieval (Side-Channel Mode)...")
-    
-    config = get_config()
-    cf_clearance = config.get("cf_clearance", "")
-    recaptcha_sitekey, recaptcha_action = get_recaptcha_settings(config)
-    
-    try:
-        chrome_token = await get_recaptcha_v3_token_with_chrome(config)
-        if chrome_token:
-            RECAPTCHA_TOKEN = chrome_token
-            RECAPTCHA_EXPIRY = datetime.now(timezone.utc) + timedelta(seconds=110)
-            return chrome_token
+    token, _ = await mint_recaptcha_v3_token_side_channel()
+    if token:
+        RECAPTCHA_TOKEN = token
+        RECAPTCHA_EXPIRY = datetime.now(timezone.utc) + timedelta(seconds=RECAPTCHA_TOKEN_LIFETIME_SECONDS)
+    return token
 
-        # Use isolated world (main_world_eval=False) to avoid execution context destruction issues.
-        # We will access the main world objects via window.wrappedJSObject.
-        async with AsyncCamoufox(headless=True, main_world_eval=False) as browser:
-            context = await browser.new_context()
-            if cf_clearance:
-                await context.add_cookies([{
-                    "name": "cf_clearance",
-                    "value": cf_clearance,
-                    "domain": ".lmarena.ai",
-                    "path": "/"
-                }])
-
-            page = await context.new_page()
-            
-            debug_print("  🌐 Navigating to lmarena.ai...")
-            await page.goto("https://lmarena.ai/", wait_until="domcontentloaded")
 
-            # --- NEW: Cloudflare/Turnstile Pass-Through ---
-            debug_print("  🛡️  Checking for Cloudflare Turnstile...")
-            
-            # Allow time for the widget to render if it's going to
+class RecaptchaMintingSession:
+    """
+    Long-lived headless Camoufox page on lmarena.ai with grecaptcha loaded, used for side-channel v3 mints.
+
+    The expensive part (launch, navigation, Turnstile, library load) happens once; each mint is a single
+    `grecaptcha.enterprise.execute` call. The session recycles itself after errors, after too many downstream
+    "recaptcha validation failed" rejections (a sign the session's score degraded), or when it gets old.
+    """
+
+    MAX_CONSECUTIVE_REJECTIONS = 3
+
+    def __init__(self) -> None:
+        self._camoufox = None
+        self._browser = None
+        self._page = None
+        self._cf_clearance = ""
+        self._lock = asyncio.Lock()
+        # Bumped on every successful launch so a failing mint only recycles the session it actually ran on.
+        self.generation = 0
+        self.started_at = 0.0
+        self.mints = 0
+        self.rejections = 0
+        self.stats: Dict[str, int] = {"launches": 0, "recycles": 0, "mints": 0, "errors": 0}
+
+    @property
+    def ready(self) -> bool:
+        return self._page is not None
+
+    async def close(self) -> None:
+        camoufox = self._camoufox
+        self._camoufox = None
+        self._browser = None
+        self._page = None
+        if camoufox is not None:
             try:
-                # Check for challenge title or widget presence
-                for _ in range(5):
-                    title = await page.title()
-                    if "Just a moment" in title:
-                        debug_print("  🔒 Cloudflare challenge active. Attempting to click...")
-                        clicked = await click_turnstile(page)
-                        if clicked:
-                            debug_print("  ✅ Clicked Turnstile.")
-                            # Give it time to verify
-                            await asyncio.sleep(3)
-                    else:
-                        # If title is normal, we might still have a widget on the page
-                        await click_turnstile(page)
-                        break
-                    await asyncio.sleep(1)
-                
-                # Wait for the page to actually settle into the main app
-                await page.wait_for_load_state("domcontentloaded")
+                await camoufox.__aexit__(None, None, None)
             except Exception as e:
-                debug_print(f"  ⚠️ Error handling Turnstile: {e}")
-            # ----------------------------------------------
-
-            # 1. Wake up the page (Humanize)
-            debug_print("  🖱️  Waking up page...")
-            await page.mouse.move(100, 100)
-            await page.mouse.wheel(0, 200)
-            await asyncio.sleep(2) # Vital "Human" pause
-
-            # 2. Check for Library
-            debug_print("  ⏳ Checking for library...")
-            # Use wrappedJSObject to check for grecaptcha in the main world
+                debug_print(f"  ⚠️ Error closing reCAPTCHA minting browser: {e}")
+
+    async def recycle(self, reason: str) -> None:
+        debug_print(f"♻️ Recycling reCAPTCHA minting session ({reason})")
+        self.stats["recycles"] += 1
+        await self.close()
+
+    def note_rejection(self) -> None:
+        """Called when upstream rejected a token with "recaptcha validation failed"."""
+        self.rejections += 1
+
+    def note_acceptance(self) -> None:
+        self.rejections = 0
+
+    def _should_recycle(self, config: dict) -> Optional[str]:
+        if not self.ready:
+            return None
+        if self.rejections >= self.MAX_CONSECUTIVE_REJECTIONS:
+            return "score degraded"
+        try:
+            max_age = float(config.get("recaptcha_session_max_age_seconds", 1800))
+        except Exception:
+            max_age = 1800.0
+        if max_age > 0 and (time.monotonic() - self.started_at) > max_age:
+            return "max age"
+        try:
+            max_mints = int(config.get("recaptcha_session_max_mints", 200))
+        except Exception:
+            max_mints = 200
+        if max_mints > 0 and self.mints >= max_mints:
+            return "max mints"
+        cf_clearance = str(config.get("cf_clearance", "") or "")
+        if cf_clearance and cf_clearance != self._cf_clearance:
+            return "cf_clearance changed"
+        return None
+
+    async def _launch(self, config: dict) -> bool:
+        cf_clearance = str(config.get("cf_clearance", "") or "")
+        self.stats["launches"] += 1
+        # Use isolated world (main_world_eval=False) to avoid execution context destruction issues.
+        # We will access the main world objects via window.wrappedJSObject.
+        camoufox = AsyncCamoufox(headless=True, main_world_eval=False)
+        browser = await camoufox.__aenter__()
+        self._camoufox = camoufox
+        self._browser = browser
+        context = await browser.new_context()
+        await _install_resource_blocking(context, config)
+        if cf_clearance:
+            await context.add_cookies([{
+                "name": "cf_clearance",
+                "value": cf_clearance,
+                "domain": ".lmarena.ai",
+                "path": "/"
+            }])
+
+        page = await context.new_page()
+
+        debug_print("  🌐 Navigating to lmarena.ai...")
+        await page.goto("https://lmarena.ai/", wait_until="domcontentloaded")
+
+        # --- Cloudflare/Turnstile Pass-Through ---
+        debug_print("  🛡️  Checking for Cloudflare Turnstile...")
+        try:
+            for _ in range(5):
+                title = await page.title()
+                if "Just a moment" in title:
+                    debug_print("  🔒 Cloudflare challenge active. Attempting to click...")
+                    clicked = await click_turnstile(page)
+                    if clicked:
+                        debug_print("  ✅ Clicked Turnstile.")
+                        await asyncio.sleep(3)
+                else:
+                    # If title is normal, we might still have a widget on the page
+                    await click_turnstile(page)
+                    break
+                await asyncio.sleep(1)
+
+            # Wait for the page to actually settle into the main app
+            await page.wait_for_load_state("domcontentloaded")
+        except Exception as e:
+            debug_print(f"  ⚠️ Error handling Turnstile: {e}")
+
+        # Wake up the page (Humanize) once per session rather than per token.
+        debug_print("  🖱️  Waking up page...")
+        await page.mouse.move(100, 100)
+        await page.mouse.wheel(0, 200)
+        await asyncio.sleep(2) # Vital "Human" pause
+
+        debug_print("  ⏳ Checking for library...")
+        for _ in range(10):
             lib_ready = await safe_page_evaluate(
                 page,
                 "() => { const w = window.wrappedJSObject || window; return !!(w.grecaptcha && w.grecaptcha.enterprise); }",
             )
-            if not lib_ready:
-                debug_print("  ⚠️ Library not found immediately. Waiting...")
-                await asyncio.sleep(3)
-                lib_ready = await safe_page_evaluate(
-                    page,
-                    "() => { const w = window.wrappedJSObject || window; return !!(w.grecaptcha && w.grecaptcha.enterprise); }",
-                )
-                if not lib_ready:
-                    debug_print("❌ reCAPTCHA library never loaded.")
+            if lib_ready:
+                self._page = page
+                self.generation += 1
+                self._cf_clearance = cf_clearance
+                self.started_at = time.monotonic()
+                self.mints = 0
+                self.rejections = 0
+                return True
+            await asyncio.sleep(0.5)
+        debug_print("❌ reCAPTCHA library never loaded.")
+        return False
+
+    async def _execute(self, page, sitekey: str, action: str, timeout_seconds: float) -> Optional[str]:
+        slot = f"__lmb_token_{uuid.uuid4().hex}"
+        # Write the result to a window variable and poll it, bypassing Promise serialization issues in the
+        # isolated world.
+        trigger_script = f"""() => {{
+            const w = window.wrappedJSObject || window;
+            w['{slot}'] = 'PENDING';
+            try {{
+                w.grecaptcha.enterprise.execute('{sitekey}', {{ action: '{action}' }})
+                .then(token => {{ w['{slot}'] = token; }})
+                .catch(err => {{ w['{slot}'] = 'ERROR: ' + err.toString(); }});
+            }} catch (e) {{
+                w['{slot}'] = 'SYNC_ERROR: ' + e.toString();
+            }}
+        }}"""
+        await safe_page_evaluate(page, trigger_script)
+
+        read_script = f"""() => {{
+            const w = window.wrappedJSObject || window;
+            const v = w['{slot}'];
+            if (v !== 'PENDING') {{ try {{ delete w['{slot}']; }} catch (e) {{}} }}
+            return v;
+        }}"""
+        deadline = time.monotonic() + timeout_seconds
+        while time.monotonic() < deadline:
+            result = await safe_page_evaluate(page, read_script, retries=2)
+            if result != "PENDING":
+                if not result or str(result).startswith(("ERROR", "SYNC_ERROR")):
+                    raise RuntimeError(f"grecaptcha execute failed: {result}")
+                return str(result)
+            await asyncio.sleep(0.1)
+        raise TimeoutError("Timed out waiting for grecaptcha execute")
+
+    async def mint(self, config: dict, *, timeout_seconds: float = 20.0) -> Optional[str]:
+        recaptcha_sitekey, recaptcha_action = get_recaptcha_settings(config)
+        async with self._lock:
+            reason = self._should_recycle(config)
+            if reason:
+                await self.recycle(reason)
+            if not self.ready:
+                try:
+                    if not await self._launch(config):
+                        await self.close()
+                        self.stats["errors"] += 1
+                        return None
+                except Exception as e:
+                    debug_print(f"❌ Failed to start reCAPTCHA minting session: {e}")
+                    await self.close()
+                    self.stats["errors"] += 1
                     return None
+            page = self._page
+            generation = self.generation
 
-            # 3. SETUP: Initialize our global result variable
-            # We use a unique name to avoid conflicts
-            await safe_page_evaluate(page, "() => { (window.wrappedJSObject || window).__token_result = 'PENDING'; }")
-
-            # 4. TRIGGER: Execute reCAPTCHA and write to the variable
-            # We do NOT await the result here. We just fire the process.
-            debug_print("  🚀 Triggering reCAPTCHA execution...")
-            trigger_script = f"""() => {{
-                const w = window.wrappedJSObject || window;
-                try {{
-                    w.grecaptcha.enterprise.execute('{recaptcha_sitekey}', {{ action: '{recaptcha_action}' }})
-                    .then(token => {{
-                        w.__token_result = token;
-                    }})
-                    .catch(err => {{
-                        w.__token_result = 'ERROR: ' + err.toString();
-                    }});
-                }} catch (e) {{
-                    w.__token_result = 'SYNC_ERROR: ' + e.toString();
-                }}
-            }}"""
-            
-            await safe_page_evaluate(page, trigger_script)
+        try:
+            token = await self._execute(page, recaptcha_sitekey, recaptcha_action, timeout_seconds)
+        except Exception as e:
+            debug_print(f"❌ reCAPTCHA mint failed in warm session: {e}")
+            self.stats["errors"] += 1
+            async with self._lock:
+                # Executes run concurrently: if another caller already recycled (and maybe relaunched) the
+                # session, this failure belongs to the old page and must not tear down the new one.
+                if self.ready and self.generation == generation:
+                    await self.recycle("mint error")
+            return None
+        self.mints += 1
+        self.stats["mints"] += 1
+        debug_print(f"✅ Token captured! ({len(token)} chars)")
+        return token
+
+    def snapshot(self) -> dict:
+        return {
+            "ready": self.ready,
+            "age_seconds": int(time.monotonic() - self.started_at) if self.ready else 0,
+            "session_mints": self.mints,
+            "recent_rejections": self.rejections,
+            **self.stats,
+        }
+
+
+RECAPTCHA_MINTING_SESSION = RecaptchaMintingSession()
 
-            # 5. POLL: Watch the variable for changes
-            debug_print("  👀 Polling for result...")
+
+async def mint_recaptcha_v3_token_side_channel() -> tuple[Optional[str], str]:
+    """Mint one reCAPTCHA v3 token without touching the shared cache. Returns (token, source)."""
+    debug_print("🔐 Starting reCAPTCHA v3 token retrieval (Side-Channel Mode)...")
+    
+    config = get_config()
+    
+    minters = {
+        "chrome": get_recaptcha_v3_token_with_chrome,
+        "camoufox": RECAPTCHA_MINTING_SESSION.mint,
+    }
+    # Chrome first unless telemetry says Camoufox is faster or Chrome's tokens keep failing validation.
+    order = RECAPTCHA_SOURCE_STATS.rank(list(minters), config)
+    for source in order:
+        started_at = time.monotonic()
+        try:
+            token = await minters[source](config)
+        except Exception as e:
+            debug_print(f"❌ Unexpected error: {e}")
             token = None
-            
-            for i in range(20): # Wait up to 20 seconds
-                # Read the global variable
-                result = await safe_page_evaluate(page, "() => (window.wrappedJSObject || window).__token_result", retries=2)
-                
-                if result != 'PENDING':
-                    if result and result.startswith('ERROR'):
-                        debug_print(f"❌ JS Execution Error: {result}")
-                        return None
-                    elif result and result.startswith('SYNC_ERROR'):
-                        debug_print(f"❌ JS Sync Error: {result}")
-                        return None
-                    else:
-                        token = result
-                        debug_print(f"✅ Token captured! ({len(token)} chars)")
-                        break
-                
-                if i % 2 == 0:
-                    debug_print(f"    ... waiting ({i}s)")
-                await asyncio.sleep(1)
+        RECAPTCHA_SOURCE_STATS.record_mint(source, token, (time.monotonic() - started_at) * 1000.0)
+        if token:
+            return token, source
+    return None, order[-1]
 
-            if token:
-                RECAPTCHA_TOKEN = token
-                RECAPTCHA_EXPIRY = datetime.now(timezone.utc) + timedelta(seconds=110)
-                return token
+
+class RecaptchaTokenPool:
+    """
+    Pre-minted reCAPTCHA v3 tokens, each handed out at most once.
+
+    Demand is measured from `take()` calls so the background minter can size the pool to the observed request
+    rate (bounded by `recaptcha_pool_min_size` / `recaptcha_pool_max_size`).
+    """
+
+    # Don't hand out tokens that would expire before the upstream request lands.
+    USABLE_MARGIN_SECONDS = 10.0
+    # Demand is averaged over this window.
+    DEMAND_WINDOW_SECONDS = 120.0
+
+    def __init__(self) -> None:
+        # (token, minted_at monotonic, source)
+        self._tokens: deque = deque()
+        self._demand: deque = deque()
+        self.wakeup = asyncio.Event()
+        self.stats: Dict[str, int] = {"minted": 0, "served": 0, "misses": 0, "expired": 0}
+
+    def _drop_expired(self, now: float) -> None:
+        cutoff = now - (float(RECAPTCHA_TOKEN_LIFETIME_SECONDS) - self.USABLE_MARGIN_SECONDS)
+        while self._tokens and self._tokens[0][1] <= cutoff:
+            self._tokens.popleft()
+            self.stats["expired"] += 1
+
+    def size(self) -> int:
+        self._drop_expired(time.monotonic())
+        return len(self._tokens)
+
+    def put(self, token: str, source: str = "", *, minted_at: Optional[float] = None) -> None:
+        token = str(token or "").strip()
+        if not token:
+            return
+        self._tokens.append((token, time.monotonic() if minted_at is None else float(minted_at), str(source or "")))
+        self.stats["minted"] += 1
+
+    def take(self) -> Optional[tuple[str, str, float]]:
+        """
+        Pop the oldest still-usable token as (token, source, minted_at monotonic), or None.
+
+        Counts as one unit of demand.
+        """
+        now = time.monotonic()
+        self._demand.append(now)
+        self._drop_expired(now)
+        self.wakeup.set()
+        if not self._tokens:
+            self.stats["misses"] += 1
+            return None
+        token, minted_at, source = self._tokens.popleft()
+        self.stats["served"] += 1
+        return token, source, minted_at
+
+    def demand_per_second(self) -> float:
+        now = time.monotonic()
+        cutoff = now - self.DEMAND_WINDOW_SECONDS
+        while self._demand and self._demand[0] < cutoff:
+            self._demand.popleft()
+        return len(self._demand) / self.DEMAND_WINDOW_SECONDS
+
+    def target_size(self, *, min_size: int, max_size: int, refill_horizon_seconds: float) -> int:
+        """Tokens needed to cover the demand expected while a replacement is being minted."""
+        expected = int(math.ceil(self.demand_per_second() * max(1.0, refill_horizon_seconds)))
+        return max(int(min_size), min(int(max_size), expected))
+
+    def snapshot(self) -> dict:
+        return {"ready": self.size(), "demand_per_min": round(self.demand_per_second() * 60.0, 2), **self.stats}
+
+
+RECAPTCHA_TOKEN_POOL = RecaptchaTokenPool()
+
+
+class RecaptchaMintCoordinator:
+    """
+    Single-flight front for reCAPTCHA mints.
+
+    Concurrent callers share at most `recaptcha_max_parallel_mints` browser mint jobs. Each minted token goes to
+    exactly one waiter (tokens are single-use); leftovers go to `RECAPTCHA_TOKEN_POOL`. When every waiter has gone
+    away, jobs started for them are cancelled unless the pool still needs tokens.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: deque = deque()
+        # task -> True when the job was started to refill the pool rather than for waiters.
+        self._jobs: dict = {}
+        self.stats: Dict[str, int] = {"requests": 0, "coalesced": 0, "jobs": 0, "cancelled_jobs": 0, "failures": 0}
+
+    @staticmethod
+    def _max_parallel() -> int:
+        try:
+            value = int(_get_config_snapshot().get("recaptcha_max_parallel_mints", 2))
+        except Exception:
+            value = 2
+        return max(1, min(value, 8))
+
+    def _live_waiters(self) -> int:
+        return sum(1 for fut in self._waiters if not fut.done())
+
+    def _waiter_jobs(self) -> int:
+        return sum(1 for for_pool in self._jobs.values() if not for_pool)
+
+    def _start_job(self, *, for_pool: bool) -> "asyncio.Task":
+        task = asyncio.create_task(self._run_job())
+        self._jobs[task] = for_pool
+        self.stats["jobs"] += 1
+        task.add_done_callback(self._job_done)
+        return task
+
+    def _spawn(self) -> int:
+        started = 0
+        limit = self._max_parallel()
+        while len(self._jobs) < limit and self._waiter_jobs() < self._live_waiters():
+            self._start_job(for_pool=False)
+            started += 1
+        return started
+
+    def _job_done(self, task: "asyncio.Task") -> None:
+        self._jobs.pop(task, None)
+        if task.cancelled():
+            self.stats["cancelled_jobs"] += 1
+        self._spawn()
+
+    async def _run_job(self) -> Optional[str]:
+        minted_at = time.monotonic()
+        try:
+            token, source = await mint_recaptcha_v3_token_side_channel()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            debug_print(f"⚠️ reCAPTCHA mint job failed: {e}")
+            token, source = None, ""
+        if not token:
+            self.stats["failures"] += 1
+        self._deliver(token, source, minted_at)
+        return token
+
+    def _deliver(self, token: Optional[str], source: str, minted_at: float) -> None:
+        while self._waiters:
+            fut = self._waiters.popleft()
+            if fut.done():
+                continue
+            fut.set_result((token, source))
+            return
+        if token:
+            RECAPTCHA_TOKEN_POOL.put(token, source, minted_at=minted_at)
+
+    def _on_waiter_gone(self) -> None:
+        if self._live_waiters():
+            return
+        enabled, min_size, max_size = _get_recaptcha_pool_settings(_get_config_snapshot())
+        pool_needs_tokens = enabled and RECAPTCHA_TOKEN_POOL.size() < RECAPTCHA_TOKEN_POOL.target_size(
+            min_size=min_size, max_size=max_size, refill_horizon_seconds=30.0
+        )
+        for task, for_pool in list(self._jobs.items()):
+            if for_pool:
+                continue
+            if pool_needs_tokens:
+                # Nobody is waiting anymore, but the token is still useful for the pool.
+                self._jobs[task] = True
             else:
-                debug_print("❌ Timed out waiting for token variable to update.")
-                return None
+                task.cancel()
+
+    async def mint(self, *, timeout_seconds: float = 60.0) -> tuple[Optional[str], str]:
+        """Wait for a freshly minted token, sharing mint jobs with concurrent callers. Returns (token, source)."""
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        self.stats["requests"] += 1
+        if not self._spawn():
+            self.stats["coalesced"] += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(fut), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            return None, ""
+        finally:
+            if not fut.done():
+                fut.cancel()
+                try:
+                    self._waiters.remove(fut)
+                except ValueError:
+                    pass
+                self._on_waiter_gone()
+
+    async def mint_for_pool(self) -> Optional[bool]:
+        """Run one refill job if a mint slot is free. Returns None when all slots are busy."""
+        if len(self._jobs) >= self._max_parallel():
+            return None
+        task = self._start_job(for_pool=True)
+        try:
+            token = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                task.cancel()
+            raise
+        return bool(token)
+
+    def snapshot(self) -> dict:
+        return {"in_flight": len(self._jobs), "waiting": self._live_waiters(), **self.stats}
+
+
+RECAPTCHA_MINT_COORDINATOR = RecaptchaMintCoordinator()
+
+
+def _get_recaptcha_pool_settings(config: dict) -> tuple[bool, int, int]:
+    enabled = bool(config.get("recaptcha_pool_enabled", True))
+    try:
+        max_size = int(config.get("recaptcha_pool_max_size", 4))
+    except Exception:
+        max_size = 4
+    max_size = max(0, min(max_size, 32))
+    try:
+        # 0 by default: an idle bridge shouldn't keep a browser minting tokens nobody asked for.
+        min_size = int(config.get("recaptcha_pool_min_size", 0))
+    except Exception:
+        min_size = 0
+    min_size = max(0, min(min_size, max_size))
+    return enabled, min_size, max_size
+
+
+async def recaptcha_pool_refill_task():
+    """Background minter that keeps `RECAPTCHA_TOKEN_POOL` stocked according to observed demand."""
+    pool = RECAPTCHA_TOKEN_POOL
+    failures = 0
+    while True:
+        try:
+            config = _get_config_snapshot()
+            enabled, min_size, max_size = _get_recaptcha_pool_settings(config)
+            # The userscript proxy mints its own tokens in the user's tab; pre-minted ones would just expire.
+            if enabled and _userscript_proxy_is_active(config):
+                enabled = False
+            # Roughly how long a side-channel mint takes; tokens consumed meanwhile must already be in the pool.
+            target = pool.target_size(min_size=min_size, max_size=max_size, refill_horizon_seconds=30.0)
+            if not enabled or pool.size() >= target:
+                pool.wakeup.clear()
+                try:
+                    await asyncio.wait_for(pool.wakeup.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            minted = await RECAPTCHA_MINT_COORDINATOR.mint_for_pool()
+            if minted is None:
+                # Every mint slot is serving live requests; their leftovers also land in the pool.
+                await asyncio.sleep(1.0)
+            elif minted:
+                failures = 0
+                debug_print(f"🧪 reCAPTCHA pool refilled ({pool.size()}/{target} ready)")
+            else:
+                failures += 1
+                await asyncio.sleep(min(5.0 * (2 ** (failures - 1)), 120.0))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            debug_print(f"⚠️ reCAPTCHA pool refill error: {e}")
+            await asyncio.sleep(5.0)
 
-    except Exception as e:
-        debug_print(f"❌ Unexpected error: {e}")
-        return None
 
 async def refresh_recaptcha_token(force_new: bool = False):
     """Checks if the global reCAPTCHA token is expired and refreshes it if necessary."""
@@ -2975,6 +4290,20 @@ async def refresh_recaptcha_token(force_new: bool = False):
     if force_new:
         RECAPTCHA_TOKEN = None
         RECAPTCHA_EXPIRY = current_time - timedelta(days=365)
+        # Fresh single-use token requested: hand out a pre-minted one without caching it for reuse.
+        pooled = RECAPTCHA_TOKEN_POOL.take()
+        if pooled:
+            debug_print(f"✅ Using pre-minted reCAPTCHA token (source={pooled[1] or 'unknown'})")
+            return pooled[0]
+    elif RECAPTCHA_TOKEN is None or current_time > RECAPTCHA_EXPIRY - timedelta(seconds=10):
+        pooled = RECAPTCHA_TOKEN_POOL.take()
+        if pooled:
+            token, _, minted_at = pooled
+            # The token has been ageing in the pool since it was minted; only cache what is left of its lifetime.
+            remaining = float(RECAPTCHA_TOKEN_LIFETIME_SECONDS) - max(0.0, time.monotonic() - minted_at)
+            RECAPTCHA_TOKEN = token
+            RECAPTCHA_EXPIRY = current_time + timedelta(seconds=remaining)
+            return RECAPTCHA_TOKEN
     # Unit tests should never launch real browser automation. Tests that need a token patch
     # `refresh_recaptcha_token` / `get_recaptcha_v3_token` explicitly.
     if os.environ.get("PYTEST_CURRENT_TEST"):
@@ -2982,7 +4311,8 @@ async def refresh_recaptcha_token(force_new: bool = False):
     # Check if token is expired (set a refresh margin of 10 seconds)
     if RECAPTCHA_TOKEN is None or current_time > RECAPTCHA_EXPIRY - timedelta(seconds=10):
         debug_print("🔄 Recaptcha token expired or missing. Refreshing...")
-        new_token = await get_recaptcha_v3_token()
+        # Concurrent callers share a bounded number of browser mints instead of launching one each.
+        new_token, _ = await RECAPTCHA_MINT_COORDINATOR.mint()
         if new_token:
             RECAPTCHA_TOKEN = new_token
             # reCAPTCHA v3 tokens typically last 120 seconds (2 minutes)
@@ -3071,100 +4401,100 @@ async def upload_image_to_lmarena(image_data: bytes, mime_type: str, filename: s
             "Referer": "https://lmarena.ai/?mode=direct",
         })
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    "https://lmarena.ai/?mode=direct",
-                    headers=request_headers,
-                    content=json.dumps([filename, mime_type]),
-                    timeout=30.0
-                )
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                debug_print("❌ Timeout while requesting upload URL")
-                return None
-            except httpx.HTTPError as e:
-                debug_print(f"❌ HTTP error while requesting upload URL: {e}")
-                return None
-            
-            # Parse response - format: 0:{...}\n1:{...}\n
-            try:
-                lines = response.text.strip().split('\n')
-                upload_data = None
-                for line in lines:
-                    if line.startswith('1:'):
-                        upload_data = json.loads(line[2:])
-                        break
-                
-                if not upload_data or not upload_data.get('success'):
-                    debug_print(f"❌ Failed to get upload URL: {response.text[:200]}")
-                    return None
-                
-                upload_url = upload_data['data']['uploadUrl']
-                key = upload_data['data']['key']
-                debug_print(f"✅ Got upload URL and key: {key}")
-            except (json.JSONDecodeError, KeyError, IndexError) as e:
-                debug_print(f"❌ Failed to parse upload URL response: {e}")
-                return None
+        client = get_shared_http_client()
+        try:
+            response = await client.post(
+                "https://lmarena.ai/?mode=direct",
+                headers=request_headers,
+                content=json.dumps([filename, mime_type]),
+                timeout=30.0
+            )
+            response.raise_for_status()
+        except httpx.TimeoutException:
+            debug_print("❌ Timeout while requesting upload URL")
+            return None
+        except httpx.HTTPError as e:
+            debug_print(f"❌ HTTP error while requesting upload URL: {e}")
+            return None
+        
+        # Parse response - format: 0:{...}\n1:{...}\n
+        try:
+            lines = response.text.strip().split('\n')
+            upload_data = None
+            for line in lines:
+                if line.startswith('1:'):
+                    upload_data = json.loads(line[2:])
+                    break
             
-            # Step 2: Upload image to R2 storage
-            debug_print(f"📤 Step 2: Uploading image to R2 storage ({len(image_data)} bytes)")
-            try:
-                response = await client.put(
-                    upload_url,
-                    content=image_data,
-                    headers={"Content-Type": mime_type},
-                    timeout=60.0
-                )
-                response.raise_for_status()
-                debug_print(f"✅ Image uploaded successfully")
-            except httpx.TimeoutException:
-                debug_print("❌ Timeout while uploading image to R2 storage")
+            if not upload_data or not upload_data.get('success'):
+                debug_print(f"❌ Failed to get upload URL: {response.text[:200]}")
                 return None
-            except httpx.HTTPError as e:
-                debug_print(f"❌ HTTP error while uploading image: {e}")
-                return None
-            
-            # Step 3: Get signed download URL (uses different Next-Action)
-            debug_print(f"📤 Step 3: Requesting signed download URL")
-            request_headers_step3 = request_headers.copy()
-            request_headers_step3["Next-Action"] = signed_url_action_id
             
-            try:
-                response = await client.post(
-                    "https://lmarena.ai/?mode=direct",
-                    headers=request_headers_step3,
-                    content=json.dumps([key]),
-                    timeout=30.0
-                )
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                debug_print("❌ Timeout while requesting download URL")
-                return None
-            except httpx.HTTPError as e:
-                debug_print(f"❌ HTTP error while requesting download URL: {e}")
-                return None
+            upload_url = upload_data['data']['uploadUrl']
+            key = upload_data['data']['key']
+            debug_print(f"✅ Got upload URL and key: {key}")
+        except (json.JSONDecodeError, KeyError, IndexError) as e:
+            debug_print(f"❌ Failed to parse upload URL response: {e}")
+            return None
+        
+        # Step 2: Upload image to R2 storage
+        debug_print(f"📤 Step 2: Uploading image to R2 storage ({len(image_data)} bytes)")
+        try:
+            response = await client.put(
+                upload_url,
+                content=image_data,
+                headers={"Content-Type": mime_type},
+                timeout=60.0
+            )
+            response.raise_for_status()
+            debug_print(f"✅ Image uploaded successfully")
+        except httpx.TimeoutException:
+            debug_print("❌ Timeout while uploading image to R2 storage")
+            return None
+        except httpx.HTTPError as e:
+            debug_print(f"❌ HTTP error while uploading image: {e}")
+            return None
+        
+        # Step 3: Get signed download URL (uses different Next-Action)
+        debug_print(f"📤 Step 3: Requesting signed download URL")
+        request_headers_step3 = request_headers.copy()
+        request_headers_step3["Next-Action"] = signed_url_action_id
+        
+        try:
+            response = await client.post(
+                "https://lmarena.ai/?mode=direct",
+                headers=request_headers_step3,
+                content=json.dumps([key]),
+                timeout=30.0
+            )
+            response.raise_for_status()
+        except httpx.TimeoutException:
+            debug_print("❌ Timeout while requesting download URL")
+            return None
+        except httpx.HTTPError as e:
+            debug_print(f"❌ HTTP error while requesting download URL: {e}")
+            return None
+        
+        # Parse response
+        try:
+            lines = response.text.strip().split('\n')
+            download_data = None
+            for line in lines:
+                if line.startswith('1:'):
+                    download_data = json.loads(line[2:])
+                    break
             
-            # Parse response
-            try:
-                lines = response.text.strip().split('\n')
-                download_data = None
-                for line in lines:
-                    if line.startswith('1:'):
-                        download_data = json.loads(line[2:])
-                        break
-                
-                if not download_data or not download_data.get('success'):
-                    debug_print(f"❌ Failed to get download URL: {response.text[:200]}")
-                    return None
-                
-                download_url = download_data['data']['url']
-                debug_print(f"✅ Got signed download URL: {download_url[:100]}...")
-                return (key, download_url)
-            except (json.JSONDecodeError, KeyError, IndexError) as e:
-                debug_print(f"❌ Failed to parse download URL response: {e}")
+            if not download_data or not download_data.get('success'):
+                debug_print(f"❌ Failed to get download URL: {response.text[:200]}")
                 return None
             
+            download_url = download_data['data']['url']
+            debug_print(f"✅ Got signed download URL: {download_url[:100]}...")
+            return (key, download_url)
+        except (json.JSONDecodeError, KeyError, IndexError) as e:
+            debug_print(f"❌ Failed to parse download URL response: {e}")
+            return None
+        
     except Exception as e:
         debug_print(f"❌ Unexpected error uploading image: {type(e).__name__}: {e}")
         return None
@@ -3191,19 +4521,24 @@ def _coerce_message_content_to_text(content) -> str:
     return str(content)
 
 
-async def process_message_content(content, model_capabilities: dict) -> tuple[str, List[dict]]:
+async def process_message_content(
+    content, model_capabilities: dict, *, supports_images: Optional[bool] = None
+) -> tuple[str, List[dict]]:
     """
     Process message content, handle images if present and model supports them.
     
     Args:
         content: Message content (string or list of content parts)
         model_capabilities: Model's capability dictionary
+        supports_images: Precomputed image-input flag (from the model registry); derived from
+            `model_capabilities` when omitted
     
     Returns:
         Tuple of (text_content, experimental_attachments)
     """
     # Check if model supports image input
-    supports_images = model_capabilities.get('inputCapabilities', {}).get('image', False)
+    if supports_images is None:
+        supports_images = model_capabilities.get('inputCapabilities', {}).get('image', False)
     
     # If content is a string, return it as-is
     if isinstance(content, str):
@@ -3306,19 +4641,151 @@ async def process_message_content(content, model_capabilities: dict) -> tuple[st
     # Fallback
     return str(content), []
 
+# --- Shared upstream HTTP client ---
+
+_SHARED_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_SHARED_HTTP_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+SHARED_HTTP_CLIENT_STATS: Dict[str, int] = {"clients_created": 0, "requests": 0}
+
+
+class _RejectAllCookiesPolicy(http.cookiejar.DefaultCookiePolicy):
+    """The shared client serves many auth tokens; never let one response's Set-Cookie leak into other requests."""
+
+    def set_ok(self, cookie, request):  # noqa: ANN001
+        return False
+
+
+async def _count_shared_http_request(request: httpx.Request) -> None:
+    SHARED_HTTP_CLIENT_STATS["requests"] += 1
+
+
+def _build_shared_http_client(config: Optional[dict] = None) -> httpx.AsyncClient:
+    cfg = config if isinstance(config, dict) else {}
+    max_connections = max(1, min(_coerce_positive_int(cfg.get("http_max_connections"), 100), 1000))
+    max_keepalive = max(1, min(_coerce_positive_int(cfg.get("http_max_keepalive_connections"), 20), max_connections))
+    try:
+        keepalive_expiry = float(cfg.get("http_keepalive_expiry_seconds", 60))
+    except Exception:
+        keepalive_expiry = 60.0
+    keepalive_expiry = max(1.0, min(keepalive_expiry, 600.0))
+
+    http2 = bool(cfg.get("http2_enabled", False))
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            debug_print("⚠️ http2_enabled is set but the 'h2' package is not installed; using HTTP/1.1.")
+            http2 = False
+
+    SHARED_HTTP_CLIENT_STATS["clients_created"] += 1
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(connect=10.0, read=120.0, write=30.0, pool=10.0),
+        cookies=http.cookiejar.CookieJar(policy=_RejectAllCookiesPolicy()),
+        event_hooks={"request": [_count_shared_http_request]},
+    )
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide pooled client used for upstream calls (keep-alive, optional HTTP/2).
+
+    Created in `lifespan`; recreated lazily if it was closed or belongs to a different event loop.
+    Callers must not close it or rely on it storing cookies.
+    """
+    global _SHARED_HTTP_CLIENT, _SHARED_HTTP_CLIENT_LOOP
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    client = _SHARED_HTTP_CLIENT
+    if client is None or client.is_closed or (loop is not None and _SHARED_HTTP_CLIENT_LOOP is not loop):
+        try:
+            config = _get_config_snapshot()
+        except Exception:
+            config = {}
+        client = _build_shared_http_client(config)
+        _SHARED_HTTP_CLIENT = client
+        _SHARED_HTTP_CLIENT_LOOP = loop
+    return client
+
+
+async def close_shared_http_client() -> None:
+    global _SHARED_HTTP_CLIENT, _SHARED_HTTP_CLIENT_LOOP
+    client = _SHARED_HTTP_CLIENT
+    _SHARED_HTTP_CLIENT = None
+    _SHARED_HTTP_CLIENT_LOOP = None
+    if client is not None and not client.is_closed:
+        try:
+            await client.aclose()
+        except Exception as e:
+            debug_print(f"⚠️ Error closing shared HTTP client: {e}")
+
+
+async def prewarm_shared_http_client(urls: Optional[list] = None) -> None:
+    """Best-effort: open (and keep alive) connections to upstream hosts before the first real request."""
+    client = get_shared_http_client()
+    for url in urls or ["https://lmarena.ai/"]:
+        try:
+            await client.head(url, timeout=httpx.Timeout(10.0), follow_redirects=False)
+            debug_print(f"🔌 Pre-warmed upstream connection: {url}")
+        except Exception as e:
+            debug_print(f"⚠️ Connection pre-warm failed for {url}: {type(e).__name__}")
+
+
+def get_shared_http_client_stats() -> dict:
+    stats: dict = dict(SHARED_HTTP_CLIENT_STATS)
+    client = _SHARED_HTTP_CLIENT
+    stats["open"] = bool(client is not None and not client.is_closed)
+    stats["connections"] = 0
+    stats["idle_connections"] = 0
+    stats["http2_connections"] = 0
+    if client is None:
+        return stats
+    # httpcore doesn't offer a public stats API; peek at the pool best-effort.
+    try:
+        connections = list(getattr(getattr(client, "_transport", None), "_pool", None).connections)
+    except Exception:
+        connections = []
+    for conn in connections:
+        stats["connections"] += 1
+        try:
+            if conn.is_idle():
+                stats["idle_connections"] += 1
+        except Exception:
+            pass
+        try:
+            if "HTTP/2" in repr(conn):
+                stats["http2_connections"] += 1
+        except Exception:
+            pass
+    return stats
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    get_shared_http_client()
     try:
         await startup_event()
     except Exception as e:
         debug_print(f"❌ Error during startup: {e}")
-    yield
+    try:
+        yield
+    finally:
+        await shutdown_event()
+        await close_shared_http_client()
 
 app = FastAPI(lifespan=lifespan)
 
 # --- Constants & Global State ---
 CONFIG_FILE = "config.json"
 MODELS_FILE = "models.json"
+USAGE_STATS_FILE = "usage_stats.json"
 API_KEY_HEADER = APIKeyHeader(name="Authorization", auto_error=False)
 
 # In-memory stores
@@ -3326,10 +4793,15 @@ API_KEY_HEADER = APIKeyHeader(name="Authorization", auto_error=False)
 chat_sessions: Dict[str, Dict[str, dict]] = defaultdict(dict)
 # { "session_id": "username" }
 dashboard_sessions = {}
-# { "api_key": [timestamp1, timestamp2, ...] }
-api_key_usage = defaultdict(list)
+# { "api_key": _RateLimitState }
+api_key_usage: Dict[str, "_RateLimitState"] = {}
+# (config generation, { "api_key": key_entry }) for O(1) API key lookups.
+_API_KEY_INDEX: tuple = (-1, {})
 # { "model_id": count }
 model_usage_stats = defaultdict(int)
+# Set when `model_usage_stats` has changes that haven't been flushed to USAGE_STATS_FILE yet.
+_USAGE_STATS_DIRTY = False
+_USAGE_STATS_FLUSH_TASK: Optional[asyncio.Task] = None
 # Token cycling: current index for round-robin selection
 current_token_index = 0
 # Track config file path changes to reset per-config state in tests/dev.
@@ -3349,27 +4821,43 @@ SUPABASE_ANON_KEY: Optional[str] = None
 RECAPTCHA_TOKEN: Optional[str] = None
 # Initialize expiry far in the past to force a refresh on startup
 RECAPTCHA_EXPIRY: datetime = datetime.now(timezone.utc) - timedelta(days=365)
+# How long a freshly minted v3 token is treated as usable (Google accepts them for ~120s).
+RECAPTCHA_TOKEN_LIFETIME_SECONDS = 110
+_RECAPTCHA_POOL_REFILL_TASK: Optional[asyncio.Task] = None
 # --------------------------------------
 
+# Parsed + normalized config.json, reused until the file changes on disk (see `get_config`).
+# The cached dict is never handed out directly; callers always receive their own copy.
+_CONFIG_CACHE: Optional[dict] = None
+_CONFIG_CACHE_SIGNATURE: Optional[tuple] = None
+_CONFIG_CACHE_TRUSTED: bool = False
+# Filesystem mtimes are coarse (jiffies on Linux, 2s on FAT). A file modified this recently may be rewritten again
+# within the same timestamp tick with the same size, so we don't trust a cache entry loaded from such a file.
+_CONFIG_RACY_WINDOW_NS = 2_000_000_000
+# Bumped whenever the cached config is replaced, so derived indexes (e.g. API keys) know when to rebuild.
+_CONFIG_CACHE_GENERATION = 0
+CONFIG_CACHE_STATS: Dict[str, int] = {"hits": 0, "reloads": 0, "writes": 0}
+
 # --- Helper Functions ---
 
-def get_config():
-    global current_token_index, _LAST_CONFIG_FILE
-    # If tests or callers swap CONFIG_FILE at runtime, reset the token round-robin index so token selection
-    # is deterministic per config file.
-    if _LAST_CONFIG_FILE != CONFIG_FILE:
-        _LAST_CONFIG_FILE = CONFIG_FILE
-        current_token_index = 0
+def _config_file_signature() -> tuple:
     try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        debug_print(f"⚠️  Config file error: {e}, using defaults")
-        config = {}
-    except Exception as e:
-        debug_print(f"⚠️  Unexpected error reading config: {e}, using defaults")
-        config = {}
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return (CONFIG_FILE, None, None, None)
+    return (CONFIG_FILE, st.st_mtime_ns, st.st_size, st.st_ino)
+
 
+def _clone_json_value(value):
+    """Copy a JSON-shaped value (dict/list/scalars) much faster than `copy.deepcopy`."""
+    if isinstance(value, dict):
+        return {k: _clone_json_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clone_json_value(v) for v in value]
+    return value
+
+
+def _apply_config_defaults(config: dict) -> dict:
     # Ensure default keys exist
     try:
         config.setdefault("password", "admin")
@@ -3407,16 +4895,142 @@ def get_config():
     
     return config
 
+
+def _store_config_cache(config: dict, signature: tuple, *, trusted: Optional[bool] = None) -> None:
+    global _CONFIG_CACHE, _CONFIG_CACHE_SIGNATURE, _CONFIG_CACHE_TRUSTED, _CONFIG_CACHE_GENERATION
+    if trusted is None:
+        mtime_ns = signature[1]
+        trusted = mtime_ns is None or (time.time_ns() - int(mtime_ns)) >= _CONFIG_RACY_WINDOW_NS
+    _CONFIG_CACHE = config
+    _CONFIG_CACHE_SIGNATURE = signature
+    _CONFIG_CACHE_TRUSTED = trusted
+    _CONFIG_CACHE_GENERATION += 1
+
+
+def invalidate_config_cache() -> None:
+    """Drop the cached config so the next `get_config()` re-reads config.json."""
+    global _CONFIG_CACHE, _CONFIG_CACHE_SIGNATURE, _CONFIG_CACHE_TRUSTED
+    _CONFIG_CACHE = None
+    _CONFIG_CACHE_SIGNATURE = None
+    _CONFIG_CACHE_TRUSTED = False
+
+
+def get_config_cache_stats() -> dict:
+    return {
+        "hits": int(CONFIG_CACHE_STATS.get("hits", 0)),
+        "reloads": int(CONFIG_CACHE_STATS.get("reloads", 0)),
+        "writes": int(CONFIG_CACHE_STATS.get("writes", 0)),
+        "cached": _CONFIG_CACHE is not None,
+    }
+
+
+def _get_config_snapshot() -> dict:
+    """
+    Return the shared cached config, reloading it if config.json changed.
+
+    The returned dict must be treated as read-only; use `get_config()` for a copy that can be modified and saved.
+    """
+    global current_token_index, _LAST_CONFIG_FILE
+    # If tests or callers swap CONFIG_FILE at runtime, reset the token round-robin index so token selection
+    # is deterministic per config file.
+    if _LAST_CONFIG_FILE != CONFIG_FILE:
+        _LAST_CONFIG_FILE = CONFIG_FILE
+        current_token_index = 0
+
+    signature = _config_file_signature()
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE_TRUSTED and signature == _CONFIG_CACHE_SIGNATURE:
+        CONFIG_CACHE_STATS["hits"] += 1
+        return _CONFIG_CACHE
+
+    try:
+        with open(CONFIG_FILE, "r") as f:
+            config = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        debug_print(f"⚠️  Config file error: {e}, using defaults")
+        config = {}
+    except Exception as e:
+        debug_print(f"⚠️  Unexpected error reading config: {e}, using defaults")
+        config = {}
+    if not isinstance(config, dict):
+        config = {}
+
+    config = _apply_config_defaults(config)
+    _store_config_cache(config, signature)
+    CONFIG_CACHE_STATS["reloads"] += 1
+    return config
+
+
+def get_config():
+    """
+    Return a private, mutable copy of config.json (with defaults applied).
+
+    The parsed config is cached in-memory and only re-read when the file's mtime/size/inode changes or when
+    `save_config` writes through the cache, so hot request paths don't pay for disk I/O + JSON parsing.
+    """
+    return _clone_json_value(_get_config_snapshot())
+
 def load_usage_stats():
-    """Load usage stats from config into memory"""
-    global model_usage_stats
+    """Load usage stats into memory (from USAGE_STATS_FILE, falling back to legacy config.json stats)"""
+    global model_usage_stats, _USAGE_STATS_DIRTY
     try:
-        config = get_config()
-        model_usage_stats = defaultdict(int, config.get("usage_stats", {}))
+        stats = None
+        try:
+            with open(USAGE_STATS_FILE, "r") as f:
+                stats = json.load(f)
+        except FileNotFoundError:
+            stats = None
+        if not isinstance(stats, dict):
+            # Older versions persisted counters inside config.json; migrate them on first load.
+            stats = get_config().get("usage_stats", {})
+            _USAGE_STATS_DIRTY = bool(stats)
+        model_usage_stats = defaultdict(int, {str(k): int(v) for k, v in (stats or {}).items()})
     except Exception as e:
         debug_print(f"⚠️  Error loading usage stats: {e}, using empty stats")
         model_usage_stats = defaultdict(int)
 
+
+def record_model_usage(model_public_name: str) -> None:
+    """Count a request in memory; persisted later by `flush_usage_stats`."""
+    global _USAGE_STATS_DIRTY
+    model_usage_stats[model_public_name] += 1
+    _USAGE_STATS_DIRTY = True
+
+
+def flush_usage_stats(*, force: bool = False) -> bool:
+    """Write in-memory usage counters to USAGE_STATS_FILE. Returns True if the file was written."""
+    global _USAGE_STATS_DIRTY
+    if not _USAGE_STATS_DIRTY and not force:
+        return False
+    # Clear before writing so increments that race with the write are picked up by the next flush.
+    _USAGE_STATS_DIRTY = False
+    try:
+        tmp_path = f"{USAGE_STATS_FILE}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(dict(model_usage_stats), f, separators=(",", ":"))
+        os.replace(tmp_path, USAGE_STATS_FILE)
+        return True
+    except Exception as e:
+        _USAGE_STATS_DIRTY = True
+        debug_print(f"❌ Error saving usage stats: {e}")
+        return False
+
+
+async def usage_stats_flush_task():
+    """Background task to periodically persist usage counters"""
+    while True:
+        try:
+            interval = float(get_config().get("usage_stats_flush_interval_seconds", 30))
+        except Exception:
+            interval = 30.0
+        interval = max(1.0, min(interval, 3600.0))
+        try:
+            await asyncio.sleep(interval)
+            flush_usage_stats()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            debug_print(f"❌ Error in usage stats flush task: {e}")
+
 def save_config(config, *, preserve_auth_tokens: bool = True):
     try:
         # Avoid clobbering user-provided auth tokens when multiple tasks write config.json concurrently.
@@ -3434,16 +5048,34 @@ def save_config(config, *, preserve_auth_tokens: bool = True):
                 if "auth_token" in on_disk:
                     config["auth_token"] = str(on_disk.get("auth_token") or "")
 
-        # Persist in-memory stats to the config dict before saving
-        config["usage_stats"] = dict(model_usage_stats)
         tmp_path = f"{CONFIG_FILE}.tmp"
         with open(tmp_path, "w") as f:
             json.dump(config, f, indent=4)
         os.replace(tmp_path, CONFIG_FILE)
+
+        # Write through the in-memory cache: we know exactly what is on disk now, so readers don't need to re-parse.
+        _store_config_cache(
+            _apply_config_defaults(_clone_json_value(config)),
+            _config_file_signature(),
+            trusted=True,
+        )
+        CONFIG_CACHE_STATS["writes"] += 1
     except Exception as e:
         debug_print(f"❌ Error saving config: {e}")
 
 
+def _save_config_updates(updates: dict) -> None:
+    """
+    Set `updates` on the current config.json and save it.
+
+    For long-running tasks: re-reading right before the write keeps keys other tasks saved in the meantime
+    (cookies, cf_clearance, provisional ids) instead of writing back a stale copy.
+    """
+    config = get_config()
+    config.update(updates)
+    save_config(config)
+
+
 def _combine_split_arena_auth_cookies(cookies: list[dict]) -> Optional[str]:
     """
     Combine split arena-auth-prod-v1.0 and .1 cookies into a single value.
@@ -3574,12 +5206,119 @@ def _upsert_browser_session_into_config(config: dict, cookies: list[dict], user_
 
     return changed
 
-def get_models():
+class ModelRegistry:
+    """
+    Indexed, read-only view over the LMArena model catalog (models.json).
+
+    A registry is built once per catalog and swapped atomically by `save_models`, so request paths resolve models
+    with dict lookups instead of re-reading models.json and scanning the list.
+    """
+
+    def __init__(self, models: list, *, version: int = 0, source_file: Optional[str] = None) -> None:
+        self.models: list = models if isinstance(models, list) else []
+        self.version = int(version)
+        self.source_file = source_file
+        self.by_public_name: dict[str, dict] = {}
+
+        for model in self.models:
+            if not isinstance(model, dict):
+                continue
+            entry = self._build_entry(model)
+            public_name = entry["public_name"]
+            # First entry wins, matching the old linear scan.
+            if public_name and public_name not in self.by_public_name:
+                self.by_public_name[public_name] = entry
+
+    @staticmethod
+    def _build_entry(model: dict) -> dict:
+        capabilities = model.get("capabilities") or {}
+        if not isinstance(capabilities, dict):
+            capabilities = {}
+        input_caps = capabilities.get("inputCapabilities") or {}
+        output_caps = capabilities.get("outputCapabilities") or {}
+        if not isinstance(input_caps, dict):
+            input_caps = {}
+        if not isinstance(output_caps, dict):
+            output_caps = {}
+
+        # Priority: image > search > chat
+        if output_caps.get("image"):
+            modality = "image"
+        elif output_caps.get("search"):
+            modality = "search"
+        else:
+            modality = "chat"
+
+        organization = model.get("organization")
+        return {
+            "model": model,
+            "public_name": model.get("publicName"),
+            "id": model.get("id"),
+            "organization": organization,
+            "capabilities": capabilities,
+            "modality": modality,
+            "supports_images": bool(input_caps.get("image", False)),
+            # Models without an organization are unreleased "stealth" models and are not served.
+            "stealth": not organization,
+        }
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def get(self, public_name: str) -> Optional[dict]:
+        return self.by_public_name.get(str(public_name or ""))
+
+
+# Current catalog; replaced (never mutated) whenever a new models.json is written.
+_MODEL_REGISTRY: Optional[ModelRegistry] = None
+_MODEL_REGISTRY_VERSION = 0
+# Registry for a catalog list that didn't come from models.json (e.g. tests patching `get_models`), keyed by identity.
+_ADHOC_MODEL_REGISTRY: Optional[ModelRegistry] = None
+
+
+def _load_models_file() -> list:
     try:
         with open(MODELS_FILE, "r") as f:
-            return json.load(f)
+            models = json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         return []
+    return models if isinstance(models, list) else []
+
+
+def _swap_model_registry(models: list) -> ModelRegistry:
+    global _MODEL_REGISTRY, _MODEL_REGISTRY_VERSION
+    _MODEL_REGISTRY_VERSION += 1
+    registry = ModelRegistry(models, version=_MODEL_REGISTRY_VERSION, source_file=MODELS_FILE)
+    _MODEL_REGISTRY = registry
+    return registry
+
+
+def get_model_registry(models: Optional[list] = None) -> ModelRegistry:
+    """
+    Return the indexed registry for the current catalog.
+
+    When `models` is given, return a registry for that exact list (reusing the current one when it is the same
+    object), so callers can index whatever `get_models()` returned.
+    """
+    global _ADHOC_MODEL_REGISTRY
+    registry = _MODEL_REGISTRY
+    if models is None:
+        if registry is None or registry.source_file != MODELS_FILE:
+            registry = _swap_model_registry(_load_models_file())
+        return registry
+
+    if registry is not None and registry.models is models:
+        return registry
+    adhoc = _ADHOC_MODEL_REGISTRY
+    if adhoc is None or adhoc.models is not models:
+        adhoc = ModelRegistry(models, version=-1)
+        _ADHOC_MODEL_REGISTRY = adhoc
+    return adhoc
+
+
+def get_models():
+    """Return the cached model catalog (treat as read-only; use `save_models` to replace it)."""
+    return get_model_registry().models
 
 def save_models(models):
     try:
@@ -3589,7 +5328,9 @@ def save_models(models):
         os.replace(tmp_path, MODELS_FILE)
     except Exception as e:
         debug_print(f"❌ Error saving models: {e}")
-
+        return
+    # Hot-swap the in-memory registry so new requests see the new catalog without re-reading the file.
+    _swap_model_registry(list(models) if isinstance(models, list) else [])
 
 def get_request_headers():
     """Get request headers with the first available auth token (for compatibility)"""
@@ -3963,12 +5704,13 @@ async def refresh_arena_auth_token_via_lmarena_http(old_token: str, config: Opti
     cookies["arena-auth-prod-v1"] = old_token
 
     try:
-        async with httpx.AsyncClient(
-            headers={"User-Agent": ua},
+        # Cookies go in an explicit header: the shared client deliberately has no cookie jar.
+        resp = await get_shared_http_client().get(
+            "https://lmarena.ai/",
+            headers={"User-Agent": ua, "Cookie": "; ".join(f"{k}={v}" for k, v in cookies.items())},
             follow_redirects=True,
             timeout=httpx.Timeout(connect=10.0, read=20.0, write=10.0, pool=10.0),
-        ) as client:
-            resp = await client.get("https://lmarena.ai/", cookies=cookies)
+        )
     except Exception:
         return None
 
@@ -4033,11 +5775,13 @@ async def refresh_arena_auth_token_via_supabase(old_token: str, *, anon_key: Opt
     }
 
     try:
-        async with httpx.AsyncClient(
+        resp = await get_shared_http_client().post(
+            url,
+            headers=headers,
+            json={"refresh_token": refresh_token},
             timeout=httpx.Timeout(connect=10.0, read=20.0, write=10.0, pool=10.0),
             follow_redirects=True,
-        ) as client:
-            resp = await client.post(url, headers=headers, json={"refresh_token": refresh_token})
+        )
     except Exception:
         return None
 
@@ -4140,69 +5884,495 @@ async def maybe_refresh_expired_auth_tokens_via_lmarena_http(exclude_tokens: Opt
             if not new_token:
                 continue
 
-            # Also prefer it immediately for subsequent requests.
-            global EPHEMERAL_ARENA_AUTH_TOKEN
-            EPHEMERAL_ARENA_AUTH_TOKEN = new_token
-            return new_token
+            # Also prefer it immediately for subsequent requests.
+            global EPHEMERAL_ARENA_AUTH_TOKEN
+            EPHEMERAL_ARENA_AUTH_TOKEN = new_token
+            publish_refreshed_auth_token(old, new_token)
+            return new_token
+
+    return None
+
+
+async def maybe_refresh_expired_auth_tokens(exclude_tokens: Optional[set] = None) -> Optional[str]:
+    """
+    Refresh an expired `arena-auth-prod-v1` base64 session without mutating user settings.
+
+    Strategy:
+      1) Try LMArena Set-Cookie refresh (no anon key required).
+      2) Fall back to Supabase refresh_token grant (requires Supabase anon key discovered from JS bundles).
+    """
+    excluded = exclude_tokens or set()
+
+    try:
+        token = await maybe_refresh_expired_auth_tokens_via_lmarena_http(exclude_tokens=excluded)
+    except Exception:
+        token = None
+    if token:
+        return token
+
+    cfg = get_config()
+    tokens = cfg.get("auth_tokens", [])
+    if not isinstance(tokens, list):
+        tokens = []
+
+    expired_base64: list[str] = []
+    for t in tokens:
+        t = str(t or "").strip()
+        if not t or t in excluded:
+            continue
+        if t.startswith("base64-") and is_arena_auth_token_expired(t, skew_seconds=0):
+            expired_base64.append(t)
+    if not expired_base64:
+        return None
+
+    async with ARENA_AUTH_REFRESH_LOCK:
+        cfg = get_config()
+        tokens = cfg.get("auth_tokens", [])
+        if not isinstance(tokens, list):
+            tokens = []
+
+        for old in list(expired_base64):
+            if old in excluded:
+                continue
+            if old not in tokens:
+                continue
+            if not is_arena_auth_token_expired(old, skew_seconds=0):
+                continue
+
+            new_token = await refresh_arena_auth_token_via_supabase(old)
+            if not new_token:
+                continue
+
+            global EPHEMERAL_ARENA_AUTH_TOKEN
+            EPHEMERAL_ARENA_AUTH_TOKEN = new_token
+            publish_refreshed_auth_token(old, new_token)
+            return new_token
+
+    return None
+
+
+# How long to bench a token after upstream says its session is invalid (it may be refreshed meanwhile).
+AUTH_TOKEN_UNAUTHORIZED_COOLDOWN_SECONDS = 300.0
+# Selection looks at up to this many eligible tokens (from the round-robin cursor) and picks the healthiest.
+AUTH_TOKEN_SELECTION_WINDOW = 3
+_AUTH_TOKEN_HEALTH_ALPHA = 0.2
+
+
+class AuthTokenHealth:
+    """Per-token upstream outcome history shared across requests (EWMA success rate/latency + cooldown)."""
+
+    __slots__ = ("success_rate", "latency_ms", "cooldown_until", "last_outcome", "counts")
+
+    def __init__(self) -> None:
+        self.success_rate = 1.0
+        self.latency_ms: Optional[float] = None
+        self.cooldown_until = 0.0
+        self.last_outcome = ""
+        self.counts: dict[str, int] = defaultdict(int)
+
+    def score(self) -> float:
+        # 1.0 for an untested/perfect token; a 2s average latency costs ~10%.
+        latency_penalty = 1.0 + (float(self.latency_ms or 0.0) / 20000.0)
+        return self.success_rate / latency_penalty
+
+    def cooling_down(self, now: float) -> bool:
+        return self.cooldown_until > now
+
+
+_AUTH_TOKEN_HEALTH: dict[str, AuthTokenHealth] = {}
+
+
+def record_auth_token_outcome(
+    token: str,
+    outcome: str,
+    *,
+    retry_after: Optional[str] = None,
+    latency_ms: Optional[float] = None,
+) -> None:
+    """
+    Record an upstream outcome for an auth token.
+
+    outcome: "success", "rate_limited" (429), "unauthorized" (401) or "recaptcha" (reCAPTCHA 403).
+    Rate-limited tokens cool down until Retry-After; unauthorized ones for `AUTH_TOKEN_UNAUTHORIZED_COOLDOWN_SECONDS`.
+    """
+    token = str(token or "").strip()
+    if not token:
+        return
+    health = _AUTH_TOKEN_HEALTH.get(token)
+    if health is None:
+        health = AuthTokenHealth()
+        _AUTH_TOKEN_HEALTH[token] = health
+
+    now = time.monotonic()
+    success = outcome == "success"
+    health.success_rate += _AUTH_TOKEN_HEALTH_ALPHA * ((1.0 if success else 0.0) - health.success_rate)
+    health.last_outcome = outcome
+    health.counts[outcome] += 1
+    if success:
+        health.cooldown_until = 0.0
+        if latency_ms is not None and latency_ms >= 0:
+            if health.latency_ms is None:
+                health.latency_ms = float(latency_ms)
+            else:
+                health.latency_ms += _AUTH_TOKEN_HEALTH_ALPHA * (float(latency_ms) - health.latency_ms)
+    elif outcome == "rate_limited":
+        health.cooldown_until = max(health.cooldown_until, now + get_rate_limit_sleep_seconds(retry_after, 0))
+    elif outcome == "unauthorized":
+        health.cooldown_until = max(health.cooldown_until, now + AUTH_TOKEN_UNAUTHORIZED_COOLDOWN_SECONDS)
+
+
+def get_auth_token_health_stats() -> dict:
+    now = time.monotonic()
+    return {
+        "tracked": len(_AUTH_TOKEN_HEALTH),
+        "cooling_down": sum(1 for h in _AUTH_TOKEN_HEALTH.values() if h.cooling_down(now)),
+    }
+
+
+class AuthTokenPool:
+    """
+    Classified view of the configured `auth_tokens`, rebuilt only when the token list changes.
+
+    Expiry is decoded once per token. The preference tiers used by `get_next_auth_token` only change when a token
+    crosses its expiry (minus skew), so the active list is cached until the next such transition.
+    """
+
+    # Matches the default skew of `is_arena_auth_token_expired`.
+    EXPIRY_SKEW_SECONDS = 30
+
+    def __init__(self, tokens, *, replacements: Optional[dict] = None, previous: Optional["AuthTokenPool"] = None) -> None:
+        normalized: list[str] = []
+        for t in tokens or []:
+            s = str(t or "").strip()
+            if s:
+                normalized.append(s)
+        # Configured tokens, and the tokens actually handed out (after in-memory session refreshes).
+        self.source_tokens: tuple = tuple(normalized)
+        replacements = replacements or {}
+        self.tokens: tuple = tuple(replacements.get(t, t) for t in self.source_tokens)
+        self.expires_at: dict[str, Optional[int]] = {}
+        # Static "is this a plausible arena-auth cookie" part of `is_probably_valid_arena_auth_token`.
+        self._plausible_format: dict[str, bool] = {}
+        for t in self.tokens:
+            if t in self.expires_at:
+                continue
+            if previous is not None and t in previous.expires_at:
+                self.expires_at[t] = previous.expires_at[t]
+                self._plausible_format[t] = previous._plausible_format.get(t, False)
+                continue
+            try:
+                self.expires_at[t] = get_arena_auth_token_expiry_epoch(t)
+            except Exception:
+                self.expires_at[t] = None
+            self._plausible_format[t] = self._classify_format(t)
+        self._active: list[str] = []
+        self._active_valid_until = float("-inf")
+
+    @staticmethod
+    def _classify_format(token: str) -> bool:
+        if token.startswith("base64-"):
+            session = _decode_arena_auth_session_token(token)
+            if not isinstance(session, dict):
+                return False
+            access = str(session.get("access_token") or "").strip()
+            return access.count(".") >= 2
+        return token.count(".") >= 2 and len(token) >= 100
+
+    def is_expired(self, token: str, *, skew_seconds: int = EXPIRY_SKEW_SECONDS, now: Optional[float] = None) -> bool:
+        exp = self.expires_at.get(token)
+        if exp is None:
+            if token in self.expires_at:
+                return False
+            return is_arena_auth_token_expired(token, skew_seconds=skew_seconds)
+        current = time.time() if now is None else float(now)
+        return current >= (float(exp) - float(max(0, skew_seconds)))
+
+    def _rebuild_active(self, now: float) -> None:
+        skew = self.EXPIRY_SKEW_SECONDS
+        # Drop tokens we can confidently determine are expired, *except* base64 session cookies (refreshable).
+        candidates = [
+            t for t in self.tokens if t.startswith("base64-") or not self.is_expired(t, skew_seconds=skew, now=now)
+        ]
+        # Token preference order:
+        #   1) plausible, non-expired tokens (base64/JWT-like)
+        #   2) base64 session cookies (even if expired, refreshable)
+        #   3) long opaque tokens
+        #   4) anything else
+        probable = [
+            t for t in candidates if self._plausible_format.get(t) and not self.is_expired(t, skew_seconds=skew, now=now)
+        ]
+        if probable:
+            active = probable
+        else:
+            active = [t for t in candidates if t.startswith("base64-")] or [
+                t for t in candidates if len(t) >= 100
+            ] or candidates
+
+        next_transition = float("inf")
+        for exp in self.expires_at.values():
+            if exp is None:
+                continue
+            boundary = float(exp) - float(skew)
+            if now < boundary < next_transition:
+                next_transition = boundary
+        self._active = active
+        self._active_valid_until = next_transition
+
+    def active_tokens(self, now: Optional[float] = None) -> list[str]:
+        current = time.time() if now is None else float(now)
+        if current >= self._active_valid_until:
+            self._rebuild_active(current)
+        return self._active
+
+    def select(self, index: int, exclude_tokens: Optional[set] = None) -> Optional[str]:
+        """
+        Round-robin pick starting at `index`, skipping excluded tokens and tokens in cooldown.
+
+        Among the next `AUTH_TOKEN_SELECTION_WINDOW` eligible tokens one is drawn at random, weighted by health
+        score, so healthier tokens get more traffic without one fast token absorbing all of it (and its upstream
+        rate limit). A token without recorded history, or with a perfect score, is taken immediately. If every
+        token is cooling down, the one that recovers first is used.
+        """
+        active = self.active_tokens()
+        if not active:
+            return None
+        n = len(active)
+        start = int(index) % n
+        if not exclude_tokens and not _AUTH_TOKEN_HEALTH:
+            return active[start]
+
+        now = time.monotonic()
+        candidates: list[tuple] = []
+        soonest: Optional[str] = None
+        soonest_until = float("inf")
+        for offset in range(n):
+            token = active[(start + offset) % n]
+            if exclude_tokens and token in exclude_tokens:
+                continue
+            health = _AUTH_TOKEN_HEALTH.get(token)
+            if health is None:
+                return token
+            if health.cooling_down(now):
+                if health.cooldown_until < soonest_until:
+                    soonest, soonest_until = token, health.cooldown_until
+                continue
+            score = health.score()
+            if score >= 1.0:
+                # Nothing can beat a perfect score; keep plain round-robin order.
+                return token
+            candidates.append((token, max(0.0, score)))
+            if len(candidates) >= AUTH_TOKEN_SELECTION_WINDOW:
+                break
+        if not candidates:
+            return soonest
+        total = sum(weight for _, weight in candidates)
+        if total <= 0:
+            return candidates[0][0]
+        pick = random.random() * total
+        for token, weight in candidates:
+            pick -= weight
+            if pick < 0:
+                return token
+        return candidates[-1][0]
+
 
-    return None
+_AUTH_TOKEN_POOL: Optional[AuthTokenPool] = None
+_AUTH_TOKEN_POOL_GENERATION = -1
 
 
-async def maybe_refresh_expired_auth_tokens(exclude_tokens: Optional[set] = None) -> Optional[str]:
+def get_auth_token_pool(config: Optional[dict] = None) -> AuthTokenPool:
+    """Return the token pool for the current config, rebuilding it only if `auth_tokens` changed."""
+    global _AUTH_TOKEN_POOL, _AUTH_TOKEN_POOL_GENERATION
+    if config is None:
+        config = _get_config_snapshot()
+        generation = _CONFIG_CACHE_GENERATION
+        if _AUTH_TOKEN_POOL is not None and _AUTH_TOKEN_POOL_GENERATION == generation:
+            return _AUTH_TOKEN_POOL
+    else:
+        generation = -1
+
+    auth_tokens = config.get("auth_tokens", [])
+    if not isinstance(auth_tokens, list):
+        auth_tokens = []
+    tokens = tuple(str(t or "").strip() for t in auth_tokens if str(t or "").strip())
+    if _AUTH_TOKEN_POOL is None or _AUTH_TOKEN_POOL.source_tokens != tokens:
+        # Forget refreshed sessions for tokens that were removed from config.
+        for source in [t for t in _AUTH_TOKEN_REPLACEMENTS if t not in tokens]:
+            _AUTH_TOKEN_REPLACEMENTS.pop(source, None)
+        _AUTH_TOKEN_POOL = AuthTokenPool(tokens, replacements=_AUTH_TOKEN_REPLACEMENTS, previous=_AUTH_TOKEN_POOL)
+        keep = set(_AUTH_TOKEN_POOL.tokens)
+        if EPHEMERAL_ARENA_AUTH_TOKEN:
+            keep.add(str(EPHEMERAL_ARENA_AUTH_TOKEN).strip())
+        for stale in [t for t in _AUTH_TOKEN_HEALTH if t not in keep]:
+            _AUTH_TOKEN_HEALTH.pop(stale, None)
+    _AUTH_TOKEN_POOL_GENERATION = generation
+    return _AUTH_TOKEN_POOL
+
+
+# { configured token: latest refreshed session } - request-path refreshes live only here; the background
+# refresher also persists them to config.json.
+_AUTH_TOKEN_REPLACEMENTS: dict[str, str] = {}
+# { configured token: (consecutive failures, next attempt epoch) } for the proactive refresher.
+_AUTH_TOKEN_REFRESH_BACKOFF: dict[str, tuple[int, float]] = {}
+_AUTH_TOKEN_REFRESH_TASK: Optional[asyncio.Task] = None
+AUTH_TOKEN_REFRESH_STATS: Dict[str, int] = {"refreshed": 0, "failed": 0}
+
+
+def publish_refreshed_auth_token(old_token: str, new_token: str, *, persist: bool = False) -> bool:
     """
-    Refresh an expired `arena-auth-prod-v1` base64 session without mutating user settings.
+    Swap a refreshed session into the token pool in one step.
 
-    Strategy:
-      1) Try LMArena Set-Cookie refresh (no anon key required).
-      2) Fall back to Supabase refresh_token grant (requires Supabase anon key discovered from JS bundles).
+    `old_token` may be either the configured token or the session currently standing in for it. Request-path
+    refreshes stay in memory; only the background refresher passes `persist=True` to write config.json.
     """
-    excluded = exclude_tokens or set()
+    global _AUTH_TOKEN_POOL
+    old_token = str(old_token or "").strip()
+    new_token = str(new_token or "").strip()
+    if not old_token or not new_token or old_token == new_token:
+        return False
+    pool = get_auth_token_pool()
+    sources = [
+        source for source, current in zip(pool.source_tokens, pool.tokens) if old_token in (source, current)
+    ]
+    if not sources:
+        return False
+    for source in sources:
+        _AUTH_TOKEN_REPLACEMENTS[source] = new_token
+        _AUTH_TOKEN_REFRESH_BACKOFF.pop(source, None)
+    health = _AUTH_TOKEN_HEALTH.pop(old_token, None)
+    if health is not None:
+        # Keep latency history but drop the cooldown that triggered the refresh.
+        health.cooldown_until = 0.0
+        _AUTH_TOKEN_HEALTH[new_token] = health
+    _AUTH_TOKEN_POOL = AuthTokenPool(pool.source_tokens, replacements=_AUTH_TOKEN_REPLACEMENTS, previous=pool)
+    if persist:
+        _persist_refreshed_auth_token({old_token, *sources}, new_token)
+    return True
+
+
+def _persist_refreshed_auth_token(replaced: set[str], new_token: str) -> bool:
+    """
+    Write a refreshed session back over the token(s) it replaces in config.json.
 
+    Only entries still present on disk are rewritten, so tokens removed or edited via the dashboard in the meantime
+    are left alone. Returns True if config.json was updated.
+    """
     try:
-        token = await maybe_refresh_expired_auth_tokens_via_lmarena_http(exclude_tokens=excluded)
-    except Exception:
-        token = None
-    if token:
-        return token
+        config = get_config()
+        changed = False
+        auth_tokens = config.get("auth_tokens")
+        if isinstance(auth_tokens, list):
+            updated = [new_token if str(t or "").strip() in replaced else t for t in auth_tokens]
+            if updated != auth_tokens:
+                config["auth_tokens"] = updated
+                changed = True
+        if str(config.get("auth_token") or "").strip() in replaced:
+            config["auth_token"] = new_token
+            changed = True
+        if not changed:
+            return False
+        save_config(config, preserve_auth_tokens=False)
+        return True
+    except Exception as e:
+        debug_print(f"⚠️  Error persisting refreshed auth token: {e}")
+        return False
 
-    cfg = get_config()
-    tokens = cfg.get("auth_tokens", [])
-    if not isinstance(tokens, list):
-        tokens = []
 
-    expired_base64: list[str] = []
-    for t in tokens:
-        t = str(t or "").strip()
-        if not t or t in excluded:
+def _auth_tokens_due_for_refresh(pool: AuthTokenPool, now: float, margin_seconds: float) -> list[tuple[str, str]]:
+    due: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for source, current in zip(pool.source_tokens, pool.tokens):
+        if source in seen or not current.startswith("base64-"):
             continue
-        if t.startswith("base64-") and is_arena_auth_token_expired(t, skew_seconds=0):
-            expired_base64.append(t)
-    if not expired_base64:
-        return None
+        seen.add(source)
+        exp = pool.expires_at.get(current)
+        if exp is None or now < float(exp) - margin_seconds:
+            continue
+        _, next_attempt_at = _AUTH_TOKEN_REFRESH_BACKOFF.get(source, (0, 0.0))
+        if now < next_attempt_at:
+            continue
+        due.append((source, current))
+    return due
 
-    async with ARENA_AUTH_REFRESH_LOCK:
-        cfg = get_config()
-        tokens = cfg.get("auth_tokens", [])
-        if not isinstance(tokens, list):
-            tokens = []
 
-        for old in list(expired_base64):
-            if old in excluded:
-                continue
-            if old not in tokens:
-                continue
-            if not is_arena_auth_token_expired(old, skew_seconds=0):
-                continue
+def _next_auth_token_refresh_delay(pool: AuthTokenPool, now: float, margin_seconds: float) -> float:
+    wake_at = now + 300.0
+    for source, current in zip(pool.source_tokens, pool.tokens):
+        exp = pool.expires_at.get(current)
+        if exp is None or not current.startswith("base64-"):
+            continue
+        _, next_attempt_at = _AUTH_TOKEN_REFRESH_BACKOFF.get(source, (0, 0.0))
+        wake_at = min(wake_at, max(float(exp) - margin_seconds, next_attempt_at))
+    return max(5.0, wake_at - now)
 
-            new_token = await refresh_arena_auth_token_via_supabase(old)
-            if not new_token:
+
+async def refresh_auth_token_proactively(source: str, current: str) -> Optional[str]:
+    """Refresh one session ahead of expiry and publish it; failures back off exponentially (max 30 minutes)."""
+    new_token: Optional[str] = None
+    try:
+        new_token = await refresh_arena_auth_token_via_lmarena_http(current, _get_config_snapshot())
+    except Exception:
+        new_token = None
+    if not new_token or new_token == current:
+        try:
+            new_token = await refresh_arena_auth_token_via_supabase(current)
+        except Exception:
+            new_token = None
+
+    if new_token and new_token != current:
+        publish_refreshed_auth_token(current, new_token, persist=True)
+        AUTH_TOKEN_REFRESH_STATS["refreshed"] += 1
+        debug_print(f"🔄 Proactively refreshed arena-auth session {source[:20]}...")
+        return new_token
+
+    failures, _ = _AUTH_TOKEN_REFRESH_BACKOFF.get(source, (0, 0.0))
+    failures += 1
+    _AUTH_TOKEN_REFRESH_BACKOFF[source] = (failures, time.time() + min(60.0 * (2 ** (failures - 1)), 1800.0))
+    AUTH_TOKEN_REFRESH_STATS["failed"] += 1
+    debug_print(f"⚠️ Proactive refresh failed for {source[:20]}... (attempt {failures})")
+    return None
+
+
+async def auth_token_refresh_task():
+    """Background scheduler that refreshes base64 arena-auth sessions a margin before they expire."""
+    while True:
+        sleep_seconds = 60.0
+        try:
+            config = _get_config_snapshot()
+            if not bool(config.get("auth_token_refresh_enabled", True)):
+                await asyncio.sleep(sleep_seconds)
                 continue
+            try:
+                margin = float(config.get("auth_token_refresh_margin_seconds", 300))
+            except Exception:
+                margin = 300.0
+            margin = max(60.0, min(margin, 3600.0))
+            concurrency = max(1, min(_coerce_positive_int(config.get("auth_token_refresh_concurrency"), 2), 16))
+            try:
+                jitter = float(config.get("auth_token_refresh_jitter_seconds", 15))
+            except Exception:
+                jitter = 15.0
+            jitter = max(0.0, min(jitter, 300.0))
 
-            global EPHEMERAL_ARENA_AUTH_TOKEN
-            EPHEMERAL_ARENA_AUTH_TOKEN = new_token
-            return new_token
+            pool = get_auth_token_pool()
+            due = _auth_tokens_due_for_refresh(pool, time.time(), margin)
+            if due:
+                semaphore = asyncio.Semaphore(concurrency)
 
-    return None
+                async def _refresh_one(source: str, current: str) -> None:
+                    async with semaphore:
+                        if jitter > 0:
+                            await asyncio.sleep(random.uniform(0.0, jitter))
+                        await refresh_auth_token_proactively(source, current)
+
+                await asyncio.gather(*(_refresh_one(s, c) for s, c in due), return_exceptions=True)
+
+            sleep_seconds = _next_auth_token_refresh_delay(get_auth_token_pool(), time.time(), margin)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            debug_print(f"⚠️ Auth token refresh scheduler error: {e}")
+        await asyncio.sleep(sleep_seconds)
 
 
 def get_next_auth_token(exclude_tokens: set = None, *, allow_ephemeral_fallback: bool = True):
@@ -4214,83 +6384,18 @@ def get_next_auth_token(exclude_tokens: set = None, *, allow_ephemeral_fallback:
             configured tokens are excluded.
     """
     global current_token_index
-    config = get_config()
-    
-    # Get all available tokens
-    auth_tokens = config.get("auth_tokens", [])
-    if not isinstance(auth_tokens, list):
-        auth_tokens = []
+    config = _get_config_snapshot()
+    pool = get_auth_token_pool()
 
-    # Normalize and drop empty tokens.
-    auth_tokens = [str(t or "").strip() for t in auth_tokens if str(t or "").strip()]
-
-    # Drop tokens we can confidently determine are expired, *except* base64 session cookies.
-    # Expired base64 session cookies can often be refreshed via `Set-Cookie` (see
-    # `maybe_refresh_expired_auth_tokens_via_lmarena_http`), so we keep them as a better fallback than short
-    # placeholder strings like "test-auth".
-    filtered_tokens: list[str] = []
-    for t in auth_tokens:
-        if t.startswith("base64-"):
-            filtered_tokens.append(t)
-            continue
-        try:
-            if is_arena_auth_token_expired(t):
-                continue
-        except Exception:
-            # Unknown formats: do not assume expired.
-            pass
-        filtered_tokens.append(t)
-    auth_tokens = filtered_tokens
-
-    # Token preference order:
-    #   1) plausible, non-expired tokens (base64/JWT-like)
-    #   2) base64 session cookies (even if expired, refreshable)
-    #   3) long opaque tokens
-    #   4) anything else
-    try:
-        probable = [t for t in auth_tokens if is_probably_valid_arena_auth_token(t)]
-    except Exception:
-        probable = []
-    base64_any = [t for t in auth_tokens if t.startswith("base64-")]
-    long_opaque = [t for t in auth_tokens if len(str(t)) >= 100]
-    if probable:
-        auth_tokens = probable
-    elif base64_any:
-        auth_tokens = base64_any
-    elif long_opaque:
-        auth_tokens = long_opaque
-
-    # If we have at least one *configured* token we recognize as a plausible arena-auth cookie, ignore
-    # obviously placeholder/invalid entries (e.g. short "test-token" strings). Do not let an in-memory
-    # ephemeral token cause us to drop user-configured tokens, because tests and some deployments use
-    # opaque token formats.
-    has_probably_valid_config = False
-    for t in auth_tokens:
-        try:
-            if is_probably_valid_arena_auth_token(str(t)):
-                has_probably_valid_config = True
-                break
-        except Exception:
-            continue
-    if has_probably_valid_config:
-        filtered_tokens: list[str] = []
-        for t in auth_tokens:
-            s = str(t or "").strip()
-            if not s:
-                continue
-            try:
-                if is_probably_valid_arena_auth_token(s):
-                    filtered_tokens.append(s)
-                    continue
-            except Exception:
-                # Keep unknown formats (they may still be valid).
-                filtered_tokens.append(s)
-                continue
-            # Drop short placeholders when we have at least one plausible token.
-            if len(s) < 100:
-                continue
-            filtered_tokens.append(s)
-        auth_tokens = filtered_tokens
+    auth_tokens = pool.active_tokens()
+    if auth_tokens:
+        token = pool.select(current_token_index, exclude_tokens)
+        current_token_index = (current_token_index + 1) % len(auth_tokens)
+        if token is None:
+            return _ephemeral_auth_token_fallback(exclude_tokens, allow_ephemeral_fallback)
+        return _prefer_ephemeral_over_expired(token, exclude_tokens, pool)
+
+    config = _clone_json_value(config)
 
     # Back-compat: support single-token config without persisting/mutating user settings.
     if not auth_tokens:
@@ -4312,34 +6417,44 @@ def get_next_auth_token(exclude_tokens: set = None, *, allow_ephemeral_fallback:
             raise HTTPException(status_code=500, detail="No auth tokens configured")
     
     # Filter out excluded tokens
-    if exclude_tokens:
-        available_tokens = [t for t in auth_tokens if t not in exclude_tokens]
-        if not available_tokens:
-            if allow_ephemeral_fallback:
-                # Last resort: if we have a valid in-memory token (captured/refreshed) that isn't excluded,
-                # use it rather than failing hard.
-                try:
-                    candidate = str(EPHEMERAL_ARENA_AUTH_TOKEN or "").strip()
-                except Exception:
-                    candidate = ""
-                if (
-                    candidate
-                    and candidate not in exclude_tokens
-                    and is_probably_valid_arena_auth_token(candidate)
-                    and not is_arena_auth_token_expired(candidate, skew_seconds=0)
-                ):
-                    return candidate
-            raise HTTPException(status_code=500, detail="No more auth tokens available to try")
-    else:
-        available_tokens = auth_tokens
-    
+    available_tokens = [t for t in auth_tokens if not exclude_tokens or t not in exclude_tokens]
+    if not available_tokens:
+        return _ephemeral_auth_token_fallback(exclude_tokens, allow_ephemeral_fallback)
+
     # Round-robin selection from available tokens
     token = available_tokens[current_token_index % len(available_tokens)]
     current_token_index = (current_token_index + 1) % len(auth_tokens)
+    return _prefer_ephemeral_over_expired(token, exclude_tokens, None)
+
+
+def _ephemeral_auth_token_fallback(exclude_tokens: Optional[set], allow_ephemeral_fallback: bool) -> str:
+    if allow_ephemeral_fallback:
+        # Last resort: if we have a valid in-memory token (captured/refreshed) that isn't excluded,
+        # use it rather than failing hard.
+        try:
+            candidate = str(EPHEMERAL_ARENA_AUTH_TOKEN or "").strip()
+        except Exception:
+            candidate = ""
+        if (
+            candidate
+            and (not exclude_tokens or candidate not in exclude_tokens)
+            and is_probably_valid_arena_auth_token(candidate)
+            and not is_arena_auth_token_expired(candidate, skew_seconds=0)
+        ):
+            return candidate
+    raise HTTPException(status_code=500, detail="No more auth tokens available to try")
+
+
+def _prefer_ephemeral_over_expired(token: str, exclude_tokens: Optional[set], pool: Optional[AuthTokenPool]) -> str:
     # If we selected a token we can conclusively determine is expired, prefer a valid in-memory token
     # captured from the browser session (Camoufox/Chrome) rather than hammering upstream with 401s.
     try:
-        if token and is_arena_auth_token_expired(token, skew_seconds=0):
+        expired = (
+            pool.is_expired(token, skew_seconds=0)
+            if pool is not None
+            else is_arena_auth_token_expired(token, skew_seconds=0)
+        )
+        if token and expired:
             candidate = str(EPHEMERAL_ARENA_AUTH_TOKEN or "").strip()
             if (
                 candidate
@@ -4381,8 +6496,106 @@ async def get_current_session(request: Request):
 
 # --- API Key Authentication & Rate Limiting ---
 
-async def rate_limit_api_key(key: str = Depends(API_KEY_HEADER)):
-    config = get_config()
+class _RateLimitState:
+    """
+    Per-API-key limiter state: sliding-window logs for the default limits, the GCRA theoretical arrival time for
+    keys with an explicit `burst`, plus an hourly request histogram.
+    """
+
+    __slots__ = ("minute_tat", "minute_log", "day_log", "hourly_counts", "hourly_slots")
+
+    def __init__(self) -> None:
+        self.minute_tat = 0.0
+        # Admission times within the current window, oldest first (never longer than the limit).
+        self.minute_log: deque = deque()
+        self.day_log: deque = deque()
+        # Ring buffer of request counts for the last 24 hours (used by the dashboard's activity counter).
+        self.hourly_counts = [0] * 24
+        self.hourly_slots = [-1] * 24
+
+    def record_hit(self, now_epoch: float) -> None:
+        slot = int(now_epoch // 3600)
+        idx = slot % 24
+        if self.hourly_slots[idx] != slot:
+            self.hourly_slots[idx] = slot
+            self.hourly_counts[idx] = 0
+        self.hourly_counts[idx] += 1
+
+    def requests_last_24h(self, now_epoch: float) -> int:
+        current = int(now_epoch // 3600)
+        return sum(c for c, s in zip(self.hourly_counts, self.hourly_slots) if 0 <= current - s < 24)
+
+
+def _gcra_check(tat: float, now: float, *, limit: int, window_seconds: float, burst: int) -> tuple:
+    """
+    Generic cell rate algorithm (a token bucket stored as one timestamp).
+
+    Returns (allowed, new_tat, remaining, retry_after_seconds, reset_after_seconds).
+    """
+    interval = float(window_seconds) / float(max(1, limit))
+    capacity = float(max(1, burst)) * interval
+    base = max(float(tat), now)
+    new_tat = base + interval
+    # Small slack so float rounding in `base + interval - now` can't reject a request that exactly fits.
+    if new_tat - now > capacity + 1e-9:
+        retry_after = (new_tat - now) - capacity
+        remaining = 0
+        return False, float(tat), remaining, retry_after, base - now
+    remaining = int((capacity - (new_tat - now)) // interval)
+    return True, new_tat, remaining, 0.0, new_tat - now
+
+
+def _sliding_window_check(log: deque, now: float, *, limit: int, window_seconds: float) -> tuple:
+    """
+    Exact sliding-window limit: at most `limit` admissions in any `window_seconds` (amortized O(1); the log never
+    holds more than `limit` entries). Records the admission in `log` when allowed.
+
+    Returns (allowed, remaining, retry_after_seconds, reset_after_seconds).
+    """
+    window = float(window_seconds)
+    while log and now - log[0] >= window:
+        log.popleft()
+    if len(log) >= int(limit):
+        return False, 0, log[0] + window - now, log[-1] + window - now
+    log.append(now)
+    return True, int(limit) - len(log), 0.0, window
+
+
+def _get_api_key_index(config: dict) -> dict:
+    global _API_KEY_INDEX
+    generation = _CONFIG_CACHE_GENERATION
+    if _API_KEY_INDEX[0] == generation and generation > 0:
+        return _API_KEY_INDEX[1]
+    index: dict[str, dict] = {}
+    for entry in config.get("api_keys", []) or []:
+        if isinstance(entry, dict) and entry.get("key") and entry["key"] not in index:
+            index[entry["key"]] = entry
+    _API_KEY_INDEX = (generation, index)
+    return index
+
+
+def _coerce_positive_int(value: object, default: int) -> int:
+    try:
+        number = int(value)
+    except Exception:
+        return default
+    return number if number > 0 else default
+
+
+def _rate_limit_headers(limit: int, remaining: int, reset_after: float, day_limit: int, day_remaining: int) -> dict:
+    headers = {
+        "X-RateLimit-Limit": str(int(limit)),
+        "X-RateLimit-Remaining": str(max(0, int(remaining))),
+        "X-RateLimit-Reset": str(max(0, int(math.ceil(reset_after)))),
+    }
+    if day_limit > 0:
+        headers["X-RateLimit-Limit-Day"] = str(int(day_limit))
+        headers["X-RateLimit-Remaining-Day"] = str(max(0, int(day_remaining)))
+    return headers
+
+
+async def rate_limit_api_key(request: Request, key: str = Depends(API_KEY_HEADER)):
+    config = _get_config_snapshot()
     api_keys = config.get("api_keys", [])
 
     api_key_str = None
@@ -4397,32 +6610,295 @@ async def rate_limit_api_key(key: str = Depends(API_KEY_HEADER)):
     if not api_key_str:
         api_key_str = api_keys[0]["key"]
 
-    key_data = next((k for k in api_keys if k["key"] == api_key_str), None)
+    key_data = _get_api_key_index(config).get(api_key_str)
     if not key_data:
         raise HTTPException(status_code=401, detail="Invalid API Key.")
 
-    # Rate Limiting
-    rate_limit = key_data.get("rpm", 60)
-    current_time = time.time()
-
-    # Clean up old timestamps (older than 60 seconds)
-    api_key_usage[api_key_str] = [t for t in api_key_usage[api_key_str] if current_time - t < 60]
-
-    if len(api_key_usage[api_key_str]) >= rate_limit:
-        # Calculate seconds until oldest request expires (60 seconds window)
-        oldest_timestamp = min(api_key_usage[api_key_str])
-        retry_after = int(60 - (current_time - oldest_timestamp))
-        retry_after = max(1, retry_after)  # At least 1 second
-
+    # Rate Limiting: by default no 60s window sees more than `rpm` requests (and no 24h window more than the
+    # optional `rpd`). Setting `burst` opts a key into a constant-time GCRA instead: `burst` requests may arrive
+    # back to back, with the steady rate refilling meanwhile, so the first minute after idle can admit
+    # `rpm + burst - 1`.
+    rate_limit = _coerce_positive_int(key_data.get("rpm", 60), 60)
+    burst = _coerce_positive_int(key_data.get("burst"), 0)
+    day_limit = _coerce_positive_int(key_data.get("rpd"), 0)
+    now = time.monotonic()
+
+    state = api_key_usage.get(api_key_str)
+    if state is None:
+        state = _RateLimitState()
+        api_key_usage[api_key_str] = state
+
+    minute_tat = state.minute_tat
+    if burst:
+        allowed, minute_tat, remaining, retry_after, reset_after = _gcra_check(
+            state.minute_tat, now, limit=rate_limit, window_seconds=60.0, burst=burst
+        )
+    else:
+        allowed, remaining, retry_after, reset_after = _sliding_window_check(
+            state.minute_log, now, limit=rate_limit, window_seconds=60.0
+        )
+    day_remaining = 0
+    if allowed and day_limit > 0:
+        day_allowed, day_remaining, day_retry_after, _ = _sliding_window_check(
+            state.day_log, now, limit=day_limit, window_seconds=86400.0
+        )
+        if not day_allowed:
+            allowed = False
+            retry_after = day_retry_after
+            remaining = max(0, int(remaining) + 1)
+            if not burst:
+                # Undo the per-minute admission recorded above.
+                state.minute_log.pop()
+
+    if not allowed:
+        headers = _rate_limit_headers(rate_limit, remaining, reset_after, day_limit, day_remaining)
+        headers["Retry-After"] = str(max(1, int(math.ceil(retry_after))))  # At least 1 second
         raise HTTPException(
             status_code=429,
             detail="Rate limit exceeded. Please try again later.",
-            headers={"Retry-After": str(retry_after)}
+            headers=headers,
         )
 
-    api_key_usage[api_key_str].append(current_time)
+    state.minute_tat = minute_tat
+    state.record_hit(time.time())
+    # Surfaced on the final response by `RateLimitHeadersMiddleware`.
+    request.state.rate_limit_headers = _rate_limit_headers(
+        rate_limit, remaining, reset_after, day_limit, day_remaining
+    )
+
+    return dict(key_data)
+
+
+class RateLimitHeadersMiddleware:
+    """ASGI middleware that adds the `X-RateLimit-*` headers computed by `rate_limit_api_key` to responses."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope.get("type") != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def _send(message):
+            if message.get("type") == "http.response.start":
+                state = scope.get("state")
+                extra = state.get("rate_limit_headers") if isinstance(state, dict) else None
+                if isinstance(extra, dict) and extra:
+                    raw_headers = list(message.get("headers") or [])
+                    present = {bytes(name).lower() for name, _ in raw_headers}
+                    for name, value in extra.items():
+                        encoded = str(name).lower().encode("latin-1")
+                        if encoded not in present:
+                            raw_headers.append((encoded, str(value).encode("latin-1")))
+                    message = dict(message)
+                    message["headers"] = raw_headers
+            await send(message)
+
+        await self.app(scope, receive, _send)
+
+
+app.add_middleware(RateLimitHeadersMiddleware)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a chat request can't be admitted (queue full or queue wait timed out)."""
+
+    def __init__(self, reason: str, retry_after: int = 1) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = max(1, int(retry_after))
+
+
+class ChatAdmissionController:
+    """
+    Global + per-API-key in-flight limits for chat completions with a round-robin admission queue.
+
+    Waiters are queued per key and granted one key at a time, so a key with many queued requests can't starve
+    others. A limit of 0 means "unlimited".
+    """
+
+    def __init__(self) -> None:
+        self.in_flight_total = 0
+        self.in_flight_by_key: dict[str, int] = defaultdict(int)
+        self._waiters: dict[str, deque] = {}
+        self._rotation: deque = deque()
+        self._queued = 0
+        self.stats: dict[str, float] = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected_queue_full": 0,
+            "rejected_timeout": 0,
+            "queue_waits": 0,
+            "queue_wait_total_ms": 0.0,
+            "queue_wait_max_ms": 0.0,
+        }
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queued
+
+    def _can_admit(self, key: str, global_limit: int, per_key_limit: int) -> bool:
+        if global_limit > 0 and self.in_flight_total >= global_limit:
+            return False
+        if per_key_limit > 0 and self.in_flight_by_key.get(key, 0) >= per_key_limit:
+            return False
+        return True
+
+    def _grant(self, key: str) -> None:
+        self.in_flight_total += 1
+        self.in_flight_by_key[key] += 1
+        self.stats["admitted"] += 1
+
+    def _dispatch(self, global_limit: int) -> None:
+        # One pass over the keys with waiters (round-robin), granting at most one waiter per key per pass.
+        progressed = True
+        while progressed and self._rotation:
+            progressed = False
+            for _ in range(len(self._rotation)):
+                if global_limit > 0 and self.in_flight_total >= global_limit:
+                    return
+                key = self._rotation[0]
+                self._rotation.rotate(-1)
+                waiters = self._waiters.get(key)
+                while waiters and waiters[0][0].done():
+                    waiters.popleft()
+                    self._queued -= 1
+                if not waiters:
+                    self._waiters.pop(key, None)
+                    self._rotation.remove(key)
+                    continue
+                future, per_key_limit = waiters[0]
+                if not self._can_admit(key, global_limit, per_key_limit):
+                    continue
+                waiters.popleft()
+                self._queued -= 1
+                if not waiters:
+                    self._waiters.pop(key, None)
+                    self._rotation.remove(key)
+                self._grant(key)
+                future.set_result(True)
+                progressed = True
+
+    def _discard_waiter(self, key: str, future: "asyncio.Future") -> None:
+        future.cancel()
+        waiters = self._waiters.get(key)
+        if not waiters:
+            return
+        for idx, (queued_future, _) in enumerate(waiters):
+            if queued_future is future:
+                del waiters[idx]
+                self._queued -= 1
+                break
+        if not waiters:
+            self._waiters.pop(key, None)
+            try:
+                self._rotation.remove(key)
+            except ValueError:
+                pass
+
+    def _record_wait(self, wait_ms: float) -> None:
+        self.stats["queue_waits"] += 1
+        self.stats["queue_wait_total_ms"] += wait_ms
+        if wait_ms > self.stats["queue_wait_max_ms"]:
+            self.stats["queue_wait_max_ms"] = wait_ms
+
+    async def acquire(
+        self,
+        key: str,
+        *,
+        global_limit: int,
+        per_key_limit: int,
+        max_queue_depth: int,
+        timeout_seconds: float,
+    ) -> float:
+        """Wait for a slot; returns the queue wait in milliseconds. Raises `AdmissionRejected`."""
+        # Waiters still queued are blocked by their own limits, so a key without waiters may skip the queue.
+        if key not in self._waiters and self._can_admit(key, global_limit, per_key_limit):
+            self._grant(key)
+            return 0.0
+
+        if self._queued >= max(0, int(max_queue_depth)):
+            self.stats["rejected_queue_full"] += 1
+            raise AdmissionRejected("Too many queued requests. Please try again later.")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        started = time.monotonic()
+        if key not in self._waiters:
+            self._waiters[key] = deque()
+            self._rotation.append(key)
+        self._waiters[key].append((future, per_key_limit))
+        self._queued += 1
+        self.stats["queued"] += 1
+        self._dispatch(global_limit)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # Granted right as the timeout fired: keep the slot.
+                pass
+            else:
+                self._discard_waiter(key, future)
+                self.stats["rejected_timeout"] += 1
+                raise AdmissionRejected("Timed out waiting for a free request slot.", int(timeout_seconds) or 1)
+        except BaseException:
+            if future.done() and not future.cancelled():
+                self.release(key, global_limit=global_limit)
+            else:
+                self._discard_waiter(key, future)
+            raise
+
+        wait_ms = (time.monotonic() - started) * 1000.0
+        self._record_wait(wait_ms)
+        return wait_ms
+
+    def release(self, key: str, *, global_limit: int = 0) -> None:
+        self.in_flight_total = max(0, self.in_flight_total - 1)
+        remaining = self.in_flight_by_key.get(key, 0) - 1
+        if remaining > 0:
+            self.in_flight_by_key[key] = remaining
+        else:
+            self.in_flight_by_key.pop(key, None)
+        self._dispatch(global_limit)
+
+    def snapshot(self) -> dict:
+        waits = int(self.stats["queue_waits"])
+        return {
+            "in_flight": self.in_flight_total,
+            "in_flight_keys": len(self.in_flight_by_key),
+            "queue_depth": self._queued,
+            "admitted": int(self.stats["admitted"]),
+            "queued": int(self.stats["queued"]),
+            "rejected_queue_full": int(self.stats["rejected_queue_full"]),
+            "rejected_timeout": int(self.stats["rejected_timeout"]),
+            "queue_wait_avg_ms": round(self.stats["queue_wait_total_ms"] / waits, 1) if waits else 0.0,
+            "queue_wait_max_ms": round(self.stats["queue_wait_max_ms"], 1),
+        }
+
+
+CHAT_ADMISSION = ChatAdmissionController()
+
 
-    return key_data
+def _get_chat_admission_limits(api_key: dict) -> tuple[int, int, int, float]:
+    """(global limit, per-key limit, max queue depth, queue timeout seconds) from config + the API key entry."""
+    config = _get_config_snapshot()
+    global_limit = _coerce_positive_int(config.get("max_concurrent_streams"), 0)
+    per_key_limit = _coerce_positive_int(config.get("max_concurrent_streams_per_key"), 0)
+    if isinstance(api_key, dict) and api_key.get("max_concurrent") is not None:
+        per_key_limit = _coerce_positive_int(api_key.get("max_concurrent"), per_key_limit)
+    # 0 is meaningful here: reject as soon as no slot is free instead of queueing.
+    try:
+        max_queue_depth = int(config.get("stream_admission_queue_depth", 64))
+    except Exception:
+        max_queue_depth = 64
+    try:
+        timeout_seconds = float(config.get("stream_admission_timeout_seconds", 30))
+    except Exception:
+        timeout_seconds = 30.0
+    timeout_seconds = max(0.1, min(timeout_seconds, 600.0))
+    return global_limit, per_key_limit, max(0, min(max_queue_depth, 10_000)), timeout_seconds
 
 # --- Core Logic ---
 
@@ -4435,6 +6911,7 @@ async def get_initial_data():
             # Set up route interceptor BEFORE navigating
             debug_print("  🎯 Setting up route interceptor for JS chunks...")
             captured_responses = []
+            resource_policy = _get_resource_blocking_policy(get_config())
             
             async def capture_js_route(route):
                 """Intercept and capture JS chunk responses"""
@@ -4457,8 +6934,8 @@ async def get_initial_data():
                         # If something fails, just continue normally
                         await route.continue_()
                 else:
-                    # Not a JS chunk, just continue normally
-                    await route.continue_()
+                    # Not a JS chunk: continue, unless it's a resource the bridge doesn't need
+                    await _continue_or_block_route(route, resource_policy)
             
             # Register the route interceptor
             await page.route('**/*', capture_js_route)
@@ -4604,18 +7081,19 @@ async def get_initial_data():
                             continue
                 
                 # Save the action IDs to config
+                action_updates = {}
                 if upload_action_id:
-                    config["next_action_upload"] = upload_action_id
+                    action_updates["next_action_upload"] = upload_action_id
                 if signed_url_action_id:
-                    config["next_action_signed_url"] = signed_url_action_id
+                    action_updates["next_action_signed_url"] = signed_url_action_id
                 
                 if upload_action_id and signed_url_action_id:
-                    save_config(config)
+                    _save_config_updates(action_updates)
                     debug_print(f"\n✅ Saved both Next-Action IDs to config")
                     debug_print(f"   Upload: {upload_action_id}")
                     debug_print(f"   Signed URL: {signed_url_action_id}")
                 elif upload_action_id or signed_url_action_id:
-                    save_config(config)
+                    _save_config_updates(action_updates)
                     debug_print(f"\n⚠️ Saved partial Next-Action IDs:")
                     if upload_action_id:
                         debug_print(f"   Upload: {upload_action_id}")
@@ -4657,13 +7135,14 @@ async def get_initial_data():
                     if action and not discovered_action:
                         discovered_action = action
 
+                recaptcha_updates = {}
                 if discovered_sitekey:
-                    config["recaptcha_sitekey"] = discovered_sitekey
+                    recaptcha_updates["recaptcha_sitekey"] = discovered_sitekey
                 if discovered_action:
-                    config["recaptcha_action"] = discovered_action
+                    recaptcha_updates["recaptcha_action"] = discovered_action
 
-                if discovered_sitekey or discovered_action:
-                    save_config(config)
+                if recaptcha_updates:
+                    _save_config_updates(recaptcha_updates)
                     debug_print("✅ Saved reCAPTCHA params to config")
                     if discovered_sitekey:
                         debug_print(f"   Sitekey: {discovered_sitekey[:20]}...")
@@ -4719,6 +7198,92 @@ async def periodic_refresh_task():
             # Continue the loop even if there's an error
             continue
 
+# Warm-up runs after the app starts serving; each component reports pending/running/ready/failed.
+STARTUP_COMPONENT_NAMES = ("initial_data", "auth_refresh", "proxy_worker")
+STARTUP_COMPONENTS: Dict[str, dict] = {}
+_STARTUP_WARMUP_TASK: Optional["asyncio.Task"] = None
+_PROCESS_STARTED_AT = time.time()
+
+
+def _set_startup_component(name: str, status: str, error: Optional[str] = None) -> None:
+    entry = STARTUP_COMPONENTS.setdefault(
+        name, {"status": "pending", "started_at": None, "finished_at": None, "error": None}
+    )
+    if entry["status"] == status:
+        return
+    now = time.time()
+    entry["status"] = status
+    if status == "running":
+        entry["started_at"] = now
+        entry["finished_at"] = None
+        entry["error"] = None
+    elif status in ("ready", "failed"):
+        entry["finished_at"] = now
+        entry["error"] = error
+
+
+def _reset_startup_components() -> None:
+    STARTUP_COMPONENTS.clear()
+    for name in STARTUP_COMPONENT_NAMES:
+        _set_startup_component(name, "pending")
+
+
+def get_startup_readiness() -> dict:
+    """Ready once models are loaded (persisted or refreshed) and the internal proxy worker has a browser up."""
+    components = {
+        name: dict(STARTUP_COMPONENTS.get(name) or {"status": "pending", "started_at": None, "finished_at": None, "error": None})
+        for name in STARTUP_COMPONENT_NAMES
+    }
+    try:
+        models_loaded = bool(get_models())
+    except Exception:
+        models_loaded = False
+    ready = models_loaded and components["proxy_worker"]["status"] == "ready"
+    return {"ready": ready, "models_loaded": models_loaded, "components": components}
+
+
+async def startup_warmup_task():
+    """Browser warm-up, model refresh and proxy launch, kept off the startup path so the API serves immediately."""
+
+    async def _initial_data() -> None:
+        _set_startup_component("initial_data", "running")
+        try:
+            await get_initial_data()
+        except Exception as e:
+            debug_print(f"❌ Error during initial data warm-up: {e}")
+            _set_startup_component("initial_data", "failed", str(e))
+            return
+        _set_startup_component("initial_data", "ready")
+
+    async def _proxy_worker() -> None:
+        # Best-effort: if the user-configured auth cookies are expired base64 sessions, try to refresh one so the
+        # Camoufox proxy worker can start with a valid `arena-auth-prod-v1` cookie.
+        _set_startup_component("auth_refresh", "running")
+        try:
+            refreshed = await maybe_refresh_expired_auth_tokens()
+        except Exception as e:
+            refreshed = None
+            _set_startup_component("auth_refresh", "failed", str(e))
+        else:
+            _set_startup_component("auth_refresh", "ready")
+        if refreshed:
+            debug_print("🔄 Refreshed arena-auth-prod-v1 session (startup).")
+
+        _set_startup_component("proxy_worker", "running")
+        try:
+            # Farm mode runs the proxy browsers in child processes; otherwise keep the in-process worker. Either
+            # way the component turns ready once a browser is actually up (see `_mark_camoufox_proxy_ready`).
+            if not CAMOUFOX_PROXY_FARM.start(get_config()):
+                asyncio.create_task(camoufox_proxy_worker())
+        except Exception as e:
+            debug_print(f"❌ Error starting Camoufox proxy worker: {e}")
+            _set_startup_component("proxy_worker", "failed", str(e))
+
+    # The proxy worker launches its own browser and clears Cloudflare itself, so it doesn't wait for the
+    # initial-data browser.
+    await asyncio.gather(_initial_data(), _proxy_worker())
+
+
 async def startup_event():
     # Prevent unit tests (TestClient/ASGITransport) from clobbering the user's real config.json
     # and running slow browser/network startup routines.
@@ -4726,6 +7291,10 @@ async def startup_event():
         return
 
     try:
+        # Open keep-alive connections to LMArena while the rest of startup runs.
+        if bool(get_config().get("http_prewarm_enabled", True)):
+            asyncio.create_task(prewarm_shared_http_client())
+
         # Ensure config and models files exist
         config = get_config()
         if not config.get("api_keys"):
@@ -4742,18 +7311,11 @@ async def startup_event():
         # Load usage stats from config
         load_usage_stats()
         
-        # 1. First, get initial data (cookies, models, etc.)
-        # We await this so we have the cookie BEFORE trying reCAPTCHA
-        await get_initial_data() 
-
-        # Best-effort: if the user-configured auth cookies are expired base64 sessions, try to refresh one so the
-        # Camoufox proxy worker can start with a valid `arena-auth-prod-v1` cookie.
-        try:
-            refreshed = await maybe_refresh_expired_auth_tokens()
-        except Exception:
-            refreshed = None
-        if refreshed:
-            debug_print("🔄 Refreshed arena-auth-prod-v1 session (startup).")
+        # 1. Serve from the persisted models/config right away; initial data (cookies, models, etc.), auth refresh
+        # and the proxy worker warm up in the background. Progress is reported by /api/v1/health/ready.
+        global _STARTUP_WARMUP_TASK
+        _reset_startup_components()
+        _STARTUP_WARMUP_TASK = asyncio.create_task(startup_warmup_task())
         
         # 2. Do not prefetch reCAPTCHA at startup.
         # The internal Camoufox userscript-proxy mints tokens in-page for strict models, and non-strict
@@ -4761,20 +7323,55 @@ async def startup_event():
 
         # 3. Start background tasks
         asyncio.create_task(periodic_refresh_task())
+        global _USAGE_STATS_FLUSH_TASK, _AUTH_TOKEN_REFRESH_TASK
+        _USAGE_STATS_FLUSH_TASK = asyncio.create_task(usage_stats_flush_task())
+        _AUTH_TOKEN_REFRESH_TASK = asyncio.create_task(auth_token_refresh_task())
+        global _RECAPTCHA_POOL_REFILL_TASK
+        _RECAPTCHA_POOL_REFILL_TASK = asyncio.create_task(recaptcha_pool_refill_task())
+        global _BROWSER_FETCH_POOL_REAPER_TASK
+        _BROWSER_FETCH_POOL_REAPER_TASK = asyncio.create_task(browser_fetch_pool_reaper_task())
         
         # Mark userscript proxy as active at startup to allow immediate delegation
-        # to the internal Camoufox proxy worker.
+        # to the internal Camoufox proxy worker (jobs queue until it is up).
         global last_userscript_poll, USERSCRIPT_PROXY_LAST_POLL_AT
         now = time.time()
         last_userscript_poll = now
         USERSCRIPT_PROXY_LAST_POLL_AT = now
         
-        asyncio.create_task(camoufox_proxy_worker())
-        
     except Exception as e:
         debug_print(f"❌ Error during startup: {e}")
         # Continue anyway - server should still start
 
+async def shutdown_event():
+    global _STARTUP_WARMUP_TASK
+    warmup_task = _STARTUP_WARMUP_TASK
+    _STARTUP_WARMUP_TASK = None
+    await _cancel_background_task(warmup_task)
+    global _USAGE_STATS_FLUSH_TASK, _AUTH_TOKEN_REFRESH_TASK
+    task = _USAGE_STATS_FLUSH_TASK
+    _USAGE_STATS_FLUSH_TASK = None
+    await _cancel_background_task(task)
+    refresh_task = _AUTH_TOKEN_REFRESH_TASK
+    _AUTH_TOKEN_REFRESH_TASK = None
+    await _cancel_background_task(refresh_task)
+    global _RECAPTCHA_POOL_REFILL_TASK
+    refill_task = _RECAPTCHA_POOL_REFILL_TASK
+    _RECAPTCHA_POOL_REFILL_TASK = None
+    await _cancel_background_task(refill_task)
+    global _BROWSER_FETCH_POOL_REAPER_TASK
+    reaper_task = _BROWSER_FETCH_POOL_REAPER_TASK
+    _BROWSER_FETCH_POOL_REAPER_TASK = None
+    await _cancel_background_task(reaper_task)
+    await RECAPTCHA_MINTING_SESSION.close()
+    await CHROME_FETCH_POOL.close()
+    await CAMOUFOX_FETCH_POOL.close()
+    await CAMOUFOX_PROXY_FARM.close()
+    await USERSCRIPT_PROXY_SCHEDULER.close()
+    if os.environ.get("PYTEST_CURRENT_TEST"):
+        return
+    # Persist whatever accumulated since the last periodic flush.
+    flush_usage_stats()
+
 # --- UI Endpoints (Login/Dashboard) ---
 
 @app.get("/", response_class=HTMLResponse)
@@ -4985,7 +7582,8 @@ async def dashboard(session: str = Depends(get_current_session)):
     cf_class = "status-good" if config.get("cf_clearance") else "status-bad"
     
     # Get recent activity count (last 24 hours)
-    recent_activity = sum(1 for timestamps in api_key_usage.values() for t in timestamps if time.time() - t < 86400)
+    now_epoch = time.time()
+    recent_activity = sum(state.requests_last_24h(now_epoch) for state in api_key_usage.values())
 
     return f"""
         <!DOCTYPE html>
@@ -5686,6 +8284,18 @@ async def userscript_poll(request: Request):
 
     _cleanup_userscript_proxy_jobs(cfg)
 
+    # Registered pollers get up to `capacity` jobs per poll, routed by the scheduler.
+    poller_id = str(data.get("poller_id") or "").strip()
+    if poller_id:
+        USERSCRIPT_PROXY_SCHEDULER.register(poller_id, data.get("capacity"))
+        claimed = await USERSCRIPT_PROXY_SCHEDULER.acquire(poller_id, float(timeout_seconds))
+        if not claimed:
+            return Response(status_code=204)
+        return {
+            "poller_id": poller_id,
+            "jobs": [{"job_id": job_id, "payload": job.get("payload") or {}} for job_id, job in claimed],
+        }
+
     queue = _get_userscript_proxy_queue()
     end = time.time() + float(timeout_seconds)
     while True:
@@ -5697,21 +8307,9 @@ async def userscript_poll(request: Request):
         except asyncio.TimeoutError:
             return Response(status_code=204)
 
-        job = _USERSCRIPT_PROXY_JOBS.get(str(job_id))
-        if not isinstance(job, dict):
+        job = _claim_userscript_proxy_job(job_id)
+        if job is None:
             continue
-        # Mark as picked up as soon as we hand the job to a poller so the server-side pickup timeout
-        # doesn't trip while the poller/browser is starting.
-        try:
-            picked = job.get("picked_up_event")
-            if isinstance(picked, asyncio.Event) and not picked.is_set():
-                picked.set()
-                if not job.get("picked_up_at_monotonic"):
-                    job["picked_up_at_monotonic"] = time.monotonic()
-            if str(job.get("phase") or "") == "queued":
-                job["phase"] = "picked_up"
-        except Exception:
-            pass
         return {"job_id": str(job_id), "payload": job.get("payload") or {}}
 
 
@@ -5776,17 +8374,193 @@ async def userscript_push(request: Request):
             status_event.set()
         await job["lines_queue"].put(None)
 
+    USERSCRIPT_PROXY_SCHEDULER.observe(job_id, job, data)
+    _schedule_userscript_proxy_job_expiry(job_id, job)
     return {"status": "ok"}
 
+USERSCRIPT_PROXY_WS_STATS: Dict[str, int] = {
+    "connections": 0,
+    "active_connections": 0,
+    "jobs_dispatched": 0,
+    "frames_received": 0,
+}
+# Client frames that carry job updates; all of them map onto a `push_proxy_chunk` payload.
+_USERSCRIPT_PROXY_WS_CHUNK_TYPES = ("chunk", "status", "headers", "lines", "error", "done")
+
+
+@app.websocket("/api/v1/userscript/ws")
+async def userscript_ws(websocket: WebSocket):
+    """
+    Persistent userscript-proxy transport: job dispatch plus status/header/line frames for many concurrent jobs
+    over one connection. `/api/v1/userscript/poll` and `/push` remain as the fallback.
+
+    Client -> server: {"type": "hello", "secret", "max_jobs", "poller_id"?} first, then job frames
+    ({"type": "lines" | "status" | "headers" | "error" | "done" | "chunk", "job_id", "seq", ...push fields}),
+    "ping"/"pong". Any frame with an "id" is acknowledged with {"type": "ack", "id"}.
+    Server -> client: "welcome", {"type": "job", "job_id", "payload"}, "ping"/"pong", "ack".
+    The connection is a `USERSCRIPT_PROXY_SCHEDULER` poller with capacity `max_jobs`.
+    """
+    await websocket.accept()
+    cfg = get_config()
+    try:
+        hello = json.loads(await asyncio.wait_for(websocket.receive_text(), timeout=10.0))
+    except Exception:
+        hello = None
+    if not isinstance(hello, dict) or hello.get("type") != "hello":
+        await websocket.close(code=1002)
+        return
+    provided = websocket.headers.get("X-LMBridge-Secret") or hello.get("secret")
+    if not _userscript_proxy_secret_ok(str(provided) if provided is not None else None, cfg):
+        await websocket.close(code=1008)
+        return
+
+    max_jobs = max(1, min(_coerce_positive_int(hello.get("max_jobs"), 4), 32))
+    try:
+        heartbeat_seconds = float(cfg.get("userscript_proxy_ws_heartbeat_seconds", 15))
+    except (TypeError, ValueError):
+        heartbeat_seconds = 15.0
+    heartbeat_seconds = max(1.0, min(heartbeat_seconds, 60.0))
+
+    poller_id = str(hello.get("poller_id") or "").strip() or f"ws-{uuid.uuid4().hex[:12]}"
+    USERSCRIPT_PROXY_SCHEDULER.register(poller_id, max_jobs)
+
+    send_lock = asyncio.Lock()
+    state = {"last_seen": time.monotonic()}
+
+    async def _send(message: dict) -> None:
+        async with send_lock:
+            await websocket.send_text(json.dumps(message, ensure_ascii=False))
+
+    async def _dispatch() -> None:
+        while True:
+            claimed = await USERSCRIPT_PROXY_SCHEDULER.acquire(poller_id, 30.0)
+            for job_id, job in claimed:
+                await _send({"type": "job", "job_id": job_id, "payload": job.get("payload") or {}})
+                USERSCRIPT_PROXY_WS_STATS["jobs_dispatched"] += 1
+
+    async def _heartbeat() -> None:
+        while True:
+            await asyncio.sleep(heartbeat_seconds)
+            if time.monotonic() - state["last_seen"] > heartbeat_seconds * 3:
+                debug_print("⚠️ Userscript proxy WebSocket missed heartbeats; closing.")
+                await websocket.close(code=1011)
+                return
+            await _send({"type": "ping", "ts": time.time()})
+
+    _touch_userscript_poll()
+    USERSCRIPT_PROXY_WS_STATS["connections"] += 1
+    USERSCRIPT_PROXY_WS_STATS["active_connections"] += 1
+    await _send({"type": "welcome", "max_jobs": max_jobs, "heartbeat_seconds": heartbeat_seconds})
+    tasks = [asyncio.create_task(_dispatch()), asyncio.create_task(_heartbeat())]
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            state["last_seen"] = time.monotonic()
+            _touch_userscript_poll()
+            USERSCRIPT_PROXY_SCHEDULER.touch(poller_id)
+            USERSCRIPT_PROXY_WS_STATS["frames_received"] += 1
+            try:
+                message = json.loads(raw)
+            except Exception:
+                continue
+            if not isinstance(message, dict):
+                continue
+
+            kind = str(message.get("type") or "")
+            if kind == "ping":
+                await _send({"type": "pong", "ts": time.time()})
+            elif kind in _USERSCRIPT_PROXY_WS_CHUNK_TYPES:
+                job_id = str(message.get("job_id") or "").strip()
+                chunk = {k: v for k, v in message.items() if k not in ("type", "job_id", "id")}
+                if kind == "done":
+                    chunk["done"] = True
+                if job_id:
+                    await deliver_proxy_chunk(job_id, chunk)
+
+            if message.get("id") is not None:
+                await _send({"type": "ack", "id": message.get("id")})
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        USERSCRIPT_PROXY_WS_STATS["active_connections"] -= 1
+        for task in tasks:
+            await _cancel_background_task(task)
+        # Unstarted jobs go back on the queue; streaming ones fail so their requests can fall back.
+        await USERSCRIPT_PROXY_SCHEDULER.drop(poller_id, "userscript proxy websocket disconnected")
+
+
+def _set_userscript_proxy_job_phase(job_id: str, job: dict, phase: str) -> None:
+    job["phase"] = phase
+    if phase == "fetch" and not job.get("upstream_started_at_monotonic"):
+        job["upstream_started_at_monotonic"] = time.monotonic()
+    _schedule_userscript_proxy_job_expiry(job_id, job)
+    sink = _CAMOUFOX_PROXY_FARM_CHUNK_SINK
+    if sink is not None:
+        # The request handler watches the parent's copy of the job (preflight timeouts depend on the phase).
+        try:
+            sink.put((job_id, {"phase": phase}))
+        except Exception:
+            pass
+
+
+async def deliver_proxy_chunk(jid, d) -> None:
+    """
+    Feed a chunk from the Camoufox proxy's in-page fetch script into `push_proxy_chunk`, in `seq` order.
+
+    Binding calls and console events can be dispatched out of order; chunks that arrive early wait in the job's
+    reorder buffer until the gap is filled. Chunks without a `seq` are delivered as-is.
+    """
+    job_id = str(jid or "").strip()
+    seq = d.pop("seq", None) if isinstance(d, dict) else None
+    job = _USERSCRIPT_PROXY_JOBS.get(job_id)
+    if not isinstance(seq, int) or not isinstance(job, dict):
+        await push_proxy_chunk(job_id, d)
+        return
+
+    pending = job.setdefault("_proxy_seq_pending", {})
+    if seq < int(job.get("_proxy_seq_next") or 1) or seq in pending:
+        # Already delivered or buffered (a client re-sent it after a missed ack).
+        return
+    pending[seq] = d
+    if job.get("_proxy_seq_draining"):
+        # Whoever is draining will pick this one up once its turn comes.
+        return
+    job["_proxy_seq_draining"] = True
+    try:
+        next_seq = int(job.get("_proxy_seq_next") or 1)
+        while next_seq in pending:
+            chunk = pending.pop(next_seq)
+            next_seq += 1
+            job["_proxy_seq_next"] = next_seq
+            await push_proxy_chunk(job_id, chunk)
+    finally:
+        job["_proxy_seq_draining"] = False
+
+
 async def push_proxy_chunk(jid, d) -> None:
     _touch_userscript_poll()
 
     job_id = str(jid or "").strip()
+    sink = _CAMOUFOX_PROXY_FARM_CHUNK_SINK
+    if sink is not None:
+        # Farm worker process: the job (and the client waiting on it) lives in the parent process.
+        if isinstance(d, dict) and d.get("done"):
+            _USERSCRIPT_PROXY_JOBS.pop(job_id, None)
+        try:
+            sink.put((job_id, d))
+        except Exception:
+            pass
+        return
+
     job = _USERSCRIPT_PROXY_JOBS.get(job_id)
     if not isinstance(job, dict):
         return
 
     if isinstance(d, dict):
+        phase = d.get("phase")
+        if isinstance(phase, str) and phase:
+            _set_userscript_proxy_job_phase(job_id, job, phase)
+
         fetch_started = d.get("upstream_fetch_started")
         if fetch_started is None:
             fetch_started = d.get("fetch_started")
@@ -5860,17 +8634,151 @@ async def push_proxy_chunk(jid, d) -> None:
             await job["lines_queue"].put(None)
             debug_print(f"🦊 Camoufox proxy job {job_id[:8]} done")
 
+        USERSCRIPT_PROXY_SCHEDULER.observe(job_id, job, d)
+        _schedule_userscript_proxy_job_expiry(job_id, job)
+
+
+CAMOUFOX_PROXY_TAB_MAX_FAILURES = 3
+CAMOUFOX_PROXY_TAB_STATS: Dict[str, int] = {
+    "tabs": 0,
+    "busy_tabs": 0,
+    "jobs_dispatched": 0,
+    "tabs_opened": 0,
+    "tab_recycles": 0,
+    "browser_recycles": 0,
+    "rss_mb": 0,
+    "js_heap_mb": 0,
+}
+
+# `performance.memory` is Chromium-only; Firefox/Camoufox returns null and the watchdog falls back to RSS.
+_JS_HEAP_USAGE_SCRIPT = "() => { const m = (window.performance || {}).memory; return m ? Number(m.usedJSHeapSize || 0) : null; }"
+
+
+def _playwright_driver_pid(manager) -> Optional[int]:
+    """PID of the Playwright driver behind an entered `AsyncCamoufox`/`async_playwright()` manager, if known."""
+    try:
+        pid = manager._connection._transport._proc.pid
+    except Exception:
+        return None
+    return int(pid) if isinstance(pid, int) and pid > 0 else None
+
+
+def _browser_process_rss_bytes(root_pid: int) -> Optional[int]:
+    """
+    Total resident memory of `root_pid` and its descendants (a Playwright driver and the browser it launched).
+    Uses psutil when installed, otherwise /proc; returns None where neither is available.
+    """
+    try:
+        import psutil  # type: ignore
+    except Exception:
+        psutil = None
+    if psutil is not None:
+        try:
+            root = psutil.Process(int(root_pid))
+            return int(sum(p.memory_info().rss for p in [root, *root.children(recursive=True)]))
+        except Exception:
+            return None
+
+    proc_root = Path("/proc")
+    if not proc_root.is_dir():
+        return None
+    children: Dict[int, List[int]] = defaultdict(list)
+    rss_pages: Dict[int, int] = {}
+    try:
+        entries = list(proc_root.iterdir())
+    except Exception:
+        return None
+    for entry in entries:
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            # The command name may contain spaces/parentheses; the numeric fields start after the last ')'.
+            fields = stat[stat.rindex(")") + 2 :].split()
+            pid = int(entry.name)
+            children[int(fields[1])].append(pid)
+            rss_pages[pid] = int(fields[21])
+        except Exception:
+            continue
+    if int(root_pid) not in rss_pages:
+        return None
+    try:
+        page_size = int(os.sysconf("SC_PAGE_SIZE"))
+    except Exception:
+        page_size = 4096
+    total = 0
+    pending = [int(root_pid)]
+    seen: set = set()
+    while pending:
+        pid = pending.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        total += rss_pages.get(pid, 0) * page_size
+        pending.extend(children.get(pid, []))
+    return total
+
+
+def _get_camoufox_proxy_watchdog_settings(config: dict) -> dict:
+    """Memory watchdog limits for the Camoufox proxy browser. A limit of 0 disables that check."""
+
+    def _limit(key: str, default: int) -> int:
+        try:
+            return max(0, int(config.get(key, default)))
+        except (TypeError, ValueError):
+            return default
+
+    try:
+        interval_seconds = max(1.0, float(config.get("camoufox_proxy_watchdog_interval_seconds", 30)))
+    except (TypeError, ValueError):
+        interval_seconds = 30.0
+    try:
+        drain_timeout_seconds = max(0.0, float(config.get("camoufox_proxy_drain_timeout_seconds", 180)))
+    except (TypeError, ValueError):
+        drain_timeout_seconds = 180.0
+    return {
+        "interval_seconds": interval_seconds,
+        "drain_timeout_seconds": drain_timeout_seconds,
+        "tab_max_jobs": _limit("camoufox_proxy_tab_max_jobs", 200),
+        "browser_max_jobs": _limit("camoufox_proxy_browser_max_jobs", 2000),
+        "max_rss_mb": _limit("camoufox_proxy_max_rss_mb", 3072),
+        "max_js_heap_mb": _limit("camoufox_proxy_max_js_heap_mb", 1024),
+    }
+
+
+def _get_camoufox_proxy_tab_settings(config: dict) -> dict:
+    try:
+        idle_seconds = max(0.0, float(config.get("camoufox_proxy_tab_idle_seconds", 120)))
+    except (TypeError, ValueError):
+        idle_seconds = 120.0
+    try:
+        chunk_flush_ms = max(0, min(int(config.get("camoufox_proxy_chunk_flush_ms", 16)), 1000))
+    except (TypeError, ValueError):
+        chunk_flush_ms = 16
+    return {
+        "chunk_flush_ms": chunk_flush_ms,
+        "chunk_flush_chars": _coerce_positive_int(config.get("camoufox_proxy_chunk_flush_chars"), 4096),
+        "max_tabs": max(1, min(_coerce_positive_int(config.get("camoufox_proxy_max_tabs"), 4), 16)),
+        "autoscale": bool(config.get("camoufox_proxy_autoscale_tabs", True)),
+        "idle_seconds": idle_seconds,
+    }
+
 
 async def camoufox_proxy_worker():
     """
     Internal Userscript-Proxy client backed by Camoufox.
     Maintains a SINGLE persistent browser instance to avoid crash loops and resource exhaustion.
+    Jobs run concurrently in up to `camoufox_proxy_max_tabs` tabs of that browser. A memory watchdog recycles
+    tabs (and, when needed, the whole browser) once they have served too many jobs or grown too large, after
+    letting their in-flight jobs finish.
     """
     # Mark the proxy as alive immediately
     _touch_userscript_poll()
     debug_print("🦊 Camoufox proxy worker started (Singleton Mode).")
 
     browser_cm = None
+    # Playwright driver of the current browser; the memory watchdog measures its process tree.
+    browser_pid: Optional[int] = None
     browser = None
     context = None
     page = None
@@ -5878,9 +8786,299 @@ async def camoufox_proxy_worker():
     proxy_recaptcha_sitekey = RECAPTCHA_SITEKEY
     proxy_recaptcha_action = RECAPTCHA_ACTION
     last_signup_attempt_at: float = 0.0
+
+    # Tabs: {"page", "task", "jobs", "failures", "last_used", "main", "draining"}. The launch page is the main tab; extra
+    # tabs are opened when a job arrives and every tab is busy (or up front when autoscaling is off).
+    tabs: list[dict] = []
+    tab_freed = asyncio.Event()
+    # Auth cookies live on the shared context: a job may only swap them once no other job's request is still
+    # waiting for response headers with a different cookie (same rule as `ChromeContextPool.begin_send`).
+    send_cond = asyncio.Condition()
+    sending = 0
+    sending_auth = ""
+    signup_running = False
+    # { job_id: Event } set once the job's fetch has response headers (or failed), releasing its send slot.
+    send_released: dict[str, asyncio.Event] = {}
+    # After a tab fails to open, stop scaling out for a while instead of bouncing jobs through the queue.
+    tab_open_backoff_until = 0.0
+    # Memory watchdog: jobs served by the current browser, and why/since when it is draining for a recycle.
+    browser_jobs = 0
+    browser_drain_reason = ""
+    browser_drain_started = 0.0
+    last_watchdog_at = 0.0
     
     queue = _get_userscript_proxy_queue()
 
+    def _on_console(message) -> None:
+        try:
+            attr = getattr(message, "text", None)
+            text = attr() if callable(attr) else attr
+        except Exception:
+            return
+        if not isinstance(text, str):
+            return
+        if not text.startswith("LM_BRIDGE_PROXY|"):
+            return
+        try:
+            _, jid, payload_json = text.split("|", 2)
+        except ValueError:
+            return
+        try:
+            payload = json.loads(payload_json)
+        except Exception:
+            payload = {"error": "proxy console payload decode error", "done": True}
+        _note_send_progress(str(jid), payload)
+        try:
+            asyncio.create_task(deliver_proxy_chunk(str(jid), payload))
+        except Exception:
+            return
+
+    async def _on_proxy_chunk_binding(source, jid, payload_json) -> None:
+        try:
+            payload = json.loads(str(payload_json or ""))
+        except Exception:
+            payload = {"error": "proxy binding payload decode error", "done": True}
+        _note_send_progress(str(jid), payload)
+        await deliver_proxy_chunk(str(jid), payload)
+
+    def _note_send_progress(jid: str, payload) -> None:
+        released = send_released.get(jid)
+        if released is None or not isinstance(payload, dict):
+            return
+        if isinstance(payload.get("status"), int) or payload.get("error") or payload.get("done"):
+            released.set()
+
+    async def _begin_send(job_id: str, job: dict, tab_page) -> None:
+        """Check/repair the context's auth cookie for `job` and take a send slot (see `send_cond`)."""
+        nonlocal sending, sending_auth, signup_running
+        auth_token = str(job.get("arena_auth_token") or "").strip()
+        signed_up = False
+        while True:
+            async with send_cond:
+                while True:
+                    # An anonymous signup in another job is about to replace the cookie; wait for its result.
+                    if signup_running:
+                        await send_cond.wait()
+                        continue
+                    # Use existing browser cookie if valid, to avoid clobbering fresh anonymous sessions
+                    browser_auth_cookie = ""
+                    try:
+                        browser_auth_cookie = await _get_auth_cookie_value()
+                    except Exception:
+                        pass
+
+                    use_job_token = False
+                    if auth_token:
+                        # Only use the job's token if we don't have a valid one, or if the job's token is explicitly fresher (hard to tell, so prefer browser's if valid).
+                        if not browser_auth_cookie:
+                            use_job_token = True
+                        else:
+                            try:
+                                if is_arena_auth_token_expired(browser_auth_cookie, skew_seconds=60):
+                                    use_job_token = True
+                            except Exception:
+                                use_job_token = True
+                    if not use_job_token or not sending or not sending_auth or sending_auth == auth_token:
+                        break
+                    await send_cond.wait()
+
+                try:
+                    if use_job_token:
+                        await context.add_cookies(
+                            _arena_auth_cookie_specs(
+                                auth_token,
+                                page_url=str(getattr(tab_page, "url", "") or ""),
+                            )
+                        )
+                    elif browser_auth_cookie:
+                        debug_print("🦊 Camoufox proxy: using valid browser auth cookie (job token is empty or invalid).")
+                except Exception:
+                    pass
+
+                # If the job did not provide a usable auth cookie, ensure the browser session has one.
+                try:
+                    current_cookie = await _get_auth_cookie_value()
+                except Exception:
+                    current_cookie = ""
+                if current_cookie:
+                    try:
+                        expired = is_arena_auth_token_expired(current_cookie, skew_seconds=0)
+                    except Exception:
+                        expired = False
+                    debug_print(f"🦊 Camoufox proxy: arena-auth cookie present (len={len(current_cookie)} expired={expired})")
+                else:
+                    debug_print("🦊 Camoufox proxy: arena-auth cookie missing")
+                try:
+                    needs_signup = (not current_cookie) or is_arena_auth_token_expired(current_cookie, skew_seconds=0)
+                except Exception:
+                    needs_signup = not bool(current_cookie)
+                # Unit tests stub out the browser; avoid slow/interactive signup flows there.
+                if not needs_signup or signed_up or os.environ.get("PYTEST_CURRENT_TEST"):
+                    if current_cookie:
+                        sending_auth = current_cookie
+                    sending += 1
+                    return
+                # The signup replaces the context's cookie with one we can't know up front, so it waits until no
+                # in-flight send depends on the current one.
+                if sending and sending_auth:
+                    await send_cond.wait()
+                    continue
+                signup_running = True
+
+            # Signup can take minutes (Turnstile); run it without holding `send_cond` so other jobs' `_end_send`
+            # isn't blocked behind it.
+            try:
+                try:
+                    _set_userscript_proxy_job_phase(job_id, job, "signup")
+                except Exception:
+                    pass
+                await _attempt_anonymous_signup(tab_page, min_interval_seconds=20.0)
+            finally:
+                async with send_cond:
+                    signup_running = False
+                    send_cond.notify_all()
+            signed_up = True
+
+    async def _end_send() -> None:
+        nonlocal sending, sending_auth
+        async with send_cond:
+            sending = max(0, sending - 1)
+            if not sending:
+                sending_auth = ""
+            send_cond.notify_all()
+
+    def _new_tab(tab_page, *, main: bool = False) -> dict:
+        return {
+            "page": tab_page,
+            "task": None,
+            "jobs": 0,
+            "failures": 0,
+            "last_used": time.monotonic(),
+            "main": main,
+            "draining": False,
+        }
+
+    def _tab_healthy(tab: dict) -> bool:
+        tab_page = tab.get("page")
+        if tab_page is None:
+            return tab.get("task") is not None  # still opening
+        try:
+            if tab_page.is_closed():
+                return False
+        except Exception:
+            return False
+        return int(tab.get("failures") or 0) < CAMOUFOX_PROXY_TAB_MAX_FAILURES
+
+    async def _open_tab_page():
+        new_page = await context.new_page()
+        CAMOUFOX_PROXY_TAB_STATS["tabs_opened"] += 1
+        try:
+            new_page.on("console", _on_console)
+        except Exception:
+            pass
+        try:
+            await new_page.goto("https://lmarena.ai/?mode=direct", wait_until="domcontentloaded", timeout=120000)
+        except Exception as e:
+            debug_print(f"⚠️ Camoufox proxy: new tab navigation warning: {e}")
+        try:
+            await new_page.mouse.move(100, 100)
+        except Exception:
+            pass
+        return new_page
+
+    async def _close_tab(tab: dict) -> None:
+        try:
+            tabs.remove(tab)
+        except ValueError:
+            pass
+        task = tab.get("task")
+        if task is not None and not task.done():
+            task.cancel()
+        tab_page = tab.get("page")
+        if tab_page is not None and not tab.get("main"):
+            try:
+                await tab_page.close()
+            except Exception:
+                pass
+
+    def _tab_needs_recycle(tab: dict, watchdog: dict) -> bool:
+        if tab.get("draining"):
+            return True
+        return bool(watchdog["tab_max_jobs"]) and int(tab.get("jobs") or 0) >= watchdog["tab_max_jobs"]
+
+    async def _prune_tabs(settings: dict, watchdog: dict) -> None:
+        now = time.monotonic()
+        for tab in list(tabs):
+            if tab.get("task") is not None:
+                continue
+            if tab.get("page") is not None and _tab_healthy(tab) and _tab_needs_recycle(tab, watchdog):
+                # Idle now, so nothing is lost: a fresh document drops whatever the old one leaked.
+                CAMOUFOX_PROXY_TAB_STATS["tab_recycles"] += 1
+                debug_print(f"♻️ Camoufox proxy: recycling tab after {int(tab.get('jobs') or 0)} jobs.")
+                if not tab.get("main"):
+                    await _close_tab(tab)
+                    continue
+                tab["jobs"] = 0
+                tab["draining"] = False
+                try:
+                    await tab["page"].goto("https://lmarena.ai/?mode=direct", wait_until="domcontentloaded", timeout=120000)
+                except Exception as e:
+                    debug_print(f"⚠️ Camoufox proxy: main tab recycle warning: {e}")
+                continue
+            if tab.get("main"):
+                # The main tab is tied to the browser's lifecycle (a closed one triggers a relaunch); a failing
+                # one is just reloaded.
+                if int(tab.get("failures") or 0) >= CAMOUFOX_PROXY_TAB_MAX_FAILURES:
+                    tab["failures"] = 0
+                    try:
+                        await tab["page"].goto("https://lmarena.ai/?mode=direct", wait_until="domcontentloaded", timeout=120000)
+                    except Exception as e:
+                        debug_print(f"⚠️ Camoufox proxy: main tab reload warning: {e}")
+                continue
+            if not _tab_healthy(tab):
+                debug_print("⚠️ Camoufox proxy: closing unhealthy tab.")
+                await _close_tab(tab)
+            elif settings["autoscale"] and (now - float(tab.get("last_used") or now)) > settings["idle_seconds"]:
+                await _close_tab(tab)
+
+    async def _sample_memory(watchdog: dict) -> str:
+        """Mark tabs whose JS heap is too large for recycling; return why the whole browser should go ("" if not)."""
+        # Only the proxy's own driver/browser tree: other pools and the minting session have their own lifecycles.
+        rss = None
+        if browser_pid is not None:
+            rss = await asyncio.get_running_loop().run_in_executor(None, _browser_process_rss_bytes, browser_pid)
+        rss_mb = int(rss // (1024 * 1024)) if rss is not None else 0
+        CAMOUFOX_PROXY_TAB_STATS["rss_mb"] = rss_mb
+
+        heap_total = 0
+        for tab in list(tabs):
+            tab_page = tab.get("page")
+            if tab_page is None:
+                continue
+            try:
+                heap = await asyncio.wait_for(tab_page.evaluate(_JS_HEAP_USAGE_SCRIPT), timeout=5.0)
+            except Exception:
+                heap = None
+            if not isinstance(heap, (int, float)) or isinstance(heap, bool):
+                continue
+            heap_mb = int(heap // (1024 * 1024))
+            heap_total += heap_mb
+            if watchdog["max_js_heap_mb"] and heap_mb > watchdog["max_js_heap_mb"] and not tab.get("draining"):
+                debug_print(f"♻️ Camoufox proxy: tab JS heap at {heap_mb} MB, draining it for a recycle.")
+                tab["draining"] = True
+        CAMOUFOX_PROXY_TAB_STATS["js_heap_mb"] = heap_total
+
+        if rss is not None and watchdog["max_rss_mb"] and rss_mb > watchdog["max_rss_mb"]:
+            return f"browser RSS at {rss_mb} MB (limit {watchdog['max_rss_mb']} MB)"
+        return ""
+
+    async def _cancel_tab_jobs() -> None:
+        for tab in list(tabs):
+            task = tab.get("task")
+            if task is not None and not task.done():
+                task.cancel()
+        tabs.clear()
+
     while True:
         try:
             _touch_userscript_poll()
@@ -5901,6 +9099,8 @@ async def camoufox_proxy_worker():
                     needs_launch = True
 
             if needs_launch:
+                # Jobs still running in the old browser can't finish; their streams get an error chunk.
+                await _cancel_tab_jobs()
                 # Cleanup existing if any
                 if browser_cm:
                     try:
@@ -5908,9 +9108,13 @@ async def camoufox_proxy_worker():
                     except Exception:
                         pass
                 browser_cm = None
+                browser_pid = None
                 browser = None
                 context = None
                 page = None
+                browser_jobs = 0
+                browser_drain_reason = ""
+                last_watchdog_at = time.monotonic()
 
                 cfg = get_config()
                 recaptcha_sitekey, recaptcha_action = get_recaptcha_settings(cfg)
@@ -5968,6 +9172,7 @@ async def camoufox_proxy_worker():
                         browser = await asyncio.wait_for(browser_cm.__aenter__(), timeout=launch_timeout)
                     else:
                         raise
+                browser_pid = _playwright_driver_pid(browser_cm)
 
                 if persistent_context_enabled:
                     context = browser
@@ -5978,6 +9183,12 @@ async def camoufox_proxy_worker():
                     await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
                 except Exception:
                     pass
+                await _install_resource_blocking(context, cfg)
+                # Chunk channel for every tab of this context (the fetch script falls back to console.log without it).
+                try:
+                    await context.expose_binding("lmBridgeProxyChunk", _on_proxy_chunk_binding)
+                except Exception as e:
+                    debug_print(f"⚠️ Camoufox proxy: chunk binding unavailable, using console channel: {e}")
 
                 # Inject only a minimal set of cookies (do not overwrite browser-managed state).
                 cookie_store = cfg.get("browser_cookies")
@@ -6109,33 +9320,12 @@ async def camoufox_proxy_worker():
                     debug_print(f"⚠️ Navigation warning: {e}")
 
                 # Attach console listener
-                def _on_console(message) -> None:
-                    try:
-                        attr = getattr(message, "text", None)
-                        text = attr() if callable(attr) else attr
-                    except Exception:
-                        return
-                    if not isinstance(text, str):
-                        return
-                    if not text.startswith("LM_BRIDGE_PROXY|"):
-                        return
-                    try:
-                        _, jid, payload_json = text.split("|", 2)
-                    except ValueError:
-                        return
-                    try:
-                        payload = json.loads(payload_json)
-                    except Exception:
-                        payload = {"error": "proxy console payload decode error", "done": True}
-                    try:
-                        asyncio.create_task(push_proxy_chunk(str(jid), payload))
-                    except Exception:
-                        return
-                
                 try:
                     page.on("console", _on_console)
                 except Exception:
                     pass
+                tabs.append(_new_tab(page, main=True))
+                _mark_camoufox_proxy_ready()
                 
                 # Check for "Just a moment" (Cloudflare) and click if needed
                 try:
@@ -6164,6 +9354,15 @@ async def camoufox_proxy_worker():
                 except Exception:
                     pass
 
+                tab_settings = _get_camoufox_proxy_tab_settings(cfg)
+                if not tab_settings["autoscale"]:
+                    for _ in range(tab_settings["max_tabs"] - 1):
+                        try:
+                            tabs.append(_new_tab(await _open_tab_page()))
+                        except Exception as e:
+                            debug_print(f"⚠️ Camoufox proxy: failed to open tab: {e}")
+                            break
+
             async def _get_auth_cookie_value() -> str:
                 nonlocal context, page
                 if context is None:
@@ -6206,8 +9405,8 @@ async def camoufox_proxy_worker():
                     return candidates[0]
                 return ""
 
-            async def _attempt_anonymous_signup(*, min_interval_seconds: float = 20.0) -> None:
-                nonlocal last_signup_attempt_at, page, context
+            async def _attempt_anonymous_signup(page, *, min_interval_seconds: float = 20.0) -> None:
+                nonlocal last_signup_attempt_at, context
                 if page is None or context is None:
                     return
                 now = time.time()
@@ -6545,7 +9744,46 @@ async def camoufox_proxy_worker():
                 except Exception:
                     pass
 
-            # --- 2. PROCESS JOBS ---
+            # --- 2. DISPATCH JOBS TO TABS ---
+            cfg_snapshot = _get_config_snapshot()
+            tab_settings = _get_camoufox_proxy_tab_settings(cfg_snapshot)
+            watchdog = _get_camoufox_proxy_watchdog_settings(cfg_snapshot)
+            await _prune_tabs(tab_settings, watchdog)
+
+            if not browser_drain_reason:
+                if time.monotonic() - last_watchdog_at >= watchdog["interval_seconds"]:
+                    last_watchdog_at = time.monotonic()
+                    browser_drain_reason = await _sample_memory(watchdog)
+                if not browser_drain_reason and watchdog["browser_max_jobs"] and browser_jobs >= watchdog["browser_max_jobs"]:
+                    browser_drain_reason = f"{browser_jobs} jobs served"
+                if browser_drain_reason:
+                    browser_drain_started = time.monotonic()
+                    debug_print(f"♻️ Camoufox proxy: {browser_drain_reason}; draining browser before recycling it.")
+            if browser_drain_reason:
+                # New jobs stay queued while in-flight ones finish; past the drain timeout they are cut off.
+                busy = any(t.get("task") is not None for t in tabs)
+                if not busy or (time.monotonic() - browser_drain_started) >= watchdog["drain_timeout_seconds"]:
+                    debug_print(f"♻️ Camoufox proxy: recycling browser ({browser_drain_reason}).")
+                    CAMOUFOX_PROXY_TAB_STATS["browser_recycles"] += 1
+                    browser_drain_reason = ""
+                    page = None
+                    continue
+                tab_freed.clear()
+                try:
+                    await asyncio.wait_for(tab_freed.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            tab_freed.clear()
+            max_tabs = tab_settings["max_tabs"] if time.monotonic() >= tab_open_backoff_until else max(1, len(tabs))
+            if not any(t.get("task") is None for t in tabs) and len(tabs) >= max_tabs:
+                # Every tab is busy: leave jobs queued until one frees up.
+                try:
+                    await asyncio.wait_for(tab_freed.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                continue
             try:
                 job_id = await asyncio.wait_for(queue.get(), timeout=1.0)
             except asyncio.TimeoutError:
@@ -6570,10 +9808,57 @@ async def camoufox_proxy_worker():
              
             # In-page fetch script (streams newline-delimited chunks back through console.log).
             # Mints reCAPTCHA v3 tokens on demand when the request body includes `recaptchaV3Token`.
-            fetch_script = """async ({ jid, payload, sitekey, action, sitekeyV2, grecaptchaTimeoutMs, grecaptchaPollMs, timeoutMs, debug }) => {
+            fetch_script = """async ({ jid, payload, sitekey, action, sitekeyV2, grecaptchaTimeoutMs, grecaptchaPollMs, timeoutMs, debug, flushMs, flushChars }) => {
               const sleep = (ms) => new Promise((r) => setTimeout(r, ms));
               const w = (window.wrappedJSObject || window);
-              const emit = (obj) => { try { console.log('LM_BRIDGE_PROXY|' + jid + '|' + JSON.stringify(obj)); } catch (e) {} };
+
+              // Chunks go through the `lmBridgeProxyChunk` binding (console.log when it's missing), numbered so
+              // Python can deliver them in order. Stream lines are coalesced: the first line after a quiet period is
+              // sent right away, later ones are batched until `flushMs` passes or `flushChars` accumulate.
+              const binding = [window.lmBridgeProxyChunk, w.lmBridgeProxyChunk].find((f) => typeof f === 'function') || null;
+              let seq = 0;
+              let pendingLines = [];
+              let pendingChars = 0;
+              let flushTimer = null;
+              let lastSentAt = 0;
+              const send = (obj) => {
+                lastSentAt = Date.now();
+                // Only consume a sequence number once the chunk serializes; a gap would stall in-order delivery.
+                let text = '';
+                try { text = JSON.stringify({ ...obj, seq: seq + 1 }); } catch (e) { return; }
+                seq += 1;
+                const viaConsole = () => { try { console.log('LM_BRIDGE_PROXY|' + jid + '|' + text); } catch (e) {} };
+                if (binding) {
+                  // The binding returns a Promise, so a failed delivery shows up as a rejection, not a throw.
+                  // Python drops duplicate seqs, so resending over the console channel is safe.
+                  try { Promise.resolve(binding(String(jid), text)).catch(viaConsole); return; } catch (e) {}
+                }
+                viaConsole();
+              };
+              const flushLines = () => {
+                if (flushTimer !== null) { clearTimeout(flushTimer); flushTimer = null; }
+                if (!pendingLines.length) return;
+                const lines = pendingLines;
+                pendingLines = [];
+                pendingChars = 0;
+                send({ lines, done: false });
+              };
+              const emit = (obj) => {
+                const isLineBatch = Array.isArray(obj?.lines) && obj.lines.length > 0 && obj.done === false && Object.keys(obj).length === 2;
+                if (!isLineBatch) {
+                  // Status/headers/errors/done: flush buffered lines first so ordering is preserved.
+                  flushLines();
+                  send(obj);
+                  return;
+                }
+                for (const line of obj.lines) { pendingLines.push(line); pendingChars += String(line).length; }
+                const windowMs = Math.max(0, Number(flushMs) || 0);
+                if (pendingChars >= (Number(flushChars) || 4096) || (Date.now() - lastSentAt) >= windowMs) {
+                  flushLines();
+                } else if (flushTimer === null) {
+                  flushTimer = setTimeout(flushLines, windowMs);
+                }
+              };
               const debugEnabled = !!debug;
               const dbg = (stage, extra) => { if (!debugEnabled && !String(stage).includes('error')) return; try { emit({ debug: { stage, ...(extra || {}) } }); } catch (e) {} };
               dbg('start', { hasPayload: !!payload, hasSitekey: !!sitekey, hasAction: !!action });
@@ -6807,98 +10092,102 @@ async def camoufox_proxy_worker():
               }
             }"""
 
-            debug_print(f"🦊 Camoufox proxy: running job {job_id[:8]}...")
-            
-            try:
-                # Use existing browser cookie if valid, to avoid clobbering fresh anonymous sessions
-                browser_auth_cookie = ""
-                try:
-                    browser_auth_cookie = await _get_auth_cookie_value()
-                except Exception:
-                    pass
-                
-                auth_token = str(job.get("arena_auth_token") or "").strip()
-                
-                use_job_token = False
-                if auth_token:
-                    # Only use the job's token if we don't have a valid one, or if the job's token is explicitly fresher (hard to tell, so prefer browser's if valid).
-                    if not browser_auth_cookie:
-                        use_job_token = True
-                    else:
+            async def _run_proxy_job(tab: dict, job_id: str, job: dict) -> None:
+                nonlocal tab_open_backoff_until
+                tab_page = tab.get("page")
+                if tab_page is None:
+                    try:
+                        tab_page = await _open_tab_page()
+                    except Exception as e:
+                        debug_print(f"⚠️ Camoufox proxy: failed to open tab ({e}); requeueing job {job_id[:8]}.")
+                        tab_open_backoff_until = time.monotonic() + 30.0
+                        await _close_tab(tab)
+                        queue.put_nowait(job_id)
+                        return
+                    tab["page"] = tab_page
+                debug_print(f"🦊 Camoufox proxy: running job {job_id[:8]} ({len(tabs)} tab(s))...")
+
+                # Hold the send slot until this job's response headers arrive: until then the request still
+                # depends on the context's auth cookie.
+                released = asyncio.Event()
+                release_task: Optional[asyncio.Task] = None
+
+                async def _release_send_slot() -> None:
+                    await released.wait()
+                    await _end_send()
+
+                try:
+                    await _begin_send(job_id, job, tab_page)
+                    send_released[job_id] = released
+                    release_task = asyncio.create_task(_release_send_slot())
+                    try:
+                        _set_userscript_proxy_job_phase(job_id, job, "fetch")
+                    except Exception:
+                        pass
+                    chunk_settings = _get_camoufox_proxy_tab_settings(_get_config_snapshot())
+                    await asyncio.wait_for(
+                        tab_page.evaluate(
+                            fetch_script,
+                            {
+                                "jid": job_id,
+                                "payload": job.get("payload") or {},
+                                "sitekey": proxy_recaptcha_sitekey,
+                                "action": proxy_recaptcha_action,
+                                "sitekeyV2": RECAPTCHA_V2_SITEKEY,
+                                "grecaptchaTimeoutMs": 60000,
+                                "grecaptchaPollMs": 250,
+                                "timeoutMs": 180000,
+                                "debug": bool(os.environ.get("LM_BRIDGE_PROXY_DEBUG")),
+                                "flushMs": chunk_settings["chunk_flush_ms"],
+                                "flushChars": chunk_settings["chunk_flush_chars"],
+                            }
+                        ),
+                        timeout=200.0
+                    )
+                    tab["failures"] = 0
+                except asyncio.TimeoutError:
+                    await push_proxy_chunk(job_id, {"error": "camoufox proxy evaluate timeout", "done": True})
+                except asyncio.CancelledError:
+                    await push_proxy_chunk(job_id, {"error": "camoufox proxy restarted", "done": True})
+                    raise
+                except Exception as e:
+                    tab["failures"] = int(tab.get("failures") or 0) + 1
+                    await push_proxy_chunk(job_id, {"error": str(e), "done": True})
+                finally:
+                    released.set()
+                    send_released.pop(job_id, None)
+                    if release_task is not None:
                         try:
-                            if is_arena_auth_token_expired(browser_auth_cookie, skew_seconds=60):
-                                use_job_token = True
+                            await release_task
                         except Exception:
-                            use_job_token = True
-                
-                if use_job_token:
-                    await context.add_cookies(
-                        _arena_auth_cookie_specs(
-                            auth_token,
-                            page_url=str(getattr(page, "url", "") or ""),
-                        )
-                    )
-                elif browser_auth_cookie and not use_job_token:
-                    debug_print("🦊 Camoufox proxy: using valid browser auth cookie (job token is empty or invalid).")
-            except Exception:
-                pass
+                            pass
 
-            # If the job did not provide a usable auth cookie, ensure the browser session has one.
-            try:
-                current_cookie = await _get_auth_cookie_value()
-            except Exception:
-                current_cookie = ""
-            if current_cookie:
-                try:
-                    expired = is_arena_auth_token_expired(current_cookie, skew_seconds=0)
-                except Exception:
-                    expired = False
-                debug_print(f"🦊 Camoufox proxy: arena-auth cookie present (len={len(current_cookie)} expired={expired})")
-            else:
-                debug_print("🦊 Camoufox proxy: arena-auth cookie missing")
-            try:
-                needs_signup = (not current_cookie) or is_arena_auth_token_expired(current_cookie, skew_seconds=0)
-            except Exception:
-                needs_signup = not bool(current_cookie)
-            # Unit tests stub out the browser; avoid slow/interactive signup flows there.
-            if needs_signup and not os.environ.get("PYTEST_CURRENT_TEST"):
-                try:
-                    job["phase"] = "signup"
-                except Exception:
-                    pass
-                await _attempt_anonymous_signup(min_interval_seconds=20.0)
-             
-            try:
-                try:
-                    job["phase"] = "fetch"
-                    if not job.get("upstream_started_at_monotonic"):
-                        job["upstream_started_at_monotonic"] = time.monotonic()
-                except Exception:
-                    pass
-                await asyncio.wait_for(
-                    page.evaluate(
-                        fetch_script,
-                        {
-                            "jid": job_id,
-                            "payload": job.get("payload") or {},
-                            "sitekey": proxy_recaptcha_sitekey,
-                            "action": proxy_recaptcha_action,
-                            "sitekeyV2": RECAPTCHA_V2_SITEKEY,
-                            "grecaptchaTimeoutMs": 60000,
-                            "grecaptchaPollMs": 250,
-                            "timeoutMs": 180000,
-                            "debug": bool(os.environ.get("LM_BRIDGE_PROXY_DEBUG")),
-                        }
-                    ),
-                    timeout=200.0
-                )
-            except asyncio.TimeoutError:
-                await push_proxy_chunk(job_id, {"error": "camoufox proxy evaluate timeout", "done": True})
-            except Exception as e:
-                await push_proxy_chunk(job_id, {"error": str(e), "done": True})
+            def _on_job_done(tab: dict, task: "asyncio.Task") -> None:
+                _consume_background_task_exception(task)
+                if tab.get("task") is task:
+                    tab["task"] = None
+                tab["last_used"] = time.monotonic()
+                CAMOUFOX_PROXY_TAB_STATS["busy_tabs"] = sum(1 for t in tabs if t.get("task") is not None)
+                tab_freed.set()
+
+            tab = next(
+                (t for t in tabs if t.get("task") is None and _tab_healthy(t) and not _tab_needs_recycle(t, watchdog)),
+                None,
+            )
+            if tab is None:
+                tab = _new_tab(None)
+                tabs.append(tab)
+            tab["jobs"] = int(tab.get("jobs") or 0) + 1
+            browser_jobs += 1
+            tab["task"] = asyncio.create_task(_run_proxy_job(tab, job_id, job))
+            tab["task"].add_done_callback(lambda task, tab=tab: _on_job_done(tab, task))
+            CAMOUFOX_PROXY_TAB_STATS["jobs_dispatched"] += 1
+            CAMOUFOX_PROXY_TAB_STATS["tabs"] = len(tabs)
+            CAMOUFOX_PROXY_TAB_STATS["busy_tabs"] = sum(1 for t in tabs if t.get("task") is not None)
 
         except asyncio.CancelledError:
             debug_print("🦊 Camoufox proxy worker cancelled.")
+            await _cancel_tab_jobs()
             if browser_cm:
                 try:
                     await browser_cm.__aexit__(None, None, None)
@@ -6912,6 +10201,341 @@ async def camoufox_proxy_worker():
             browser = None
             page = None
 
+
+def _prepare_camoufox_proxy_farm_worker_config(config: dict, index: int, count: int) -> str:
+    """
+    Write the config file a farm worker process runs with and return its path.
+
+    Each worker gets its own directory (profile + config.json) so it keeps a separate fingerprint and arena
+    identity across restarts; cookies it captures are persisted there rather than in the main config.json.
+    """
+    root_value = config.get("camoufox_proxy_farm_dir")
+    root = Path(str(root_value)).expanduser() if root_value else Path(CONFIG_FILE).with_name("camoufox_proxy_workers")
+    worker_dir = root / f"worker-{index}"
+    profile_dir = worker_dir / "profile"
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    config_path = worker_dir / "config.json"
+
+    try:
+        with open(config_path, "r") as f:
+            previous = json.load(f)
+    except Exception:
+        previous = {}
+
+    worker_config = _clone_json_value(config)
+    if isinstance(previous, dict):
+        # Keep the identity this worker established on earlier runs.
+        for key in ("browser_cookies", "provisional_user_id"):
+            if previous.get(key):
+                worker_config[key] = previous[key]
+    tokens = [t for t in (config.get("auth_tokens") or []) if isinstance(t, str) and t.strip()]
+    if len(tokens) >= count:
+        worker_config["auth_tokens"] = tokens[index::count]
+    worker_config["camoufox_proxy_user_data_dir"] = str(profile_dir)
+    if config.get("camoufox_proxy_persistent_context") is None:
+        worker_config["camoufox_proxy_persistent_context"] = True
+    worker_config["camoufox_proxy_workers"] = 0
+
+    tmp_path = f"{config_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(worker_config, f, indent=4)
+    os.replace(tmp_path, config_path)
+    return str(config_path)
+
+
+def _mark_camoufox_proxy_ready() -> None:
+    """The proxy browser is up: report it to startup readiness, or to the parent process in farm mode."""
+    sink = _CAMOUFOX_PROXY_FARM_CHUNK_SINK
+    if sink is None:
+        _set_startup_component("proxy_worker", "ready")
+        return
+    # Control message on the chunk queue: an empty job id never matches a real job.
+    try:
+        sink.put(("", {"worker_ready": _CAMOUFOX_PROXY_FARM_WORKER_INDEX}))
+    except Exception:
+        pass
+
+
+def _camoufox_proxy_farm_worker_main(index: int, job_queue, chunk_queue, config_file: str) -> None:
+    """Entry point of a farm worker process: runs `camoufox_proxy_worker` on its own event loop."""
+    global CONFIG_FILE, _CAMOUFOX_PROXY_FARM_CHUNK_SINK, _CAMOUFOX_PROXY_FARM_WORKER_INDEX
+    CONFIG_FILE = config_file
+    _CAMOUFOX_PROXY_FARM_CHUNK_SINK = chunk_queue
+    _CAMOUFOX_PROXY_FARM_WORKER_INDEX = index
+    debug_print(f"🦊 Camoufox proxy farm worker {index} started (pid {os.getpid()}).")
+    try:
+        asyncio.run(_camoufox_proxy_farm_worker(job_queue))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _camoufox_proxy_farm_worker(job_queue) -> None:
+    from queue import Empty
+
+    loop = asyncio.get_running_loop()
+    local_queue = _get_userscript_proxy_queue()
+    parent = multiprocessing.parent_process()
+    worker = asyncio.create_task(camoufox_proxy_worker())
+    try:
+        while not worker.done():
+            if parent is not None and not parent.is_alive():
+                break
+            try:
+                message = await loop.run_in_executor(None, job_queue.get, True, 1.0)
+            except Empty:
+                continue
+            if message is None:
+                break
+            job_id = str(message.get("job_id") or "").strip()
+            if not job_id:
+                continue
+            _USERSCRIPT_PROXY_JOBS[job_id] = {
+                "phase": "picked_up",
+                "picked_up_at_monotonic": time.monotonic(),
+                "upstream_started_at_monotonic": None,
+                "arena_auth_token": str(message.get("arena_auth_token") or ""),
+                "payload": message.get("payload") or {},
+            }
+            await local_queue.put(job_id)
+    finally:
+        await _cancel_background_task(worker, timeout_seconds=10.0)
+
+
+class CamoufoxProxyFarm:
+    """
+    Runs the Camoufox proxy in `camoufox_proxy_workers` child processes instead of on the server's event loop.
+
+    Every worker process runs `camoufox_proxy_worker` with its own profile directory and config file. The parent
+    keeps `_USERSCRIPT_PROXY_JOBS`: queued job ids are handed to the least-busy worker over a multiprocessing
+    queue, and the chunks the workers send back are fed into `push_proxy_chunk`. A worker reports its browser is
+    up with a `("", {"worker_ready": index})` message on the same queue; the farm counts as ready after the first.
+    """
+
+    RESTART_BACKOFF_SECONDS = 10.0
+
+    def __init__(self) -> None:
+        self._workers: list[dict] = []
+        self._mp = None
+        self._chunks = None
+        self._tasks: list[asyncio.Task] = []
+        self._freed: Optional[asyncio.Event] = None
+        self.jobs_dispatched = 0
+        self.worker_restarts = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self, config: dict) -> bool:
+        """Spawn the configured workers. Returns False (and does nothing) when farm mode is disabled."""
+        count = min(_coerce_positive_int(config.get("camoufox_proxy_workers"), 0), 16)
+        if count <= 0 or self._workers:
+            return False
+        self._mp = multiprocessing.get_context("spawn")
+        self._chunks = self._mp.Queue()
+        self._freed = asyncio.Event()
+        self._workers = [
+            {
+                "index": i,
+                "process": None,
+                "jobs": None,
+                "in_flight": set(),
+                "ready": False,
+                "dispatched": 0,
+                "restarts": 0,
+                "restart_at": 0.0,
+            }
+            for i in range(count)
+        ]
+        for worker in self._workers:
+            self._spawn(worker, config)
+        self._tasks = [asyncio.create_task(self._dispatch_loop()), asyncio.create_task(self._read_chunks())]
+        debug_print(f"🦊 Camoufox proxy farm: started {count} worker process(es).")
+        return True
+
+    def _spawn(self, worker: dict, config: dict) -> None:
+        index = worker["index"]
+        try:
+            config_file = _prepare_camoufox_proxy_farm_worker_config(config, index, len(self._workers))
+            jobs = self._mp.Queue()
+            process = self._mp.Process(
+                target=_camoufox_proxy_farm_worker_main,
+                args=(index, jobs, self._chunks, config_file),
+                name=f"camoufox-proxy-{index}",
+                daemon=True,
+            )
+            process.start()
+        except Exception as e:
+            debug_print(f"⚠️ Camoufox proxy farm: failed to start worker {index}: {e}")
+            worker["restart_at"] = time.monotonic() + self.RESTART_BACKOFF_SECONDS
+            return
+        worker["process"] = process
+        worker["jobs"] = jobs
+
+    def _check_workers(self) -> None:
+        now = time.monotonic()
+        for worker in self._workers:
+            process = worker["process"]
+            if process is not None and process.is_alive():
+                continue
+            if process is not None:
+                debug_print(
+                    f"⚠️ Camoufox proxy farm worker {worker['index']} exited (code {process.exitcode}); "
+                    f"restarting in {int(self.RESTART_BACKOFF_SECONDS)}s."
+                )
+                for job_id in list(worker["in_flight"]):
+                    asyncio.create_task(push_proxy_chunk(job_id, {"error": "camoufox proxy worker exited", "done": True}))
+                worker["in_flight"].clear()
+                worker["ready"] = False
+                worker["process"] = None
+                worker["jobs"] = None
+                worker["restart_at"] = now + self.RESTART_BACKOFF_SECONDS
+            elif now >= float(worker["restart_at"]):
+                worker["restarts"] += 1
+                self.worker_restarts += 1
+                self._spawn(worker, _get_config_snapshot())
+
+    def _finish(self, job_id: str) -> None:
+        for worker in self._workers:
+            worker["in_flight"].discard(job_id)
+        if self._freed is not None:
+            self._freed.set()
+
+    async def _dispatch_loop(self) -> None:
+        queue = _get_userscript_proxy_queue()
+        while True:
+            try:
+                self._check_workers()
+                capacity = _get_camoufox_proxy_tab_settings(_get_config_snapshot())["max_tabs"]
+                alive = [w for w in self._workers if w["process"] is not None and w["process"].is_alive()]
+                if alive:
+                    # Workers don't poll over HTTP; keep the proxy marked active while any of them is up.
+                    _touch_userscript_poll()
+                candidates = [w for w in alive if len(w["in_flight"]) < capacity]
+                self._freed.clear()
+                if not candidates:
+                    try:
+                        await asyncio.wait_for(self._freed.wait(), timeout=1.0)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                try:
+                    job_id = await asyncio.wait_for(queue.get(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    continue
+
+                job_id = str(job_id or "").strip()
+                job = _USERSCRIPT_PROXY_JOBS.get(job_id)
+                if not isinstance(job, dict):
+                    continue
+                worker = min(candidates, key=lambda w: len(w["in_flight"]))
+                picked = job.get("picked_up_event")
+                if isinstance(picked, asyncio.Event) and not picked.is_set():
+                    picked.set()
+                if not job.get("picked_up_at_monotonic"):
+                    job["picked_up_at_monotonic"] = time.monotonic()
+                if str(job.get("phase") or "") == "queued":
+                    job["phase"] = "picked_up"
+                worker["jobs"].put(
+                    {
+                        "job_id": job_id,
+                        "payload": job.get("payload") or {},
+                        "arena_auth_token": str(job.get("arena_auth_token") or ""),
+                    }
+                )
+                worker["in_flight"].add(job_id)
+                worker["dispatched"] += 1
+                self.jobs_dispatched += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                debug_print(f"⚠️ Camoufox proxy farm dispatcher error: {e}")
+                await asyncio.sleep(1.0)
+
+    async def _read_chunks(self) -> None:
+        from queue import Empty
+
+        loop = asyncio.get_running_loop()
+        chunks = self._chunks
+        while True:
+            try:
+                try:
+                    batch = [await loop.run_in_executor(None, chunks.get, True, 0.5)]
+                except Empty:
+                    continue
+                while True:
+                    try:
+                        batch.append(chunks.get_nowait())
+                    except Empty:
+                        break
+                for job_id, d in batch:
+                    if not job_id and isinstance(d, dict) and "worker_ready" in d:
+                        self._worker_ready(d.get("worker_ready"))
+                        continue
+                    await push_proxy_chunk(job_id, d)
+                    if isinstance(d, dict) and d.get("done"):
+                        self._finish(str(job_id))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                debug_print(f"⚠️ Camoufox proxy farm chunk reader error: {e}")
+
+    def _worker_ready(self, index) -> None:
+        for worker in self._workers:
+            if worker["index"] == index and not worker["ready"]:
+                worker["ready"] = True
+                debug_print(f"🦊 Camoufox proxy farm worker {index} is ready.")
+        if any(w["ready"] for w in self._workers):
+            _set_startup_component("proxy_worker", "ready")
+
+    async def close(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            await _cancel_background_task(task)
+        workers, self._workers = self._workers, []
+        loop = asyncio.get_running_loop()
+        for worker in workers:
+            if worker["jobs"] is not None:
+                try:
+                    worker["jobs"].put_nowait(None)
+                except Exception:
+                    pass
+        for worker in workers:
+            process = worker["process"]
+            if process is None:
+                continue
+            try:
+                await loop.run_in_executor(None, process.join, 15.0)
+                if process.is_alive():
+                    process.terminate()
+            except Exception:
+                pass
+
+    def snapshot(self) -> dict:
+        workers = []
+        for worker in self._workers:
+            process = worker["process"]
+            workers.append(
+                {
+                    "index": worker["index"],
+                    "pid": getattr(process, "pid", None),
+                    "alive": bool(process is not None and process.is_alive()),
+                    "ready": bool(worker["ready"]),
+                    "in_flight": len(worker["in_flight"]),
+                    "dispatched": worker["dispatched"],
+                    "restarts": worker["restarts"],
+                }
+            )
+        return {
+            "running": self.running,
+            "jobs_dispatched": self.jobs_dispatched,
+            "worker_restarts": self.worker_restarts,
+            "workers": workers,
+        }
+
+
+CAMOUFOX_PROXY_FARM = CamoufoxProxyFarm()
+
 # --- OpenAI Compatible API Endpoints ---
 
 @app.get("/api/v1/health")
@@ -6936,7 +10560,24 @@ async def health_check():
                 "models_loaded": has_models,
                 "model_count": len(models),
                 "api_keys_configured": has_api_keys
-            }
+            },
+            "config_cache": get_config_cache_stats(),
+            "chat_admission": CHAT_ADMISSION.snapshot(),
+            "auth_tokens": {**get_auth_token_health_stats(), **AUTH_TOKEN_REFRESH_STATS},
+            "http_client": get_shared_http_client_stats(),
+            "recaptcha_pool": RECAPTCHA_TOKEN_POOL.snapshot(),
+            "recaptcha_mints": RECAPTCHA_MINT_COORDINATOR.snapshot(),
+            "recaptcha_session": RECAPTCHA_MINTING_SESSION.snapshot(),
+            "recaptcha_sources": RECAPTCHA_SOURCE_STATS.snapshot(),
+            "resource_blocking": dict(BROWSER_RESOURCE_BLOCKING_STATS),
+            "chrome_pool": CHROME_FETCH_POOL.snapshot(),
+            "camoufox_pool": CAMOUFOX_FETCH_POOL.snapshot(),
+            "camoufox_proxy_tabs": dict(CAMOUFOX_PROXY_TAB_STATS),
+            "camoufox_proxy_farm": CAMOUFOX_PROXY_FARM.snapshot(),
+            "userscript_proxy_ws": dict(USERSCRIPT_PROXY_WS_STATS),
+            "userscript_proxy_pollers": USERSCRIPT_PROXY_SCHEDULER.snapshot(),
+            "userscript_proxy_jobs": get_userscript_proxy_job_stats(),
+            "startup": get_startup_readiness(),
         }
     except Exception as e:
         return {
@@ -6945,34 +10586,105 @@ async def health_check():
             "error": str(e)
         }
 
-@app.get("/api/v1/models")
-async def list_models(api_key: dict = Depends(rate_limit_api_key)):
+@app.get("/api/v1/health/live")
+async def liveness_check():
+    """Liveness probe: answers as soon as the server accepts connections, without touching browsers or upstream."""
+    return {"status": "alive", "uptime_seconds": round(time.time() - _PROCESS_STARTED_AT, 3)}
+
+
+@app.get("/api/v1/health/ready")
+async def readiness_check():
+    """Readiness probe: 503 with per-component warm-up progress until the bridge can serve chat traffic."""
+    readiness = get_startup_readiness()
+    return Response(
+        content=json.dumps({"status": "ready" if readiness["ready"] else "warming_up", **readiness}),
+        status_code=HTTPStatus.OK if readiness["ready"] else HTTPStatus.SERVICE_UNAVAILABLE,
+        media_type="application/json",
+    )
+
+# Serialized /api/v1/models body for one registry: (registry, body_bytes, etag).
+_MODELS_LIST_RESPONSE_CACHE: Optional[tuple] = None
+# Fallback `created` for models whose id doesn't embed a timestamp (Jan 3 2024, same as API key defaults).
+_DEFAULT_MODEL_CREATED = 1704236400
+
+
+def _model_created_epoch(model_id: object) -> int:
+    """Stable `created` value: LMArena model ids are UUIDv7, whose first 48 bits are a unix timestamp in ms."""
     try:
-        models = get_models()
-        
+        parsed = uuid.UUID(str(model_id or ""))
+    except Exception:
+        return _DEFAULT_MODEL_CREATED
+    if parsed.version != 7:
+        return _DEFAULT_MODEL_CREATED
+    return int(parsed.int >> 80) // 1000
+
+
+def _build_models_list_response(registry: ModelRegistry) -> tuple[bytes, str]:
+    data = []
+    for model in registry.models:
+        if not isinstance(model, dict):
+            continue
+        output_caps = (model.get("capabilities") or {}).get("outputCapabilities") or {}
         # Filter for models with text OR search OR image output capability and an organization (exclude stealth models)
         # Always include image models - no special key needed
-        valid_models = [m for m in models 
-                       if (m.get('capabilities', {}).get('outputCapabilities', {}).get('text')
-                           or m.get('capabilities', {}).get('outputCapabilities', {}).get('search')
-                           or m.get('capabilities', {}).get('outputCapabilities', {}).get('image'))
-                       and m.get('organization')]
-        
-        return {
-            "object": "list",
-            "data": [
-                {
-                    "id": model.get("publicName"),
-                    "object": "model",
-                    "created": int(time.time()),
-                    "owned_by": model.get("organization", "lmarena")
-                } for model in valid_models if model.get("publicName")
-            ]
-        }
+        if not (output_caps.get("text") or output_caps.get("search") or output_caps.get("image")):
+            continue
+        if not model.get("organization") or not model.get("publicName"):
+            continue
+        data.append(
+            {
+                "id": model.get("publicName"),
+                "object": "model",
+                "created": _model_created_epoch(model.get("id")),
+                "owned_by": model.get("organization", "lmarena"),
+            }
+        )
+    body = json.dumps({"object": "list", "data": data}, separators=(",", ":")).encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    return body, etag
+
+
+def _get_models_list_response(registry: ModelRegistry) -> tuple[bytes, str]:
+    global _MODELS_LIST_RESPONSE_CACHE
+    cached = _MODELS_LIST_RESPONSE_CACHE
+    if cached is not None and cached[0] is registry:
+        return cached[1], cached[2]
+    body, etag = _build_models_list_response(registry)
+    _MODELS_LIST_RESPONSE_CACHE = (registry, body, etag)
+    return body, etag
+
+
+def _if_none_match_matches(header_value: Optional[str], etag: str) -> bool:
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2), so ignore any W/ prefix.
+    value = str(header_value or "").strip()
+    if not value:
+        return False
+    if value == "*":
+        return True
+    for candidate in value.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+@app.get("/api/v1/models")
+async def list_models(request: Request, api_key: dict = Depends(rate_limit_api_key)):
+    try:
+        registry = get_model_registry(get_models())
+        # Built once per catalog version and served as pre-encoded bytes.
+        body, etag = _get_models_list_response(registry)
     except Exception as e:
         debug_print(f"❌ Error listing models: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to load models: {str(e)}")
 
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _if_none_match_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @app.get("/api/v1/_debug/stream")
 async def debug_stream(api_key: dict = Depends(rate_limit_api_key)):  # noqa: ARG001
@@ -6984,8 +10696,74 @@ async def debug_stream(api_key: dict = Depends(rate_limit_api_key)):  # noqa: AR
 
     return StreamingResponse(_gen(), media_type="text/event-stream")
 
+class _AdmissionSlotStreamingResponse(StreamingResponse):
+    """
+    A streaming chat response that frees its admission slot when the ASGI call ends, however it ends.
+
+    Releasing from the body iterator isn't enough: if the client disconnects before the first chunk, the
+    iterator may never start and the slot would leak.
+    """
+
+    def __init__(self, response: StreamingResponse, release) -> None:
+        super().__init__(
+            response.body_iterator,
+            status_code=response.status_code,
+            headers=response.headers,
+            media_type=response.media_type,
+            background=response.background,
+        )
+        self._release_admission_slot = release
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._release_admission_slot()
+
+
 @app.post("/api/v1/chat/completions")
 async def api_chat_completions(request: Request, api_key: dict = Depends(rate_limit_api_key)):
+    admission_key = str((api_key or {}).get("key") or "anonymous")
+    global_limit, per_key_limit, max_queue_depth, timeout_seconds = _get_chat_admission_limits(api_key)
+    try:
+        wait_ms = await CHAT_ADMISSION.acquire(
+            admission_key,
+            global_limit=global_limit,
+            per_key_limit=per_key_limit,
+            max_queue_depth=max_queue_depth,
+            timeout_seconds=timeout_seconds,
+        )
+    except AdmissionRejected as e:
+        debug_print(f"🚦 Chat request rejected by admission control: {e.reason}")
+        raise HTTPException(status_code=429, detail=e.reason, headers={"Retry-After": str(e.retry_after)})
+
+    if wait_ms > 0:
+        debug_print(f"🚦 Chat request admitted after {wait_ms:.0f}ms in queue")
+    extra_headers = getattr(request.state, "rate_limit_headers", None)
+    if isinstance(extra_headers, dict):
+        extra_headers["X-Queue-Wait-Ms"] = str(int(wait_ms))
+
+    released = False
+
+    def _release() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            CHAT_ADMISSION.release(admission_key, global_limit=global_limit)
+
+    try:
+        result = await _handle_chat_completion(request, api_key)
+    except BaseException:
+        _release()
+        raise
+
+    if isinstance(result, StreamingResponse):
+        return _AdmissionSlotStreamingResponse(result, _release)
+    _release()
+    return result
+
+
+async def _handle_chat_completion(request: Request, api_key: dict):
     debug_print("\n" + "="*80)
     debug_print("🔵 NEW API REQUEST RECEIVED")
     debug_print("="*80)
@@ -7039,16 +10817,16 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                 detail="Failed to load model list from LMArena. Please try again later."
             )
         
+        model_entry = get_model_registry(models).get(model_public_name)
         model_id = None
         model_org = None
         model_capabilities = {}
-        
-        for m in models:
-            if m.get("publicName") == model_public_name:
-                model_id = m.get("id")
-                model_org = m.get("organization")
-                model_capabilities = m.get("capabilities", {})
-                break
+        model_supports_images = False
+        if model_entry:
+            model_id = model_entry["id"]
+            model_org = model_entry["organization"]
+            model_capabilities = model_entry["capabilities"]
+            model_supports_images = model_entry["supports_images"]
         
         if not model_id:
             debug_print(f"❌ Model '{model_public_name}' not found in model list")
@@ -7058,7 +10836,7 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
             )
         
         # Check if model is a stealth model (no organization)
-        if not model_org:
+        if model_entry["stealth"]:
             debug_print(f"❌ Model '{model_public_name}' is a stealth model (no organization)")
             raise HTTPException(
                 status_code=403,
@@ -7068,23 +10846,13 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
         debug_print(f"✅ Found model ID: {model_id}")
         debug_print(f"🔧 Model capabilities: {model_capabilities}")
         
-        # Determine modality based on model capabilities.
-        # Priority: image > search > chat
-        if model_capabilities.get("outputCapabilities", {}).get("image"):
-            modality = "image"
-        elif model_capabilities.get("outputCapabilities", {}).get("search"):
-            modality = "search"
-        else:
-            modality = "chat"
+        # Modality is precomputed by the registry from the model's capabilities (priority: image > search > chat).
+        modality = model_entry["modality"]
         debug_print(f"🔍 Model modality: {modality}")
 
-        # Log usage
+        # Log usage (persisted by the background flush task, not per request)
         try:
-            model_usage_stats[model_public_name] += 1
-            # Save stats immediately after incrementing
-            config = get_config()
-            config["usage_stats"] = dict(model_usage_stats)
-            save_config(config)
+            record_model_usage(model_public_name)
         except Exception as e:
             # Don't fail the request if usage logging fails
             debug_print(f"⚠️  Failed to log usage stats: {e}")
@@ -7100,7 +10868,9 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
         try:
             last_message_content = messages[-1].get("content", "")
             try:
-                prompt, experimental_attachments = await process_message_content(last_message_content, model_capabilities)
+                prompt, experimental_attachments = await process_message_content(
+                    last_message_content, model_capabilities, supports_images=model_supports_images
+                )
             except Exception as e:
                 debug_print(f"❌ Failed to process message content: {e}")
                 raise HTTPException(status_code=400, detail=f"Invalid message content: {str(e)}")
@@ -7359,75 +11129,87 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
             
             for attempt in range(max_retries):
                 try:
-                    async with httpx.AsyncClient() as client:
-                        if http_method == "PUT":
-                            response = await client.put(url, json=payload, headers=headers, timeout=120)
-                        else:
-                            response = await client.post(url, json=payload, headers=headers, timeout=120)
-                        
-                        # Log status with human-readable message
-                        log_http_status(response.status_code, "LMArena API")
-                        
-                        # Check for retry-able errors
-                        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
-                            debug_print(f"⏱️  Attempt {attempt + 1}/{max_retries} - Rate limit with token {current_token[:20]}...")
-                            retry_after = response.headers.get("Retry-After")
-                            sleep_seconds = get_rate_limit_sleep_seconds(retry_after, attempt)
-                            debug_print(f"  Retry-After header: {retry_after!r}")
-                            
-                            if attempt < max_retries - 1:
-                                try:
-                                    # Try with next token (excluding failed ones)
-                                    current_token = get_next_auth_token(exclude_tokens=failed_tokens)
-                                    headers = get_request_headers_with_token(current_token, recaptcha_token)
-                                    debug_print(f"🔄 Retrying with next token: {current_token[:20]}...")
-                                    await asyncio.sleep(sleep_seconds)
-                                    continue
-                                except HTTPException as e:
-                                    debug_print(f"❌ No more tokens available: {e.detail}")
-                                    break
+                    client = get_shared_http_client()
+                    attempt_started_at = time.monotonic()
+                    if http_method == "PUT":
+                        response = await client.put(url, json=payload, headers=headers, timeout=120)
+                    else:
+                        response = await client.post(url, json=payload, headers=headers, timeout=120)
+                    
+                    # Log status with human-readable message
+                    log_http_status(response.status_code, "LMArena API")
+                    
+                    # Check for retry-able errors
+                    if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                        debug_print(f"⏱️  Attempt {attempt + 1}/{max_retries} - Rate limit with token {current_token[:20]}...")
+                        retry_after = response.headers.get("Retry-After")
+                        record_auth_token_outcome(current_token, "rate_limited", retry_after=retry_after)
+                        sleep_seconds = get_rate_limit_sleep_seconds(retry_after, attempt)
+                        debug_print(f"  Retry-After header: {retry_after!r}")
                         
-                        elif response.status_code == HTTPStatus.FORBIDDEN:
+                        if attempt < max_retries - 1:
                             try:
-                                error_body = response.json()
-                            except Exception:
-                                error_body = None
-                            if isinstance(error_body, dict) and error_body.get("error") == "recaptcha validation failed":
-                                debug_print(
-                                    f"🤖 Attempt {attempt + 1}/{max_retries} - reCAPTCHA validation failed. Refreshing token..."
-                                )
-                                new_token = await refresh_recaptcha_token(force_new=True)
-                                if new_token and isinstance(payload, dict):
-                                    payload["recaptchaV3Token"] = new_token
-                                    recaptcha_token = new_token
-                                if attempt < max_retries - 1:
-                                    headers = get_request_headers_with_token(current_token, recaptcha_token)
-                                    await asyncio.sleep(1)
-                                    continue
-
-                        elif response.status_code == HTTPStatus.UNAUTHORIZED:
-                            debug_print(f"🔒 Attempt {attempt + 1}/{max_retries} - Auth failed with token {current_token[:20]}...")
-                            # Add current token to failed set
-                            failed_tokens.add(current_token)
-                            # (Pruning disabled)
-                            debug_print(f"📝 Failed tokens so far: {len(failed_tokens)}")
-                            
+                                # Try with next token (excluding failed ones)
+                                current_token = get_next_auth_token(exclude_tokens=failed_tokens)
+                                headers = get_request_headers_with_token(current_token, recaptcha_token)
+                                debug_print(f"🔄 Retrying with next token: {current_token[:20]}...")
+                                await asyncio.sleep(sleep_seconds)
+                                continue
+                            except HTTPException as e:
+                                debug_print(f"❌ No more tokens available: {e.detail}")
+                                break
+                    
+                    elif response.status_code == HTTPStatus.FORBIDDEN:
+                        try:
+                            error_body = response.json()
+                        except Exception:
+                            error_body = None
+                        if isinstance(error_body, dict) and error_body.get("error") == "recaptcha validation failed":
+                            debug_print(
+                                f"🤖 Attempt {attempt + 1}/{max_retries} - reCAPTCHA validation failed. Refreshing token..."
+                            )
+                            record_auth_token_outcome(current_token, "recaptcha")
+                            record_recaptcha_token_outcome(recaptcha_token, False)
+                            new_token = await refresh_recaptcha_token(force_new=True)
+                            if new_token and isinstance(payload, dict):
+                                payload["recaptchaV3Token"] = new_token
+                                recaptcha_token = new_token
                             if attempt < max_retries - 1:
-                                try:
-                                    # Try with next available token (excluding failed ones)
-                                    current_token = get_next_auth_token(exclude_tokens=failed_tokens)
-                                    headers = get_request_headers_with_token(current_token, recaptcha_token)
-                                    debug_print(f"🔄 Retrying with next token: {current_token[:20]}...")
-                                    await asyncio.sleep(1)  # Brief delay
-                                    continue
-                                except HTTPException as e:
-                                    debug_print(f"❌ No more tokens available: {e.detail}")
-                                    break
-                        
-                        # If we get here, return the response (success or non-retryable error)
-                        response.raise_for_status()
-                        return response
+                                headers = get_request_headers_with_token(current_token, recaptcha_token)
+                                await asyncio.sleep(1)
+                                continue
+
+                    elif response.status_code == HTTPStatus.UNAUTHORIZED:
+                        debug_print(f"🔒 Attempt {attempt + 1}/{max_retries} - Auth failed with token {current_token[:20]}...")
+                        # Add current token to failed set
+                        failed_tokens.add(current_token)
+                        record_auth_token_outcome(current_token, "unauthorized")
+                        # (Pruning disabled)
+                        debug_print(f"📝 Failed tokens so far: {len(failed_tokens)}")
                         
+                        if attempt < max_retries - 1:
+                            try:
+                                # Try with next available token (excluding failed ones)
+                                current_token = get_next_auth_token(exclude_tokens=failed_tokens)
+                                headers = get_request_headers_with_token(current_token, recaptcha_token)
+                                debug_print(f"🔄 Retrying with next token: {current_token[:20]}...")
+                                await asyncio.sleep(1)  # Brief delay
+                                continue
+                            except HTTPException as e:
+                                debug_print(f"❌ No more tokens available: {e.detail}")
+                                break
+                    
+                    # If we get here, return the response (success or non-retryable error)
+                    if response.status_code < 400:
+                        record_auth_token_outcome(
+                            current_token,
+                            "success",
+                            latency_ms=(time.monotonic() - attempt_started_at) * 1000.0,
+                        )
+                        record_recaptcha_token_outcome(recaptcha_token, True)
+                    response.raise_for_status()
+                    return response
+                    
                 except httpx.HTTPStatusError as e:
                     # Only handle 429 and 401, let other errors through
                     if e.response.status_code not in [429, 401]:
@@ -7523,6 +11305,17 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                 disable_userscript_for_request = False
                 force_proxy_recaptcha_mint = False
 
+                def _record_stream_recaptcha_outcome(accepted: bool) -> None:
+                    # Browser fetch transports record their own (possibly in-page minted) tokens.
+                    if transport_used not in ("httpx", "userscript"):
+                        return
+                    sent_token = payload.get("recaptchaV3Token") if isinstance(payload, dict) else None
+                    record_recaptcha_token_outcome(
+                        sent_token,
+                        accepted,
+                        source="userscript" if transport_used == "userscript" and not sent_token else None,
+                    )
+
                 retry_429_count = 0
                 retry_403_count = 0
 
@@ -7532,6 +11325,7 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                 # Infinite retry loop (until client disconnects, max attempts reached, or we get success)
                 while True:
                     attempt += 1
+                    attempt_started_at = time.monotonic()
 
                     # Abort if the client disconnects.
                     try:
@@ -7611,9 +11405,10 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                     prefill_cached = bool((cfg_now or {}).get("userscript_proxy_prefill_cached_recaptcha", False))
                                 except Exception:
                                     prefill_cached = False
+                                # Telemetry can also opt in: when in-page proxy mints keep failing validation but the cached
+                                # token's source is healthy, the cached token is the better bet.
                                 if (
-                                    prefill_cached
-                                    and isinstance(payload, dict)
+                                    isinstance(payload, dict)
                                     and not force_proxy_recaptcha_mint
                                     and not str(payload.get("recaptchaV3Token") or "").strip()
                                 ):
@@ -7621,7 +11416,10 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                         cached = get_cached_recaptcha_token()
                                     except Exception:
                                         cached = ""
-                                    if cached:
+                                    if cached and (
+                                        prefill_cached
+                                        or RECAPTCHA_SOURCE_STATS.prefer_token_over(cached, "userscript", cfg_now)
+                                    ):
                                         debug_print(f"🔐 Using cached reCAPTCHA v3 token for proxy (len={len(str(cached))})")
                                         payload["recaptchaV3Token"] = cached
 
@@ -7698,7 +11496,11 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                         cached_token = get_cached_recaptcha_token()
                                     except Exception:
                                         cached_token = ""
-                                    if cached_token:
+                                    # Skip it when its source's tokens have been failing validation.
+                                    cached_source = RECAPTCHA_SOURCE_STATS.source_of(cached_token)
+                                    if cached_token and (
+                                        cached_source is None or RECAPTCHA_SOURCE_STATS.qualifies(cached_source)
+                                    ):
                                         payload["recaptchaV3Token"] = cached_token
 
                                 async def _try_chrome_fetch() -> Optional[BrowserFetchStreamResponse]:
@@ -7851,7 +11653,7 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                             transport_used = "chrome"
 
                             if stream_context is None:
-                                client = await stack.enter_async_context(httpx.AsyncClient())
+                                client = get_shared_http_client()
                                 if http_method == "PUT":
                                     stream_context = client.stream('PUT', url, json=payload, headers=headers, timeout=120)
                                 else:
@@ -8149,6 +11951,7 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                         except Exception:
                                             retry_after_value = 0.0
                                     sleep_seconds = get_rate_limit_sleep_seconds(retry_after, attempt)
+                                    record_auth_token_outcome(current_token, "rate_limited", retry_after=retry_after)
                                     
                                     debug_print(
                                         f"⏱️  Stream attempt {attempt} - Upstream rate limited. Waiting {sleep_seconds}s..."
@@ -8299,6 +12102,9 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                                 is_recaptcha_failure = True
                                         except Exception:
                                             is_recaptcha_failure = False
+                                        if is_recaptcha_failure:
+                                            record_auth_token_outcome(current_token, "recaptcha")
+                                            _record_stream_recaptcha_outcome(False)
 
                                         if transport_used == "userscript":
                                             # The proxy is our only truly streaming browser transport. Prefer retrying
@@ -8403,6 +12209,7 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                     debug_print(f"🔒 Stream token expired")
                                     # Add current token to failed set
                                     failed_tokens.add(current_token)
+                                    record_auth_token_outcome(current_token, "unauthorized")
 
                                     # Best-effort: refresh the current base64 session in-memory before rotating.
                                     refreshed_token: Optional[str] = None
@@ -8428,6 +12235,7 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                     if refreshed_token:
                                         global EPHEMERAL_ARENA_AUTH_TOKEN
                                         EPHEMERAL_ARENA_AUTH_TOKEN = refreshed_token
+                                        publish_refreshed_auth_token(current_token, refreshed_token)
                                         current_token = refreshed_token
                                         headers = get_request_headers_with_token(current_token, recaptcha_token)
                                         # Ensure the next browser attempt mints a fresh token for the refreshed session.
@@ -8463,6 +12271,13 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                         return
                                 
                                 log_http_status(response.status_code, "Stream Connection")
+                                if int(getattr(response, "status_code", 0) or 0) < 400:
+                                    record_auth_token_outcome(
+                                        current_token,
+                                        "success",
+                                        latency_ms=(time.monotonic() - attempt_started_at) * 1000.0,
+                                    )
+                                    _record_stream_recaptcha_outcome(True)
                                 response.raise_for_status()
                                 
                                 # Wrapped iterator to yield keep-alives while waiting for upstream lines.
@@ -8746,6 +12561,7 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                     if proxy_status == HTTPStatus.UNAUTHORIZED:
                                         debug_print("🔒 Userscript proxy upstream 401. Rotating auth token...")
                                         failed_tokens.add(current_token)
+                                        record_auth_token_outcome(current_token, "unauthorized")
                                         # (Pruning disabled)
 
                                         try:
@@ -8797,6 +12613,7 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                     retry_after = None
                                     if isinstance(proxy_headers, dict):
                                         retry_after = proxy_headers.get("retry-after") or proxy_headers.get("Retry-After")
+                                    record_auth_token_outcome(current_token, "rate_limited", retry_after=retry_after)
                                     retry_after_value = 0.0
                                     if isinstance(retry_after, str):
                                         try:
@@ -9091,6 +12908,7 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                         if response.status_code == HTTPStatus.UNAUTHORIZED:
                             debug_print(f"🔒 Token {current_token[:20]}... expired in Chrome fetch (attempt {chrome_attempt+1})")
                             failed_tokens.add(current_token)
+                            record_auth_token_outcome(current_token, "unauthorized")
                             # (Pruning disabled)
                             if chrome_attempt < max_chrome_retries - 1:
                                 try:
@@ -9101,6 +12919,9 @@ async def api_chat_completions(request: Request, api_key: dict = Depends(rate_li
                                     break
                         elif response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
                             debug_print(f"⏱️  Rate limit in Chrome fetch (attempt {chrome_attempt+1})")
+                            record_auth_token_outcome(
+                                current_token, "rate_limited", retry_after=response.headers.get("Retry-After")
+                            )
                             if chrome_attempt < max_chrome_retries - 1:
                                 sleep_seconds = get_rate_limit_sleep_seconds(response.headers.get("Retry-After"), chrome_attempt)
                                 await asyncio.sleep(sleep_seconds)
@@ -63,6 +63,8 @@ class BaseBridgeTest(unittest.IsolatedAsyncioTestCase):
 
         self.main.chat_sessions.clear()
         self.main.api_key_usage.clear()
+        self.main._AUTH_TOKEN_HEALTH.clear()
+        self.main.RECAPTCHA_SOURCE_STATS = self.main.RecaptchaSourceTelemetry()
         try:
             # Ensure userscript-proxy state doesn't leak across tests.
             self.main._USERSCRIPT_PROXY_JOBS.clear()
@@ -0,0 +1,109 @@
+from collections import deque
+from unittest.mock import patch
+
+import httpx
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestApiKeyRateLimiter(BaseBridgeTest):
+    async def _get_models(self, client: httpx.AsyncClient, key: str = "limited-key") -> httpx.Response:
+        return await client.get("/api/v1/models", headers={"Authorization": f"Bearer {key}"})
+
+    async def test_burst_then_429_with_rate_limit_headers(self) -> None:
+        self.setup_config({"api_keys": [{"name": "Limited", "key": "limited-key", "rpm": 60, "burst": 2}]})
+
+        with patch.object(self.main, "get_models", return_value=[]):
+            transport = httpx.ASGITransport(app=self.main.app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                first = await self._get_models(client)
+                second = await self._get_models(client)
+                third = await self._get_models(client)
+                invalid = await self._get_models(client, key="unknown-key")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers.get("x-ratelimit-limit"), "60")
+        self.assertEqual(first.headers.get("x-ratelimit-remaining"), "1")
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.headers.get("x-ratelimit-remaining"), "0")
+
+        self.assertEqual(third.status_code, 429)
+        self.assertGreaterEqual(int(third.headers.get("retry-after", "0")), 1)
+        self.assertEqual(third.headers.get("x-ratelimit-remaining"), "0")
+        self.assertEqual(invalid.status_code, 401)
+
+    async def test_daily_limit_is_enforced(self) -> None:
+        self.setup_config({"api_keys": [{"name": "Daily", "key": "limited-key", "rpm": 100, "rpd": 1}]})
+
+        with patch.object(self.main, "get_models", return_value=[]):
+            transport = httpx.ASGITransport(app=self.main.app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                first = await self._get_models(client)
+                second = await self._get_models(client)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers.get("x-ratelimit-limit-day"), "1")
+        self.assertEqual(first.headers.get("x-ratelimit-remaining-day"), "0")
+        self.assertEqual(second.status_code, 429)
+        self.assertGreater(int(second.headers.get("retry-after", "0")), 3600)
+
+    def test_gcra_refills_over_time(self) -> None:
+        tat = 0.0
+        now = 1000.0
+        for _ in range(3):
+            allowed, tat, _, _, _ = self.main._gcra_check(tat, now, limit=60, window_seconds=60.0, burst=3)
+            self.assertTrue(allowed)
+        allowed, _, _, retry_after, _ = self.main._gcra_check(tat, now, limit=60, window_seconds=60.0, burst=3)
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(retry_after, 1.0)
+
+        allowed, _, _, _, _ = self.main._gcra_check(tat, now + 1.0, limit=60, window_seconds=60.0, burst=3)
+        self.assertTrue(allowed)
+
+    def test_first_minute_after_idle_admits_burst_plus_steady_rate(self) -> None:
+        def admitted_in_first_minute(limit: int, burst: int) -> int:
+            tat = 0.0
+            admitted = 0
+            for step in range(600):
+                now = 1000.0 + step * 0.1
+                while True:
+                    allowed, new_tat, _, _, _ = self.main._gcra_check(
+                        tat, now, limit=limit, window_seconds=60.0, burst=burst
+                    )
+                    if not allowed:
+                        break
+                    tat = new_tat
+                    admitted += 1
+            return admitted
+
+        # Default burst (= rpm): a full burst plus the steady refill, i.e. rpm + burst - 1.
+        self.assertEqual(admitted_in_first_minute(60, 60), 119)
+        # burst=1 keeps any 60s window at rpm.
+        self.assertEqual(admitted_in_first_minute(60, 1), 60)
+
+    def test_sliding_window_never_exceeds_limit_in_any_window(self) -> None:
+        log = deque()
+        admitted = []
+        for step in range(1800):
+            now = 1000.0 + step * 0.1
+            while self.main._sliding_window_check(log, now, limit=60, window_seconds=60.0)[0]:
+                admitted.append(now)
+
+        # The full limit is available back to back, but never more than 60 in any 60s window.
+        self.assertEqual(admitted[:60], [1000.0] * 60)
+        self.assertTrue(all(admitted[i + 60] - admitted[i] >= 60.0 - 1e-6 for i in range(len(admitted) - 60)))
+        self.assertLessEqual(len(log), 60)
+
+    async def test_key_without_burst_keeps_per_minute_ceiling(self) -> None:
+        self.setup_config({"api_keys": [{"name": "Plain", "key": "limited-key", "rpm": 3}]})
+
+        with patch.object(self.main, "get_models", return_value=[]):
+            transport = httpx.ASGITransport(app=self.main.app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                responses = [await self._get_models(client) for _ in range(3)]
+                with patch.object(self.main.time, "monotonic", return_value=self.main.time.monotonic() + 30.0):
+                    # GCRA with a default burst would have refilled 1.5 requests by now.
+                    throttled = await self._get_models(client)
+
+        self.assertEqual([r.status_code for r in responses], [200, 200, 200])
+        self.assertEqual(throttled.status_code, 429)
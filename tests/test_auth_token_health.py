@@ -0,0 +1,49 @@
+import random
+from unittest.mock import patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestAuthTokenHealth(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.setup_config({"auth_tokens": ["auth-token-1", "auth-token-2", "auth-token-3"]})
+        self.main.current_token_index = 0
+
+    async def test_rate_limited_token_is_skipped_until_retry_after(self) -> None:
+        self.main.record_auth_token_outcome("auth-token-1", "rate_limited", retry_after="120")
+
+        picks = [self.main.get_next_auth_token() for _ in range(3)]
+        self.assertNotIn("auth-token-1", picks)
+        self.assertEqual(self.main.get_auth_token_health_stats()["cooling_down"], 1)
+
+        self.main._AUTH_TOKEN_HEALTH["auth-token-1"].cooldown_until = 0.0
+        self.assertEqual(
+            self.main.get_next_auth_token(exclude_tokens={"auth-token-2", "auth-token-3"}),
+            "auth-token-1",
+        )
+
+    async def test_all_tokens_cooling_down_uses_the_one_that_recovers_first(self) -> None:
+        self.main.record_auth_token_outcome("auth-token-1", "unauthorized")
+        self.main.record_auth_token_outcome("auth-token-2", "rate_limited", retry_after="600")
+        self.main.record_auth_token_outcome("auth-token-3", "rate_limited", retry_after="30")
+
+        self.assertEqual(self.main.get_next_auth_token(), "auth-token-3")
+
+    async def test_selection_prefers_healthier_tokens(self) -> None:
+        for _ in range(5):
+            self.main.record_auth_token_outcome("auth-token-1", "recaptcha")
+            self.main.record_auth_token_outcome("auth-token-2", "success", latency_ms=4000)
+            self.main.record_auth_token_outcome("auth-token-3", "success", latency_ms=500)
+
+        with patch.object(self.main.random, "random", random.Random(1234).random):
+            picks = [self.main.get_next_auth_token() for _ in range(600)]
+        counts = {token: picks.count(token) for token in ("auth-token-1", "auth-token-2", "auth-token-3")}
+        # Traffic follows health, but the fastest token doesn't take all of it.
+        self.assertGreater(counts["auth-token-3"], counts["auth-token-2"])
+        self.assertGreater(counts["auth-token-2"], counts["auth-token-1"])
+        self.assertLess(counts["auth-token-3"], 600)
+        self.assertGreater(counts["auth-token-2"], 100)
+        # Success clears any cooldown and raises the score again.
+        self.main.record_auth_token_outcome("auth-token-1", "success", latency_ms=100)
+        self.assertFalse(self.main._AUTH_TOKEN_HEALTH["auth-token-1"].cooling_down(0.0))
@@ -0,0 +1,46 @@
+import base64
+import json
+import time
+from unittest.mock import patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+def _session_token(expires_at: int) -> str:
+    session = {"access_token": "header.payload.signature", "refresh_token": "refresh", "expires_at": expires_at}
+    raw = json.dumps(session, separators=(",", ":")).encode("utf-8")
+    return "base64-" + base64.b64encode(raw).decode("utf-8").rstrip("=")
+
+
+class TestAuthTokenPool(BaseBridgeTest):
+    async def test_pool_is_reused_until_token_list_changes(self) -> None:
+        self.setup_config({"auth_tokens": ["auth-token-1", "auth-token-2"]})
+        pool = self.main.get_auth_token_pool()
+        self.assertIs(self.main.get_auth_token_pool(), pool)
+
+        with patch.object(self.main, "get_arena_auth_token_expiry_epoch") as decode:
+            self.main.get_next_auth_token()
+            self.main.get_next_auth_token()
+        decode.assert_not_called()
+
+        config = self.main.get_config()
+        config["auth_tokens"] = ["auth-token-3"]
+        self.main.save_config(config, preserve_auth_tokens=False)
+        self.assertIsNot(self.main.get_auth_token_pool(), pool)
+        self.assertEqual(self.main.get_next_auth_token(), "auth-token-3")
+
+    async def test_prefers_valid_sessions_and_round_robins(self) -> None:
+        now = int(time.time())
+        valid_a = _session_token(now + 3600)
+        valid_b = _session_token(now + 7200)
+        expired = _session_token(now - 10)
+        pool = self.main.AuthTokenPool(["placeholder", expired, valid_a, valid_b])
+
+        self.assertEqual(pool.active_tokens(), [valid_a, valid_b])
+        self.assertEqual(pool.select(0), valid_a)
+        self.assertEqual(pool.select(1), valid_b)
+        self.assertEqual(pool.select(0, {valid_a}), valid_b)
+        self.assertIsNone(pool.select(0, {valid_a, valid_b}))
+
+        # Once both valid sessions expire, refreshable base64 sessions are still preferred over placeholders.
+        self.assertEqual(pool.active_tokens(now=now + 7200), [expired, valid_a, valid_b])
@@ -0,0 +1,91 @@
+import base64
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+def _session_token(expires_at: int, refresh_token: str = "refresh") -> str:
+    session = {"access_token": "header.payload.signature", "refresh_token": refresh_token, "expires_at": expires_at}
+    raw = json.dumps(session, separators=(",", ":")).encode("utf-8")
+    return "base64-" + base64.b64encode(raw).decode("utf-8").rstrip("=")
+
+
+class TestAuthTokenProactiveRefresh(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        now = int(time.time())
+        self.expiring = _session_token(now + 60, "refresh-a")
+        self.healthy = _session_token(now + 7200, "refresh-b")
+        self.refreshed = _session_token(now + 3600, "refresh-c")
+        self.setup_config({"auth_tokens": [self.expiring, self.healthy]})
+        self.main._AUTH_TOKEN_REPLACEMENTS.clear()
+        self.main._AUTH_TOKEN_REFRESH_BACKOFF.clear()
+
+    async def asyncTearDown(self) -> None:
+        self.main._AUTH_TOKEN_REPLACEMENTS.clear()
+        self.main._AUTH_TOKEN_REFRESH_BACKOFF.clear()
+        await super().asyncTearDown()
+
+    async def test_refreshes_before_expiry_and_publishes_into_pool(self) -> None:
+        pool = self.main.get_auth_token_pool()
+        due = self.main._auth_tokens_due_for_refresh(pool, time.time(), 300.0)
+        self.assertEqual(due, [(self.expiring, self.expiring)])
+
+        with patch.object(
+            self.main, "refresh_arena_auth_token_via_lmarena_http", AsyncMock(return_value=self.refreshed)
+        ):
+            new_token = await self.main.refresh_auth_token_proactively(self.expiring, self.expiring)
+
+        self.assertEqual(new_token, self.refreshed)
+        pool = self.main.get_auth_token_pool()
+        self.assertEqual(pool.tokens, (self.refreshed, self.healthy))
+        self.assertEqual(pool.source_tokens, (self.refreshed, self.healthy))
+        self.assertEqual(self.main._auth_tokens_due_for_refresh(pool, time.time(), 300.0), [])
+        self.main.current_token_index = 0
+        self.assertEqual(self.main.get_next_auth_token(), self.refreshed)
+
+    async def test_refreshed_token_survives_config_reload(self) -> None:
+        with patch.object(
+            self.main, "refresh_arena_auth_token_via_lmarena_http", AsyncMock(return_value=self.refreshed)
+        ):
+            await self.main.refresh_auth_token_proactively(self.expiring, self.expiring)
+
+        on_disk = json.loads(self._config_path.read_text(encoding="utf-8"))
+        self.assertEqual(on_disk["auth_tokens"], [self.refreshed, self.healthy])
+
+        # A restart loses in-memory replacements; the pool must still come up with the refreshed session.
+        self.main._AUTH_TOKEN_REPLACEMENTS.clear()
+        self.main._AUTH_TOKEN_POOL = None
+        self.main.invalidate_config_cache()
+        pool = self.main.get_auth_token_pool()
+        self.assertEqual(pool.tokens, (self.refreshed, self.healthy))
+
+    async def test_refresh_does_not_resurrect_token_removed_from_config(self) -> None:
+        self.main.get_auth_token_pool()
+        # Dashboard removes the expiring token while its refresh is in flight.
+        self.setup_config({"auth_tokens": [self.healthy]})
+        self.main.publish_refreshed_auth_token(self.expiring, self.refreshed, persist=True)
+
+        on_disk = json.loads(self._config_path.read_text(encoding="utf-8"))
+        self.assertEqual(on_disk["auth_tokens"], [self.healthy])
+
+    async def test_failed_refresh_backs_off(self) -> None:
+        with patch.object(
+            self.main, "refresh_arena_auth_token_via_lmarena_http", AsyncMock(return_value=None)
+        ), patch.object(self.main, "refresh_arena_auth_token_via_supabase", AsyncMock(return_value=None)):
+            self.assertIsNone(await self.main.refresh_auth_token_proactively(self.expiring, self.expiring))
+
+        pool = self.main.get_auth_token_pool()
+        self.assertEqual(self.main._auth_tokens_due_for_refresh(pool, time.time(), 300.0), [])
+        self.assertEqual(self.main._AUTH_TOKEN_REFRESH_BACKOFF[self.expiring][0], 1)
+
+    async def test_request_path_refresh_stays_in_memory(self) -> None:
+        self.main.get_auth_token_pool()
+        config_before = self._config_path.read_text(encoding="utf-8")
+
+        self.assertTrue(self.main.publish_refreshed_auth_token(self.expiring, self.refreshed))
+
+        self.assertEqual(self._config_path.read_text(encoding="utf-8"), config_before)
+        self.assertEqual(self.main.get_auth_token_pool().tokens, (self.refreshed, self.healthy))
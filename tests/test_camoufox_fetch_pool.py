@@ -0,0 +1,104 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+_real_sleep = asyncio.sleep
+
+
+class _StreamingPage:
+    def __init__(self) -> None:
+        self.url = "https://lmarena.ai/?mode=direct"
+        self.binding = None
+        self.finish = asyncio.Event()
+        self.is_closed = MagicMock(return_value=False)
+        self.mouse = MagicMock(move=AsyncMock(), wheel=AsyncMock())
+        self.close = AsyncMock()
+
+    async def goto(self, *args, **kwargs) -> None:
+        return None
+
+    async def title(self) -> str:
+        return "LMArena"
+
+    async def expose_binding(self, name, callback) -> None:
+        self.binding = callback
+
+    async def evaluate(self, script, arg=None):
+        if isinstance(script, str) and script.lstrip().startswith("async ({url, method, body, extraHeaders"):
+            channel = arg["channel"]
+            await self.binding(None, '{"__type":"meta","status":200,"headers":{}}', channel)
+            await self.binding(None, 'a0:"Hel"', channel)
+            await self.finish.wait()
+            await self.binding(None, 'a0:"lo"', channel)
+            return {"__streaming": True}
+        if script == "() => navigator.userAgent":
+            return "ua"
+        return None
+
+
+class TestCamoufoxFetchPool(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.main.CAMOUFOX_FETCH_POOL = self.main.CamoufoxContextPool()
+        self.pages: list[_StreamingPage] = []
+
+        def _new_page():
+            page = _StreamingPage()
+            self.pages.append(page)
+            return page
+
+        self.context = AsyncMock()
+        self.context.new_page.side_effect = _new_page
+        self.browser = AsyncMock()
+        self.browser.new_context.return_value = self.context
+        self.camoufox = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=self.browser)))
+        self._patches = [
+            patch.object(self.main, "AsyncCamoufox", self.camoufox),
+            patch.object(self.main, "get_recaptcha_settings", return_value=("sitekey", "action")),
+            patch.object(self.main, "_get_arena_context_cookies", AsyncMock(return_value=[])),
+            patch.object(self.main, "_upsert_browser_session_into_config", return_value=False),
+            patch.object(self.main, "_maybe_apply_camoufox_window_mode", AsyncMock()),
+            patch.object(self.main, "click_turnstile", AsyncMock(return_value=True)),
+            patch.object(self.main.asyncio, "sleep", AsyncMock()),
+        ]
+        for p in self._patches:
+            p.start()
+
+    async def asyncTearDown(self) -> None:
+        for p in reversed(self._patches):
+            p.stop()
+        await super().asyncTearDown()
+
+    async def _fetch(self):
+        return await self.main.fetch_lmarena_stream_via_camoufox(
+            "POST", "https://lmarena.ai/nextjs-api/stream", {"recaptchaV3Token": "token"}, "auth-token"
+        )
+
+    async def test_lines_stream_before_fetch_finishes_and_browser_is_reused(self) -> None:
+        resp = await self._fetch()
+        self.assertEqual(resp.status_code, 200)
+
+        lines = resp.aiter_lines()
+        self.assertEqual(await asyncio.wait_for(lines.__anext__(), timeout=1), 'a0:"Hel"')
+        # Still streaming: the page stays leased.
+        self.assertEqual(self.main.CAMOUFOX_FETCH_POOL.snapshot()["leased_pages"], 1)
+
+        self.pages[0].finish.set()
+        self.assertEqual(await asyncio.wait_for(lines.__anext__(), timeout=2), 'a0:"lo"')
+        for _ in range(20):
+            if self.main.CAMOUFOX_FETCH_POOL.snapshot()["idle_pages"] == 1:
+                break
+            await _real_sleep(0.01)
+        self.assertEqual(self.main.CAMOUFOX_FETCH_POOL.snapshot()["idle_pages"], 1)
+
+        second = await self._fetch()
+        self.assertEqual(second.status_code, 200)
+        self.camoufox.assert_called_once()
+        self.assertEqual(len(self.pages), 1)
+        self.assertEqual(self.main.CAMOUFOX_FETCH_POOL.snapshot()["reused"], 1)
+
+    async def test_launch_failure_returns_none(self) -> None:
+        self.browser.new_context.side_effect = RuntimeError("boom")
+        self.assertIsNone(await self._fetch())
+        self.assertFalse(self.main.CAMOUFOX_FETCH_POOL.snapshot()["running"])
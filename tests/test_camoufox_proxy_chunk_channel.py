@@ -0,0 +1,55 @@
+import asyncio
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestCamoufoxProxyChunkChannel(BaseBridgeTest):
+    def _add_job(self, job_id: str) -> dict:
+        job = {
+            "lines_queue": asyncio.Queue(),
+            "done_event": asyncio.Event(),
+            "status_event": asyncio.Event(),
+            "done": False,
+        }
+        self.main._USERSCRIPT_PROXY_JOBS[job_id] = job
+        return job
+
+    async def _drain(self, job: dict) -> list:
+        lines = []
+        while not job["lines_queue"].empty():
+            lines.append(job["lines_queue"].get_nowait())
+        return lines
+
+    async def test_out_of_order_chunks_are_delivered_in_sequence(self) -> None:
+        job = self._add_job("job-a")
+
+        await self.main.deliver_proxy_chunk("job-a", {"seq": 3, "lines": ['a0:"c"'], "done": False})
+        await self.main.deliver_proxy_chunk("job-a", {"seq": 2, "lines": ['a0:"a"', 'a0:"b"'], "done": False})
+        self.assertFalse(job["status_event"].is_set())
+        self.assertEqual(await self._drain(job), [])
+
+        await self.main.deliver_proxy_chunk("job-a", {"seq": 1, "status": 200, "headers": {}})
+        await self.main.deliver_proxy_chunk("job-a", {"seq": 4, "lines": [], "done": True})
+
+        self.assertEqual(job["status_code"], 200)
+        self.assertEqual(await self._drain(job), ['a0:"a"', 'a0:"b"', 'a0:"c"', None])
+        self.assertTrue(job["done_event"].is_set())
+        self.assertEqual(job["_proxy_seq_pending"], {})
+
+    async def test_concurrent_deliveries_keep_order(self) -> None:
+        job = self._add_job("job-a")
+        chunks = [{"seq": i, "lines": [f"line-{i}"], "done": False} for i in range(1, 21)]
+
+        await asyncio.gather(*(self.main.deliver_proxy_chunk("job-a", c) for c in reversed(chunks)))
+
+        self.assertEqual(await self._drain(job), [f"line-{i}" for i in range(1, 21)])
+
+    async def test_unsequenced_and_unknown_job_chunks(self) -> None:
+        job = self._add_job("job-a")
+
+        # Chunks without `seq` (older scripts, Python-side errors) go straight through.
+        await self.main.deliver_proxy_chunk("job-a", {"error": "boom", "done": True})
+        await self.main.deliver_proxy_chunk("missing", {"seq": 1, "lines": ["x"], "done": False})
+
+        self.assertEqual(job["error"], "boom")
+        self.assertEqual(await self._drain(job), [None])
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import queue
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestCamoufoxProxyFarm(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.spawned: list[dict] = []
+        self.farm = self.main.CamoufoxProxyFarm()
+        self.farm.RESTART_BACKOFF_SECONDS = 0.0
+
+        def _fake_spawn(worker: dict, config: dict) -> None:
+            worker["process"] = MagicMock(pid=1000 + len(self.spawned), exitcode=1)
+            worker["process"].is_alive.return_value = True
+            worker["jobs"] = queue.Queue()
+            self.spawned.append(worker)
+
+        mp = MagicMock()
+        mp.Queue.side_effect = queue.Queue
+        self._patches = [
+            patch.object(self.main.multiprocessing, "get_context", return_value=mp),
+            patch.object(self.farm, "_spawn", _fake_spawn),
+        ]
+        for p in self._patches:
+            p.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.farm.close()
+        for p in reversed(self._patches):
+            p.stop()
+        await super().asyncTearDown()
+
+    async def _enqueue(self, job_id: str) -> dict:
+        job = {
+            "phase": "queued",
+            "payload": {"body": job_id},
+            "arena_auth_token": "auth",
+            "lines_queue": asyncio.Queue(),
+            "done_event": asyncio.Event(),
+            "status_event": asyncio.Event(),
+            "picked_up_event": asyncio.Event(),
+            "done": False,
+        }
+        self.main._USERSCRIPT_PROXY_JOBS[job_id] = job
+        await self.main._get_userscript_proxy_queue().put(job_id)
+        return job
+
+    async def _wait_for(self, predicate, timeout: float = 3.0) -> None:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not predicate():
+            if asyncio.get_running_loop().time() > deadline:
+                self.fail("timed out waiting for condition")
+            await asyncio.sleep(0.01)
+
+    async def test_jobs_are_spread_across_workers_and_chunks_relayed(self) -> None:
+        self.assertTrue(self.farm.start({"camoufox_proxy_workers": 2}))
+        job_a = await self._enqueue("job-a")
+        job_b = await self._enqueue("job-b")
+        await self._wait_for(lambda: all(w["jobs"].qsize() == 1 for w in self.spawned))
+
+        self.assertTrue(job_a["picked_up_event"].is_set())
+        message = self.spawned[0]["jobs"].get_nowait()
+        self.assertEqual(message, {"job_id": "job-a", "payload": {"body": "job-a"}, "arena_auth_token": "auth"})
+
+        self.farm._chunks.put(("job-a", {"phase": "fetch"}))
+        self.farm._chunks.put(("job-a", {"status": 200, "lines": ['a0:"hi"'], "done": True}))
+        await asyncio.wait_for(job_a["done_event"].wait(), timeout=3)
+
+        self.assertEqual(job_a["phase"], "fetch")
+        self.assertIsNotNone(job_a["upstream_started_at_monotonic"])
+        self.assertEqual(await job_a["lines_queue"].get(), 'a0:"hi"')
+        self.assertEqual(self.farm.snapshot()["workers"][0]["in_flight"], 0)
+        self.assertEqual(self.farm.snapshot()["workers"][1]["in_flight"], 1)
+        self.assertFalse(job_b["done"])
+
+    async def test_worker_exit_fails_in_flight_jobs_and_restarts(self) -> None:
+        self.farm.start({"camoufox_proxy_workers": 1})
+        job = await self._enqueue("job-a")
+        await self._wait_for(lambda: self.spawned[0]["jobs"].qsize() == 1)
+
+        self.spawned[0]["process"].is_alive.return_value = False
+        await asyncio.wait_for(job["done_event"].wait(), timeout=3)
+        self.assertEqual(job["error"], "camoufox proxy worker exited")
+
+        await self._wait_for(lambda: self.farm.worker_restarts == 1)
+        self.assertEqual(len(self.spawned), 2)
+
+    def test_worker_config_gets_own_profile_and_token_share(self) -> None:
+        config = {"auth_tokens": ["t1", "t2", "t3", "t4"], "browser_cookies": {"cf_clearance": "parent"}}
+        path = Path(self.main._prepare_camoufox_proxy_farm_worker_config(config, 1, 2))
+        worker_config = json.loads(path.read_text())
+
+        self.assertEqual(worker_config["auth_tokens"], ["t2", "t4"])
+        self.assertEqual(worker_config["camoufox_proxy_user_data_dir"], str(path.parent / "profile"))
+        self.assertTrue(worker_config["camoufox_proxy_persistent_context"])
+        self.assertEqual(worker_config["camoufox_proxy_workers"], 0)
+
+        # Cookies the worker saved on an earlier run survive a restart.
+        worker_config["browser_cookies"] = {"cf_clearance": "worker"}
+        path.write_text(json.dumps(worker_config))
+        self.main._prepare_camoufox_proxy_farm_worker_config(config, 1, 2)
+        self.assertEqual(json.loads(path.read_text())["browser_cookies"], {"cf_clearance": "worker"})
+
+    async def test_worker_process_forwards_chunks_to_parent(self) -> None:
+        sink = queue.Queue()
+        self.main._USERSCRIPT_PROXY_JOBS["job-a"] = {"phase": "picked_up"}
+        with patch.object(self.main, "_CAMOUFOX_PROXY_FARM_CHUNK_SINK", sink):
+            self.main._set_userscript_proxy_job_phase("job-a", self.main._USERSCRIPT_PROXY_JOBS["job-a"], "fetch")
+            await self.main.push_proxy_chunk("job-a", {"lines": ["x"], "done": True})
+
+        self.assertEqual(sink.get_nowait(), ("job-a", {"phase": "fetch"}))
+        self.assertEqual(sink.get_nowait(), ("job-a", {"lines": ["x"], "done": True}))
+        self.assertNotIn("job-a", self.main._USERSCRIPT_PROXY_JOBS)
+
+    async def test_farm_is_ready_only_after_a_worker_reports_its_browser_up(self) -> None:
+        self.main._reset_startup_components()
+        self.assertTrue(self.farm.start({"camoufox_proxy_workers": 2}))
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.main.STARTUP_COMPONENTS["proxy_worker"]["status"], "pending")
+
+        sink = queue.Queue()
+        with patch.object(self.main, "_CAMOUFOX_PROXY_FARM_CHUNK_SINK", sink), patch.object(
+            self.main, "_CAMOUFOX_PROXY_FARM_WORKER_INDEX", 1
+        ):
+            self.main._mark_camoufox_proxy_ready()
+        self.farm._chunks.put(sink.get_nowait())
+
+        await self._wait_for(lambda: self.main.STARTUP_COMPONENTS["proxy_worker"]["status"] == "ready")
+        self.assertEqual([w["ready"] for w in self.farm.snapshot()["workers"]], [False, True])
+
+    async def test_cancel_background_task_keeps_the_callers_cancellation(self) -> None:
+        inner = asyncio.create_task(asyncio.sleep(30))
+        outer = asyncio.create_task(self.main._cancel_background_task(inner, timeout_seconds=5))
+        await asyncio.sleep(0)
+        # Shutdown cancels the caller while it is still waiting on the background task.
+        outer.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await outer
+        self.assertTrue(inner.cancelled())
@@ -0,0 +1,184 @@
+import asyncio
+import base64
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class _FakeProxyPage:
+    def __init__(self, release: asyncio.Event, started: list) -> None:
+        self.release = release
+        self.started = started
+        self.url = "https://lmarena.ai/?mode=direct"
+        self.mouse = MagicMock(move=AsyncMock())
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def on(self, *args, **kwargs) -> None:
+        return None
+
+    async def goto(self, *args, **kwargs) -> None:
+        return None
+
+    async def title(self) -> str:
+        return "LMArena"
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def evaluate(self, script, arg=None):
+        if isinstance(script, str) and script.lstrip().startswith("async ({ jid, payload"):
+            self.started.append((arg["jid"], self))
+            await self.release.wait()
+            return None
+        return None
+
+
+class _FakeProxyCamoufox:
+    def __init__(self, context) -> None:
+        self.context = context
+
+    async def __aenter__(self):
+        return MagicMock(new_context=AsyncMock(return_value=self.context))
+
+    async def __aexit__(self, *args) -> None:
+        return None
+
+
+class TestCamoufoxProxyTabs(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.release = asyncio.Event()
+        self.started: list = []
+        self.context = MagicMock()
+        self.context.pages = []
+        self.context.add_init_script = AsyncMock()
+        self.context.add_cookies = AsyncMock()
+        self.context.cookies = AsyncMock(return_value=[])
+
+        async def _new_page():
+            page = _FakeProxyPage(self.release, self.started)
+            self.context.pages.append(page)
+            return page
+
+        self.context.new_page = AsyncMock(side_effect=_new_page)
+        self._patches = [
+            patch.object(self.main, "AsyncCamoufox", lambda *a, **k: _FakeProxyCamoufox(self.context)),
+            patch.object(self.main, "_maybe_apply_camoufox_window_mode", AsyncMock()),
+            patch.object(self.main, "click_turnstile", AsyncMock(return_value=False)),
+        ]
+        for p in self._patches:
+            p.start()
+
+    async def asyncTearDown(self) -> None:
+        for p in reversed(self._patches):
+            p.stop()
+        await super().asyncTearDown()
+
+    async def _enqueue(self, job_id: str, auth_token: str = "") -> None:
+        self.main._USERSCRIPT_PROXY_JOBS[job_id] = {
+            "payload": {},
+            "arena_auth_token": auth_token,
+            "lines_queue": asyncio.Queue(),
+            "done_event": asyncio.Event(),
+            "status_event": asyncio.Event(),
+            "picked_up_event": asyncio.Event(),
+            "phase": "queued",
+            "done": False,
+        }
+        await self.main._get_userscript_proxy_queue().put(job_id)
+
+    async def _wait_for(self, predicate, timeout: float = 3.0) -> None:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not predicate():
+            if asyncio.get_running_loop().time() > deadline:
+                self.fail("timed out waiting for condition")
+            await asyncio.sleep(0.01)
+
+    async def test_jobs_run_concurrently_on_separate_tabs(self) -> None:
+        self.setup_config({"camoufox_proxy_max_tabs": 2})
+        worker = asyncio.create_task(self.main.camoufox_proxy_worker())
+        try:
+            await self._enqueue("job-a")
+            await self._enqueue("job-b")
+            await self._enqueue("job-c")
+            await self._wait_for(lambda: len(self.started) == 2)
+
+            # Both tabs are busy: the third job waits in the queue instead of piling onto a tab.
+            await asyncio.sleep(0.05)
+            self.assertEqual([jid for jid, _ in self.started], ["job-a", "job-b"])
+            self.assertIsNot(self.started[0][1], self.started[1][1])
+            self.assertEqual(self.main._get_userscript_proxy_queue().qsize(), 1)
+            self.assertEqual(self.main.CAMOUFOX_PROXY_TAB_STATS["busy_tabs"], 2)
+
+            self.release.set()
+            await self._wait_for(lambda: len(self.started) == 3)
+            self.assertEqual(self.context.new_page.await_count, 2)
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+    def _use_cookie_jar(self) -> tuple:
+        """Give the fake context a real cookie jar; returns (jar, token_a, token_b)."""
+
+        def _session(refresh_token: str) -> str:
+            # Valid, but inside the 60s skew, so each job prefers its own token over the browser cookie.
+            session = {"access_token": "a.b.c", "refresh_token": refresh_token, "expires_at": int(time.time()) + 30}
+            return "base64-" + base64.b64encode(json.dumps(session).encode("utf-8")).decode("utf-8")
+
+        jar: list = []
+
+        async def _add_cookies(specs):
+            for spec in specs:
+                jar[:] = [c for c in jar if c.get("name") != spec.get("name")] + [dict(spec)]
+
+        self.context.add_cookies = AsyncMock(side_effect=_add_cookies)
+        self.context.cookies = AsyncMock(side_effect=lambda *_a, **_k: list(jar))
+        self.context.expose_binding = AsyncMock()
+        return jar, _session("a"), _session("b")
+
+    async def test_job_with_other_auth_token_waits_for_in_flight_response_headers(self) -> None:
+        jar, token_a, token_b = self._use_cookie_jar()
+        self.setup_config({"camoufox_proxy_max_tabs": 2})
+        worker = asyncio.create_task(self.main.camoufox_proxy_worker())
+        try:
+            await self._enqueue("job-a", token_a)
+            await self._wait_for(lambda: len(self.started) == 1)
+            await self._enqueue("job-b", token_b)
+
+            # job-a's request has no response headers yet: job-b must not swap the shared auth cookie.
+            await asyncio.sleep(0.1)
+            self.assertEqual(len(self.started), 1)
+            self.assertEqual([c["value"] for c in jar], [token_a])
+
+            binding = self.context.expose_binding.await_args.args[1]
+            await binding(None, "job-a", json.dumps({"seq": 1, "status": 200, "headers": {}}))
+            await self._wait_for(lambda: len(self.started) == 2)
+            self.assertEqual([c["value"] for c in jar], [token_b])
+        finally:
+            self.release.set()
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+    async def test_job_waiting_for_send_slot_gets_error_chunk_when_cancelled(self) -> None:
+        _, token_a, token_b = self._use_cookie_jar()
+        self.setup_config({"camoufox_proxy_max_tabs": 2})
+        worker = asyncio.create_task(self.main.camoufox_proxy_worker())
+        try:
+            await self._enqueue("job-a", token_a)
+            await self._wait_for(lambda: len(self.started) == 1)
+            await self._enqueue("job-b", token_b)
+            await asyncio.sleep(0.1)
+            job_b = self.main._USERSCRIPT_PROXY_JOBS["job-b"]
+            self.assertEqual(job_b["phase"], "picked_up")
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+        # job-b was still waiting for the auth-cookie gate: its client must hear about the restart.
+        await asyncio.wait_for(job_b["done_event"].wait(), timeout=3)
+        self.assertEqual(job_b["error"], "camoufox proxy restarted")
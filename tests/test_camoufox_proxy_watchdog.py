@@ -0,0 +1,191 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class _FakeProxyPage:
+    def __init__(self, test: "TestCamoufoxProxyWatchdog") -> None:
+        self.test = test
+        self.url = "https://lmarena.ai/?mode=direct"
+        self.mouse = MagicMock(move=AsyncMock())
+        self.closed = False
+        self.gotos = 0
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def on(self, *args, **kwargs) -> None:
+        return None
+
+    async def goto(self, *args, **kwargs) -> None:
+        self.gotos += 1
+
+    async def title(self) -> str:
+        return "LMArena"
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def evaluate(self, script, arg=None):
+        if isinstance(script, str) and script.lstrip().startswith("async ({ jid, payload"):
+            self.test.started.append((arg["jid"], self))
+            await self.test.release.wait()
+            await self.test.main.push_proxy_chunk(arg["jid"], {"status": 200, "lines": [], "done": True})
+            return None
+        if script == self.test.main._JS_HEAP_USAGE_SCRIPT:
+            return self.test.js_heap
+        return None
+
+
+class _FakeProxyCamoufox:
+    def __init__(self, test: "TestCamoufoxProxyWatchdog") -> None:
+        self.test = test
+
+    async def __aenter__(self):
+        self.test.launches += 1
+        # Shape of an entered Playwright context manager: the driver process sits on its pipe transport.
+        self._connection = MagicMock()
+        self._connection._transport._proc.pid = 4000 + self.test.launches
+        return MagicMock(new_context=AsyncMock(return_value=self.test.context))
+
+    async def __aexit__(self, *args) -> None:
+        return None
+
+
+class TestCamoufoxProxyWatchdog(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        for key in self.main.CAMOUFOX_PROXY_TAB_STATS:
+            self.main.CAMOUFOX_PROXY_TAB_STATS[key] = 0
+        self.release = asyncio.Event()
+        self.started: list = []
+        self.launches = 0
+        self.js_heap = None
+        self.rss_bytes = 0
+        self.rss_pids: list = []
+        self.context = MagicMock()
+        self.context.pages = []
+        self.context.add_init_script = AsyncMock()
+        self.context.add_cookies = AsyncMock()
+        self.context.cookies = AsyncMock(return_value=[])
+
+        async def _new_page():
+            page = _FakeProxyPage(self)
+            self.context.pages.append(page)
+            return page
+
+        self.context.new_page = AsyncMock(side_effect=_new_page)
+        self.real_rss_probe = self.main._browser_process_rss_bytes
+        self._patches = [
+            patch.object(self.main, "AsyncCamoufox", lambda *a, **k: _FakeProxyCamoufox(self)),
+            patch.object(self.main, "_maybe_apply_camoufox_window_mode", AsyncMock()),
+            patch.object(self.main, "click_turnstile", AsyncMock(return_value=False)),
+            patch.object(self.main, "_browser_process_rss_bytes", self._fake_rss),
+        ]
+        for p in self._patches:
+            p.start()
+        self.worker = None
+
+    def _fake_rss(self, root_pid: int) -> int:
+        self.rss_pids.append(root_pid)
+        return self.rss_bytes
+
+    async def asyncTearDown(self) -> None:
+        if self.worker is not None:
+            self.worker.cancel()
+            await asyncio.gather(self.worker, return_exceptions=True)
+        for p in reversed(self._patches):
+            p.stop()
+        await super().asyncTearDown()
+
+    async def _enqueue(self, job_id: str) -> dict:
+        job = {
+            "payload": {},
+            "lines_queue": asyncio.Queue(),
+            "done_event": asyncio.Event(),
+            "status_event": asyncio.Event(),
+            "picked_up_event": asyncio.Event(),
+            "phase": "queued",
+            "done": False,
+        }
+        self.main._USERSCRIPT_PROXY_JOBS[job_id] = job
+        await self.main._get_userscript_proxy_queue().put(job_id)
+        return job
+
+    async def _wait_for(self, predicate, timeout: float = 5.0) -> None:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not predicate():
+            if asyncio.get_running_loop().time() > deadline:
+                self.fail("timed out waiting for condition")
+            await asyncio.sleep(0.01)
+
+    def test_settings_allow_disabling_limits(self) -> None:
+        settings = self.main._get_camoufox_proxy_watchdog_settings({"camoufox_proxy_max_rss_mb": 0})
+        self.assertEqual(settings["max_rss_mb"], 0)
+        self.assertEqual(settings["tab_max_jobs"], 200)
+        self.assertEqual(self.main._get_camoufox_proxy_watchdog_settings({"camoufox_proxy_tab_max_jobs": "x"})["tab_max_jobs"], 200)
+
+    async def test_tab_is_recycled_between_jobs_after_job_limit(self) -> None:
+        self.setup_config({"camoufox_proxy_max_tabs": 1, "camoufox_proxy_tab_max_jobs": 2})
+        self.release.set()
+        self.worker = asyncio.create_task(self.main.camoufox_proxy_worker())
+        jobs = [await self._enqueue(f"job-{i}") for i in range(3)]
+        for job in jobs:
+            await asyncio.wait_for(job["done_event"].wait(), timeout=5)
+
+        main_page = self.started[0][1]
+        self.assertEqual({page for _, page in self.started}, {main_page})
+        self.assertEqual(self.main.CAMOUFOX_PROXY_TAB_STATS["tab_recycles"], 1)
+        # Initial navigation plus one recycle reload.
+        self.assertEqual(main_page.gotos, 2)
+        self.assertEqual(self.launches, 1)
+
+    async def test_browser_drains_in_flight_jobs_before_recycling(self) -> None:
+        self.setup_config({"camoufox_proxy_max_tabs": 2, "camoufox_proxy_browser_max_jobs": 1})
+        self.worker = asyncio.create_task(self.main.camoufox_proxy_worker())
+        job_a = await self._enqueue("job-a")
+        await self._wait_for(lambda: len(self.started) == 1)
+        job_b = await self._enqueue("job-b")
+
+        # The browser is draining: job-b waits instead of landing on a second tab.
+        await asyncio.sleep(0.1)
+        self.assertEqual(len(self.started), 1)
+        self.assertEqual(self.launches, 1)
+
+        self.release.set()
+        await asyncio.wait_for(job_a["done_event"].wait(), timeout=5)
+        await asyncio.wait_for(job_b["done_event"].wait(), timeout=5)
+        self.assertIsNone(job_a.get("error"))
+        self.assertIsNone(job_b.get("error"))
+        self.assertEqual(self.launches, 2)
+        self.assertEqual(self.main.CAMOUFOX_PROXY_TAB_STATS["browser_recycles"], 1)
+
+    async def test_memory_samples_trigger_recycling(self) -> None:
+        self.setup_config(
+            {
+                "camoufox_proxy_watchdog_interval_seconds": 1,
+                "camoufox_proxy_max_rss_mb": 100,
+                "camoufox_proxy_max_js_heap_mb": 50,
+            }
+        )
+        self.rss_bytes = 10 * 1024 * 1024
+        self.js_heap = 80 * 1024 * 1024
+        self.worker = asyncio.create_task(self.main.camoufox_proxy_worker())
+        await self._wait_for(lambda: self.main.CAMOUFOX_PROXY_TAB_STATS["tab_recycles"] == 1)
+        self.assertEqual(self.main.CAMOUFOX_PROXY_TAB_STATS["rss_mb"], 10)
+        self.assertEqual(self.main.CAMOUFOX_PROXY_TAB_STATS["js_heap_mb"], 80)
+        self.assertEqual(self.launches, 1)
+
+        self.js_heap = None
+        self.rss_bytes = 500 * 1024 * 1024
+        await self._wait_for(lambda: self.main.CAMOUFOX_PROXY_TAB_STATS["browser_recycles"] == 1)
+        await self._wait_for(lambda: self.launches == 2)
+        # Only the proxy browser's own driver tree is measured.
+        self.assertEqual(self.rss_pids[0], 4001)
+        self.assertLessEqual(set(self.rss_pids), {4001, 4002})
+
+    def test_rss_probe_returns_bytes_or_none(self) -> None:
+        rss = self.real_rss_probe(os.getpid())
+        self.assertTrue(rss is None or (isinstance(rss, int) and rss > 0))
@@ -0,0 +1,159 @@
+import asyncio
+from unittest.mock import patch
+
+from starlette.background import BackgroundTask
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestChatAdmission(BaseBridgeTest):
+    async def test_round_robin_between_keys(self) -> None:
+        controller = self.main.ChatAdmissionController()
+        limits = {"global_limit": 1, "per_key_limit": 0, "max_queue_depth": 10, "timeout_seconds": 5.0}
+
+        await controller.acquire("key-a", **limits)
+        order: list[str] = []
+
+        async def _wait(key: str) -> None:
+            await controller.acquire(key, **limits)
+            order.append(key)
+
+        tasks = [asyncio.create_task(_wait(k)) for k in ("key-a", "key-a", "key-a", "key-b")]
+        await asyncio.sleep(0)
+        self.assertEqual(controller.queue_depth, 4)
+
+        for _ in range(4):
+            controller.release(order[-1] if order else "key-a", global_limit=1)
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        # key-b shouldn't wait behind every queued key-a request.
+        self.assertEqual(order[:2], ["key-a", "key-b"])
+        self.assertEqual(controller.snapshot()["queued"], 4)
+
+    async def test_per_key_limit_does_not_block_other_keys(self) -> None:
+        controller = self.main.ChatAdmissionController()
+        limits = {"global_limit": 0, "per_key_limit": 1, "max_queue_depth": 10, "timeout_seconds": 5.0}
+
+        await controller.acquire("key-a", **limits)
+        waiter = asyncio.create_task(controller.acquire("key-a", **limits))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        self.assertEqual(await controller.acquire("key-b", **limits), 0.0)
+        controller.release("key-a")
+        await waiter
+        self.assertEqual(controller.in_flight_by_key["key-a"], 1)
+
+    async def test_rejects_when_queue_full_or_wait_times_out(self) -> None:
+        controller = self.main.ChatAdmissionController()
+
+        await controller.acquire("key-a", global_limit=1, per_key_limit=0, max_queue_depth=0, timeout_seconds=1.0)
+        with self.assertRaises(self.main.AdmissionRejected):
+            await controller.acquire("key-b", global_limit=1, per_key_limit=0, max_queue_depth=0, timeout_seconds=1.0)
+
+        with self.assertRaises(self.main.AdmissionRejected):
+            await controller.acquire("key-b", global_limit=1, per_key_limit=0, max_queue_depth=5, timeout_seconds=0.1)
+
+        snapshot = controller.snapshot()
+        self.assertEqual(snapshot["rejected_queue_full"], 1)
+        self.assertEqual(snapshot["rejected_timeout"], 1)
+        self.assertEqual(snapshot["queue_depth"], 0)
+
+        # A timed-out waiter must not consume the slot once it frees up.
+        controller.release("key-a", global_limit=1)
+        self.assertEqual(controller.in_flight_total, 0)
+
+    async def test_slot_is_released_when_client_disconnects_before_first_chunk(self) -> None:
+        self.setup_config({})
+        self.main.CHAT_ADMISSION = self.main.ChatAdmissionController()
+        never = asyncio.Event()
+
+        async def _body():
+            await never.wait()
+            yield "data: never\n\n"
+
+        async def _handle(request, api_key):
+            return self.main.StreamingResponse(_body(), media_type="text/event-stream")
+
+        messages = [{"type": "http.request", "body": b"{}", "more_body": False}, {"type": "http.disconnect"}]
+
+        async def _receive():
+            if messages:
+                return messages.pop(0)
+            await never.wait()
+
+        sent: list = []
+
+        async def _send(message):
+            # The client is already gone: the response can't even start, so the body is never iterated.
+            if message.get("type") == "http.response.start":
+                raise OSError("client disconnected")
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/api/v1/chat/completions",
+            "raw_path": b"/api/v1/chat/completions",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"content-type", b"application/json")],
+            "server": ("test", 80),
+            "client": ("127.0.0.1", 1234),
+        }
+        with patch.object(self.main, "_handle_chat_completion", _handle):
+            try:
+                await asyncio.wait_for(self.main.app(scope, _receive, _send), timeout=2)
+            except OSError:
+                pass
+
+        self.assertEqual(sent, [])
+        self.assertEqual(self.main.CHAT_ADMISSION.in_flight_total, 0)
+
+    async def test_zero_queue_depth_rejects_immediately(self) -> None:
+        self.setup_config({})
+        self.assertEqual(self.main._get_chat_admission_limits({})[2], 64)
+        self.setup_config({"stream_admission_queue_depth": 0})
+        self.main.invalidate_config_cache()
+        self.assertEqual(self.main._get_chat_admission_limits({})[2], 0)
+
+    async def test_slot_response_keeps_status_headers_and_background(self) -> None:
+        background_ran = asyncio.Event()
+        released: list = []
+
+        async def _body():
+            yield "data: ok\n\n"
+
+        async def _background():
+            background_ran.set()
+
+        inner = self.main.StreamingResponse(
+            _body(),
+            status_code=202,
+            headers={"X-Request-Id": "abc"},
+            media_type="text/event-stream",
+            background=BackgroundTask(_background),
+        )
+        response = self.main._AdmissionSlotStreamingResponse(inner, lambda: released.append(True))
+
+        sent: list = []
+
+        async def _receive():
+            await asyncio.Event().wait()
+
+        async def _send(message):
+            sent.append(message)
+
+        await response({"type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}}, _receive, _send)
+
+        start = sent[0]
+        self.assertEqual(start["status"], 202)
+        self.assertIn((b"x-request-id", b"abc"), start["headers"])
+        self.assertIn((b"content-type", b"text/event-stream; charset=utf-8"), start["headers"])
+        self.assertEqual(sent[1]["body"], b"data: ok\n\n")
+        self.assertTrue(background_ran.is_set())
+        self.assertEqual(released, [True])
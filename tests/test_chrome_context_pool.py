@@ -0,0 +1,112 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+_real_sleep = asyncio.sleep
+
+
+def _make_page() -> AsyncMock:
+    page = AsyncMock()
+    page.title.return_value = "LMArena"
+    page.url = "https://lmarena.ai/?mode=direct"
+    page.is_closed = MagicMock(return_value=False)
+
+    async def eval_side_effect(script, arg=None):
+        if script == "() => navigator.userAgent":
+            return "user-agent"
+        if isinstance(script, str) and script.lstrip().startswith("async ({url, method, body, extraHeaders"):
+            return {"status": 200, "headers": {}, "text": "success"}
+        return "recaptcha-token"
+
+    page.evaluate.side_effect = eval_side_effect
+    return page
+
+
+class TestChromeContextPool(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.main.CHROME_FETCH_POOL = self.main.ChromeContextPool()
+        self.context = AsyncMock()
+        self.context.new_page.side_effect = lambda: _make_page()
+        self.context.cookies.return_value = []
+        self.playwright = AsyncMock()
+        self.playwright.chromium.launch_persistent_context.return_value = self.context
+        self.playwright.__aenter__.return_value = self.playwright
+        self._patches = [
+            patch("playwright.async_api.async_playwright", return_value=self.playwright),
+            patch.object(self.main, "find_chrome_executable", return_value="/path/to/chrome"),
+            patch.object(self.main, "get_recaptcha_settings", return_value=("key", "action")),
+            patch.object(self.main, "click_turnstile", AsyncMock(return_value=True)),
+            patch.object(self.main.asyncio, "sleep", AsyncMock()),
+        ]
+        for p in self._patches:
+            p.start()
+
+    async def asyncTearDown(self) -> None:
+        for p in reversed(self._patches):
+            p.stop()
+        await super().asyncTearDown()
+
+    async def _fetch(self) -> object:
+        return await self.main.fetch_lmarena_stream_via_chrome("POST", "https://lmarena.ai/api", {"p": 1}, "token")
+
+    async def test_warm_page_is_reused_across_requests(self) -> None:
+        first = await self._fetch()
+        second = await self._fetch()
+        token = await self.main.get_recaptcha_v3_token_with_chrome({})
+
+        self.assertEqual((first.status_code, second.status_code), (200, 200))
+        self.assertEqual(token, "recaptcha-token")
+        self.playwright.chromium.launch_persistent_context.assert_awaited_once()
+        self.context.new_page.assert_awaited_once()
+        snapshot = self.main.CHROME_FETCH_POOL.snapshot()
+        self.assertEqual(snapshot["leases"], 3)
+        self.assertEqual(snapshot["reused"], 2)
+        self.assertEqual(snapshot["idle_pages"], 1)
+
+    async def test_pages_are_recycled_after_max_uses_or_failure(self) -> None:
+        self.setup_config({"chrome_fetch_pool_max_uses": 1})
+        await self._fetch()
+        await self._fetch()
+        self.assertEqual(self.context.new_page.await_count, 2)
+
+        self.setup_config({"chrome_fetch_pool_max_uses": 50})
+        pool = self.main.CHROME_FETCH_POOL
+        lease = await pool.acquire({}, chrome_path="/path/to/chrome")
+        lease.page.is_closed.return_value = True
+        await pool.release(lease)
+        await pool.acquire({}, chrome_path="/path/to/chrome")
+        self.assertEqual(self.context.new_page.await_count, 4)
+        self.assertEqual(pool.snapshot()["unhealthy"], 1)
+
+    async def test_idle_pages_and_context_are_closed(self) -> None:
+        self.setup_config({"chrome_fetch_pool_idle_seconds": 0})
+        await self._fetch()
+        pool = self.main.CHROME_FETCH_POOL
+        self.assertTrue(pool.snapshot()["running"])
+
+        pool._last_active -= 1
+        for lease in pool._idle:
+            lease.last_used -= 1
+        await pool.shrink_idle()
+
+        self.assertFalse(pool.snapshot()["running"])
+        self.context.close.assert_awaited()
+
+    async def test_different_auth_tokens_take_turns_sending(self) -> None:
+        pool = self.main.CHROME_FETCH_POOL
+        lease = await pool.acquire({}, chrome_path="/path/to/chrome")
+
+        await pool.begin_send(lease, [], "auth-a")
+        other = asyncio.create_task(pool.begin_send(lease, [], "auth-b"))
+        await _real_sleep(0.01)
+        self.assertFalse(other.done())
+
+        # Same token can send concurrently.
+        await asyncio.wait_for(pool.begin_send(lease, [], "auth-a"), timeout=1)
+        await pool.end_send()
+        await _real_sleep(0.01)
+        self.assertFalse(other.done())
+        await pool.end_send()
+        await asyncio.wait_for(other, timeout=1)
@@ -0,0 +1,57 @@
+import json
+import os
+import time
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestConfigCache(BaseBridgeTest):
+    def _age_config_file(self, seconds: float = 60.0) -> None:
+        # Push mtime out of the "racy" window so the cache is allowed to serve hits.
+        old = time.time_ns() - int(seconds * 1_000_000_000)
+        os.utime(self._config_path, ns=(old, old))
+
+    async def test_unchanged_file_is_served_from_cache(self) -> None:
+        self._age_config_file()
+        self.main.get_config()
+        before = self.main.get_config_cache_stats()
+
+        self.main.get_config()
+        self.main.get_config()
+        after = self.main.get_config_cache_stats()
+
+        self.assertEqual(after["reloads"], before["reloads"])
+        self.assertEqual(after["hits"], before["hits"] + 2)
+
+    async def test_returned_config_is_a_private_copy(self) -> None:
+        self._age_config_file()
+        config = self.main.get_config()
+        config["api_keys"].append({"key": "leaked"})
+        config["password"] = "changed"
+
+        fresh = self.main.get_config()
+        self.assertEqual(fresh["password"], "admin")
+        self.assertEqual([k["key"] for k in fresh["api_keys"]], ["test-key"])
+
+    async def test_external_edit_triggers_reload(self) -> None:
+        self._age_config_file(120.0)
+        self.main.get_config()
+
+        data = json.loads(self._config_path.read_text(encoding="utf-8"))
+        data["auth_tokens"] = ["auth-token-1", "auth-token-2"]
+        self._config_path.write_text(json.dumps(data), encoding="utf-8")
+        self._age_config_file(60.0)
+
+        reloads_before = self.main.get_config_cache_stats()["reloads"]
+        config = self.main.get_config()
+        self.assertEqual(config["auth_tokens"], ["auth-token-1", "auth-token-2"])
+        self.assertEqual(self.main.get_config_cache_stats()["reloads"], reloads_before + 1)
+
+    async def test_save_config_writes_through_cache(self) -> None:
+        config = self.main.get_config()
+        config["cf_clearance"] = "cf-new"
+        self.main.save_config(config)
+
+        reloads_before = self.main.get_config_cache_stats()["reloads"]
+        self.assertEqual(self.main.get_config()["cf_clearance"], "cf-new")
+        self.assertEqual(self.main.get_config_cache_stats()["reloads"], reloads_before)
@@ -1,6 +1,10 @@
 import unittest
 from unittest.mock import AsyncMock, patch, MagicMock
 import asyncio
+import json
+
+from tests._stream_test_utils import BaseBridgeTest
+
 
 class TestInitialDataRobustness(unittest.IsolatedAsyncioTestCase):
     async def test_get_initial_data_retries_cloudflare(self):
@@ -39,5 +43,33 @@ class TestInitialDataRobustness(unittest.IsolatedAsyncioTestCase):
             # Should have called click_turnstile multiple times
             self.assertGreaterEqual(mock_click.call_count, 2)
 
+
+class TestInitialDataConfigWrites(BaseBridgeTest):
+    async def test_discovered_params_do_not_overwrite_concurrent_config_writes(self) -> None:
+        page_body = 'grecaptcha.enterprise.execute("6LdiscoveredSitekey", {action: "chat_submit"})'
+
+        async def _content():
+            # The proxy worker saves its session while the initial-data page is still being scraped.
+            self.setup_config({"browser_cookies": {"provisional_user_id": "from-proxy"}, "cf_clearance": "proxy-cf"})
+            return page_body
+
+        mock_page = AsyncMock()
+        mock_page.title.return_value = "LMArena"
+        mock_page.content.side_effect = _content
+        mock_page.context.cookies.return_value = []
+        mock_browser = AsyncMock()
+        mock_browser.new_page.return_value = mock_page
+        mock_browser.__aenter__.return_value = mock_browser
+
+        with patch.object(self.main, "AsyncCamoufox", return_value=mock_browser), patch.object(
+            self.main, "click_turnstile", AsyncMock(return_value=False)
+        ), patch.object(self.main, "save_models"), patch.object(self.main.asyncio, "sleep", AsyncMock()):
+            await self.main.get_initial_data()
+
+        saved = json.loads(self._config_path.read_text(encoding="utf-8"))
+        self.assertEqual(saved["recaptcha_sitekey"], "6LdiscoveredSitekey")
+        self.assertEqual(saved["browser_cookies"], {"provisional_user_id": "from-proxy"})
+        self.assertEqual(saved["cf_clearance"], "proxy-cf")
+
 if __name__ == "__main__":
     unittest.main()
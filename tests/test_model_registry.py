@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+_MODELS = [
+    {
+        "publicName": "chat-model",
+        "id": "id-chat",
+        "organization": "org-a",
+        "capabilities": {
+            "inputCapabilities": {"text": True, "image": True},
+            "outputCapabilities": {"text": True},
+        },
+    },
+    {
+        "publicName": "image-model",
+        "id": "id-image",
+        "organization": "org-a",
+        "capabilities": {"inputCapabilities": {"text": True}, "outputCapabilities": {"image": True}},
+    },
+    {
+        "publicName": "search-model",
+        "id": "id-search",
+        "organization": "org-b",
+        "capabilities": {"inputCapabilities": {"text": True}, "outputCapabilities": {"search": True, "text": True}},
+    },
+    {
+        "publicName": "stealth-model",
+        "id": "id-stealth",
+        "organization": "",
+        "capabilities": {"outputCapabilities": {"text": True}},
+    },
+]
+
+
+class TestModelRegistry(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self._orig_models_file = self.main.MODELS_FILE
+        self._orig_registry = self.main._MODEL_REGISTRY
+        self._models_path = Path(self._temp_dir.name) / "models.json"
+        self._models_path.write_text(json.dumps(_MODELS), encoding="utf-8")
+        self.main.MODELS_FILE = str(self._models_path)
+
+    async def asyncTearDown(self) -> None:
+        self.main.MODELS_FILE = self._orig_models_file
+        self.main._MODEL_REGISTRY = self._orig_registry
+        await super().asyncTearDown()
+
+    async def test_catalog_is_loaded_once_and_indexed(self) -> None:
+        models = self.main.get_models()
+        self.assertIs(self.main.get_models(), models)
+
+        registry = self.main.get_model_registry()
+        self.assertEqual(registry.get("chat-model")["id"], "id-chat")
+        self.assertIsNone(registry.get("missing-model"))
+
+    async def test_precomputed_flags(self) -> None:
+        registry = self.main.get_model_registry()
+        self.assertEqual(registry.get("chat-model")["modality"], "chat")
+        self.assertEqual(registry.get("image-model")["modality"], "image")
+        self.assertEqual(registry.get("search-model")["modality"], "search")
+        self.assertTrue(registry.get("chat-model")["supports_images"])
+        self.assertFalse(registry.get("image-model")["supports_images"])
+        self.assertTrue(registry.get("stealth-model")["stealth"])
+        self.assertFalse(registry.get("chat-model")["stealth"])
+
+    async def test_message_content_uses_precomputed_image_flag(self) -> None:
+        entry = self.main.get_model_registry().get("image-model")
+        content = [
+            {"type": "text", "text": "describe"},
+            {"type": "image_url", "image_url": {"url": "data:image/png;base64,aGVsbG8="}},
+        ]
+        upload = AsyncMock(return_value=("key", "https://cdn.test/key"))
+        with patch.object(self.main, "upload_image_to_lmarena", upload):
+            text, attachments = await self.main.process_message_content(
+                content, {"inputCapabilities": {"image": True}}, supports_images=entry["supports_images"]
+            )
+
+        self.assertEqual(text, "describe")
+        self.assertEqual(attachments, [])
+        upload.assert_not_awaited()
+
+    async def test_save_models_hot_swaps_registry(self) -> None:
+        old = self.main.get_model_registry()
+        self.main.save_models(_MODELS[:1])
+
+        new = self.main.get_model_registry()
+        self.assertIsNot(new, old)
+        self.assertGreater(new.version, old.version)
+        self.assertEqual(len(self.main.get_models()), 1)
+        self.assertIsNone(new.get("image-model"))
+        self.assertEqual(len(json.loads(self._models_path.read_text(encoding="utf-8"))), 1)
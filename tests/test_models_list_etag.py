@@ -0,0 +1,58 @@
+import json
+from unittest.mock import patch
+
+import httpx
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestModelsListETag(BaseBridgeTest):
+    async def test_models_list_is_stable_and_supports_conditional_get(self) -> None:
+        models = [
+            {
+                "publicName": "chat-model",
+                "id": "019a98f7-afcd-779f-8dcb-856cc3b3f078",
+                "organization": "org-a",
+                "capabilities": {"outputCapabilities": {"text": True}},
+            },
+            {
+                "publicName": "stealth-model",
+                "id": "id-stealth",
+                "organization": "",
+                "capabilities": {"outputCapabilities": {"text": True}},
+            },
+            {
+                "publicName": "embedding-model",
+                "id": "id-embed",
+                "organization": "org-b",
+                "capabilities": {"outputCapabilities": {}},
+            },
+        ]
+
+        with patch.object(self.main, "get_models", return_value=models):
+            transport = httpx.ASGITransport(app=self.main.app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                auth = {"Authorization": "Bearer test-key"}
+                first = await client.get("/api/v1/models", headers=auth)
+                second = await client.get("/api/v1/models", headers=auth)
+                not_modified = await client.get(
+                    "/api/v1/models",
+                    headers={**auth, "If-None-Match": first.headers["etag"]},
+                )
+                stale = await client.get("/api/v1/models", headers={**auth, "If-None-Match": '"other"'})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.content, second.content)
+        etag = first.headers.get("etag", "")
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'), etag)
+        self.assertEqual(second.headers.get("etag"), etag)
+
+        body = json.loads(first.content)
+        self.assertEqual([m["id"] for m in body["data"]], ["chat-model"])
+        self.assertEqual(body["data"][0]["created"], 1763502960)
+        self.assertEqual(body["data"][0]["owned_by"], "org-a")
+
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+        self.assertEqual(not_modified.headers.get("etag"), etag)
+        self.assertEqual(stale.status_code, 200)
@@ -0,0 +1,72 @@
+import asyncio
+from unittest.mock import patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestRecaptchaMintCoordinator(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.coordinator = self.main.RecaptchaMintCoordinator()
+        self.pool = self.main.RecaptchaTokenPool()
+        self._patches = [patch.object(self.main, "RECAPTCHA_TOKEN_POOL", self.pool)]
+        for p in self._patches:
+            p.start()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.minted = 0
+        self.release = asyncio.Event()
+
+    async def asyncTearDown(self) -> None:
+        for p in self._patches:
+            p.stop()
+        await super().asyncTearDown()
+
+    async def _fake_mint(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.release.wait()
+            self.minted += 1
+            return f"token-{self.minted}", "chrome"
+        finally:
+            self.in_flight -= 1
+
+    async def test_burst_shares_bounded_parallel_mints(self) -> None:
+        self.setup_config({"recaptcha_max_parallel_mints": 2})
+        with patch.object(self.main, "mint_recaptcha_v3_token_side_channel", self._fake_mint):
+            waiters = [asyncio.create_task(self.coordinator.mint(timeout_seconds=5.0)) for _ in range(10)]
+            await asyncio.sleep(0.05)
+            self.assertEqual(self.in_flight, 2)
+            self.release.set()
+            results = await asyncio.gather(*waiters)
+
+        tokens = [token for token, _ in results]
+        self.assertEqual(len(set(tokens)), 10)
+        self.assertLessEqual(self.max_in_flight, 2)
+        self.assertEqual(self.coordinator.snapshot()["coalesced"], 8)
+        self.assertEqual(self.pool.size(), 0)
+
+    async def test_job_is_cancelled_when_all_waiters_leave(self) -> None:
+        self.setup_config({"recaptcha_pool_enabled": False})
+        with patch.object(self.main, "mint_recaptcha_v3_token_side_channel", self._fake_mint):
+            waiter = asyncio.create_task(self.coordinator.mint(timeout_seconds=5.0))
+            await asyncio.sleep(0.05)
+            self.assertEqual(self.in_flight, 1)
+            waiter.cancel()
+            await asyncio.sleep(0.05)
+
+        self.assertEqual(self.in_flight, 0)
+        self.assertEqual(self.coordinator.snapshot()["cancelled_jobs"], 1)
+
+    async def test_abandoned_job_refills_pool_when_pool_needs_tokens(self) -> None:
+        self.setup_config({"recaptcha_pool_min_size": 1})
+        with patch.object(self.main, "mint_recaptcha_v3_token_side_channel", self._fake_mint):
+            waiter = asyncio.create_task(self.coordinator.mint(timeout_seconds=5.0))
+            await asyncio.sleep(0.05)
+            waiter.cancel()
+            await asyncio.sleep(0)
+            self.release.set()
+            await asyncio.sleep(0.05)
+
+        self.assertEqual(self.pool.take()[:2], ("token-1", "chrome"))
@@ -0,0 +1,130 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class _FakePage:
+    def __init__(self, fail_mints: int = 0) -> None:
+        self.executes = 0
+        self.fail_mints = fail_mints
+        self.mouse = MagicMock(move=AsyncMock(), wheel=AsyncMock())
+
+    async def goto(self, *args, **kwargs) -> None:
+        return None
+
+    async def title(self) -> str:
+        return "LMArena"
+
+    async def wait_for_load_state(self, *args, **kwargs) -> None:
+        return None
+
+    async def evaluate(self, script: str):
+        if "enterprise.execute" in script:
+            self.executes += 1
+            return None
+        if "delete w[" in script:
+            if self.fail_mints > 0:
+                self.fail_mints -= 1
+                return "ERROR: boom"
+            return f"token-{self.executes}"
+        return True
+
+
+class _FakeCamoufox:
+    launches: list["_FakeCamoufox"] = []
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.page = _FakePage()
+        self.closed = False
+        _FakeCamoufox.launches.append(self)
+
+    async def __aenter__(self):
+        context = MagicMock(add_cookies=AsyncMock(), new_page=AsyncMock(return_value=self.page))
+        return MagicMock(new_context=AsyncMock(return_value=context))
+
+    async def __aexit__(self, *args) -> None:
+        self.closed = True
+
+
+class TestRecaptchaMintingSession(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        _FakeCamoufox.launches = []
+        real_sleep = asyncio.sleep
+        self._patches = [
+            patch.object(self.main, "AsyncCamoufox", _FakeCamoufox),
+            patch.object(self.main, "click_turnstile", AsyncMock(return_value=False)),
+            patch.object(self.main.asyncio, "sleep", lambda *_a, **_k: real_sleep(0)),
+        ]
+        for p in self._patches:
+            p.start()
+
+    async def asyncTearDown(self) -> None:
+        for p in reversed(self._patches):
+            p.stop()
+        await super().asyncTearDown()
+
+    async def test_session_is_reused_across_mints(self) -> None:
+        session = self.main.RecaptchaMintingSession()
+
+        first = await session.mint({})
+        second = await session.mint({})
+
+        self.assertEqual((first, second), ("token-1", "token-2"))
+        self.assertEqual(len(_FakeCamoufox.launches), 1)
+        self.assertEqual(session.snapshot()["session_mints"], 2)
+
+        await session.close()
+        self.assertTrue(_FakeCamoufox.launches[0].closed)
+
+    async def test_recycles_after_error_and_repeated_rejections(self) -> None:
+        session = self.main.RecaptchaMintingSession()
+        self.assertEqual(await session.mint({}), "token-1")
+
+        _FakeCamoufox.launches[0].page.fail_mints = 1
+        self.assertIsNone(await session.mint({}))
+        self.assertTrue(_FakeCamoufox.launches[0].closed)
+
+        self.assertEqual(await session.mint({}), "token-1")
+        self.assertEqual(len(_FakeCamoufox.launches), 2)
+
+        for _ in range(session.MAX_CONSECUTIVE_REJECTIONS):
+            session.note_rejection()
+        self.assertEqual(await session.mint({}), "token-1")
+        self.assertEqual(len(_FakeCamoufox.launches), 3)
+        self.assertEqual(session.snapshot()["recycles"], 2)
+
+    async def test_recycles_when_max_mints_reached(self) -> None:
+        session = self.main.RecaptchaMintingSession()
+        config = {"recaptcha_session_max_mints": 2}
+
+        for _ in range(3):
+            self.assertIsNotNone(await session.mint(config))
+        self.assertEqual(len(_FakeCamoufox.launches), 2)
+
+    async def test_stale_failure_does_not_recycle_relaunched_session(self) -> None:
+        session = self.main.RecaptchaMintingSession()
+        self.assertEqual(await session.mint({}), "token-1")
+
+        release = asyncio.Event()
+        real_execute = session._execute
+
+        async def _execute(page, *args):
+            if page is _FakeCamoufox.launches[0].page:
+                await release.wait()
+                raise RuntimeError("grecaptcha execute failed: page closed")
+            return await real_execute(page, *args)
+
+        with patch.object(session, "_execute", _execute):
+            stale = asyncio.create_task(session.mint({}))
+            await asyncio.sleep(0)
+            # Another caller recycles and relaunches while the first execute is still in flight.
+            await session.recycle("test")
+            self.assertEqual(await session.mint({}), "token-1")
+            release.set()
+            self.assertIsNone(await stale)
+
+        self.assertEqual(len(_FakeCamoufox.launches), 2)
+        self.assertFalse(_FakeCamoufox.launches[1].closed)
+        self.assertTrue(session.ready)
@@ -0,0 +1,78 @@
+import time
+from unittest.mock import AsyncMock, patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestRecaptchaSourceTelemetry(BaseBridgeTest):
+    def test_outcomes_are_attributed_to_the_minting_source(self) -> None:
+        stats = self.main.RECAPTCHA_SOURCE_STATS
+        stats.record_mint("chrome", "tok-chrome", 900.0)
+        stats.record_mint("in_page", "tok-page", 200.0)
+
+        self.main.record_recaptcha_token_outcome("tok-chrome", False)
+        self.main.record_recaptcha_token_outcome("tok-page", True)
+        self.main.record_recaptcha_token_outcome(None, False, source="userscript")
+        # Unknown tokens (e.g. supplied by the client) aren't attributed anywhere.
+        self.main.record_recaptcha_token_outcome("tok-unknown", False)
+
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot["chrome"]["rejected"], 1)
+        self.assertEqual(snapshot["chrome"]["mint_latency_ms"], 900)
+        self.assertEqual(snapshot["in_page"]["accepted"], 1)
+        self.assertEqual(snapshot["userscript"]["rejected"], 1)
+        self.assertEqual(set(snapshot), {"chrome", "in_page", "userscript"})
+
+    def test_rank_prefers_fastest_source_meeting_threshold(self) -> None:
+        stats = self.main.RECAPTCHA_SOURCE_STATS
+        config = {"recaptcha_source_min_samples": 3, "recaptcha_source_min_success_rate": 0.5}
+
+        self.assertEqual(stats.rank(["chrome", "camoufox"], config), ["chrome", "camoufox"])
+
+        for i in range(3):
+            stats.record_mint("chrome", f"c{i}", 3000.0)
+            stats.record_mint("camoufox", f"f{i}", 500.0)
+            self.main.record_recaptcha_token_outcome(f"c{i}", True)
+            self.main.record_recaptcha_token_outcome(f"f{i}", True)
+        self.assertEqual(stats.rank(["chrome", "camoufox"], config), ["camoufox", "chrome"])
+
+        # Fast but failing validation: fall behind the slower healthy source.
+        for i in range(5):
+            stats.record_mint("camoufox", f"bad{i}", 500.0)
+            self.main.record_recaptcha_token_outcome(f"bad{i}", False)
+        self.assertFalse(stats.qualifies("camoufox", config))
+        self.assertEqual(stats.rank(["chrome", "camoufox"], config), ["chrome", "camoufox"])
+
+    async def test_side_channel_skips_source_with_failing_tokens(self) -> None:
+        stats = self.main.RECAPTCHA_SOURCE_STATS
+        for i in range(6):
+            stats.record_mint("chrome", f"c{i}", 100.0)
+            self.main.record_recaptcha_token_outcome(f"c{i}", False)
+
+        chrome_mock = AsyncMock(return_value="chrome-token")
+        camoufox_mock = AsyncMock(return_value="camoufox-token")
+        with patch.object(self.main, "get_config", return_value={}), patch.object(
+            self.main, "get_recaptcha_v3_token_with_chrome", chrome_mock
+        ), patch.object(self.main.RECAPTCHA_MINTING_SESSION, "mint", camoufox_mock):
+            token, source = await self.main.mint_recaptcha_v3_token_side_channel()
+
+        self.assertEqual((token, source), ("camoufox-token", "camoufox"))
+        chrome_mock.assert_not_awaited()
+        self.assertEqual(stats.source_of("camoufox-token"), "camoufox")
+
+    def test_disqualified_source_recovers_while_idle(self) -> None:
+        stats = self.main.RECAPTCHA_SOURCE_STATS
+        config = {"recaptcha_source_min_samples": 3, "recaptcha_source_min_success_rate": 0.5}
+        for i in range(6):
+            stats.record_mint("chrome", f"c{i}", 100.0)
+            self.main.record_recaptcha_token_outcome(f"c{i}", False)
+        self.assertFalse(stats.qualifies("chrome", config))
+
+        half_life = stats.RECOVERY_HALF_LIFE_SECONDS
+        with patch.object(self.main.time, "monotonic", return_value=time.monotonic() + 3 * half_life):
+            self.assertTrue(stats.qualifies("chrome", config))
+            # Still bad after recovering: a few fresh rejections disqualify it again.
+            for i in range(4):
+                stats.record_mint("chrome", f"c-retry{i}", 100.0)
+                self.main.record_recaptcha_token_outcome(f"c-retry{i}", False)
+            self.assertFalse(stats.qualifies("chrome", config))
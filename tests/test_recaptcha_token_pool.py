@@ -0,0 +1,77 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestRecaptchaTokenPool(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.pool = self.main.RecaptchaTokenPool()
+        self._pool_patch = patch.object(self.main, "RECAPTCHA_TOKEN_POOL", self.pool)
+        self._pool_patch.start()
+        self.main.RECAPTCHA_TOKEN = None
+
+    async def asyncTearDown(self) -> None:
+        self._pool_patch.stop()
+        self.main.RECAPTCHA_TOKEN = None
+        await super().asyncTearDown()
+
+    async def test_tokens_are_single_use_and_expire(self) -> None:
+        lifetime = self.main.RECAPTCHA_TOKEN_LIFETIME_SECONDS
+        self.pool.put("stale", "chrome", minted_at=time.monotonic() - lifetime)
+        self.pool.put("fresh-1", "chrome")
+        self.pool.put("fresh-2", "camoufox")
+
+        self.assertEqual(self.pool.take()[:2], ("fresh-1", "chrome"))
+        self.assertEqual(self.pool.take()[:2], ("fresh-2", "camoufox"))
+        self.assertIsNone(self.pool.take())
+        snapshot = self.pool.snapshot()
+        self.assertEqual(snapshot["served"], 2)
+        self.assertEqual(snapshot["expired"], 1)
+        self.assertEqual(snapshot["misses"], 1)
+
+    async def test_target_size_follows_demand(self) -> None:
+        self.assertEqual(self.pool.target_size(min_size=1, max_size=4, refill_horizon_seconds=30.0), 1)
+        for _ in range(40):
+            self.pool.take()
+        # 40 requests / 120s window * 30s horizon = 10, capped at max_size.
+        self.assertEqual(self.pool.target_size(min_size=1, max_size=4, refill_horizon_seconds=30.0), 4)
+        self.assertEqual(self.pool.target_size(min_size=1, max_size=20, refill_horizon_seconds=30.0), 10)
+
+    async def test_refresh_hands_out_pooled_tokens_without_caching_them(self) -> None:
+        self.pool.put("pooled-token", "chrome")
+
+        self.assertEqual(await self.main.refresh_recaptcha_token(force_new=True), "pooled-token")
+        self.assertEqual(self.main.get_cached_recaptcha_token(), "")
+        # Pool is empty now and unit tests never mint, so nothing else is available.
+        self.assertIsNone(await self.main.refresh_recaptcha_token(force_new=True))
+
+    async def test_cached_pooled_token_keeps_its_original_expiry(self) -> None:
+        lifetime = self.main.RECAPTCHA_TOKEN_LIFETIME_SECONDS
+        self.pool.put("aged-token", "chrome", minted_at=time.monotonic() - (lifetime - 30))
+
+        self.assertEqual(await self.main.refresh_recaptcha_token(), "aged-token")
+        remaining = (self.main.RECAPTCHA_EXPIRY - datetime.now(timezone.utc)).total_seconds()
+        self.assertGreater(remaining, 25)
+        self.assertLessEqual(remaining, 30)
+
+    async def test_refill_is_idle_by_default_and_while_userscript_proxy_is_active(self) -> None:
+        self.assertEqual(self.main._get_recaptcha_pool_settings({}), (True, 0, 4))
+
+        self.setup_config({"recaptcha_pool_min_size": 2})
+        mint_for_pool = AsyncMock(return_value=True)
+        self.main._touch_userscript_poll(time.time())
+        try:
+            with patch.object(self.main.RECAPTCHA_MINT_COORDINATOR, "mint_for_pool", mint_for_pool):
+                task = asyncio.create_task(self.main.recaptcha_pool_refill_task())
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+        finally:
+            self.main._mark_userscript_proxy_inactive()
+
+        mint_for_pool.assert_not_called()
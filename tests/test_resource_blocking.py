@@ -0,0 +1,66 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+def _route(url: str, resource_type: str) -> MagicMock:
+    route = MagicMock()
+    route.request.url = url
+    route.request.resource_type = resource_type
+    route.continue_ = AsyncMock()
+    route.abort = AsyncMock()
+    return route
+
+
+class TestResourceBlocking(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.main.BROWSER_RESOURCE_BLOCKING_STATS.clear()
+
+    def test_default_policy_blocks_heavy_types_but_not_anti_bot_resources(self) -> None:
+        policy = self.main._get_resource_blocking_policy({})
+        reason = self.main._resource_block_reason
+
+        self.assertEqual(reason("https://lmarena.ai/logo.png", "image", policy), "image")
+        self.assertEqual(reason("https://lmarena.ai/font.woff2", "font", policy), "font")
+        self.assertEqual(reason("https://www.googletagmanager.com/gtag/js", "script", policy), "url")
+        self.assertIsNone(reason("https://lmarena.ai/_next/static/chunks/app.js", "script", policy))
+        self.assertIsNone(reason("https://lmarena.ai/nextjs-api/stream", "fetch", policy))
+        self.assertIsNone(reason("https://www.gstatic.com/recaptcha/releases/x/logo.png", "image", policy))
+        self.assertIsNone(reason("https://challenges.cloudflare.com/cdn-cgi/img.png", "image", policy))
+        self.assertIsNone(reason("data:image/png;base64,xx", "image", policy))
+
+    def test_policy_is_configurable(self) -> None:
+        self.assertIsNone(self.main._get_resource_blocking_policy({"browser_resource_blocking_enabled": False}))
+
+        policy = self.main._get_resource_blocking_policy(
+            {
+                "browser_blocked_resource_types": ["media"],
+                "browser_blocked_url_patterns": ["ads.example"],
+                "browser_resource_allowlist": ["cdn.example/keep"],
+            }
+        )
+        reason = self.main._resource_block_reason
+        self.assertIsNone(reason("https://lmarena.ai/logo.png", "image", policy))
+        self.assertEqual(reason("https://lmarena.ai/clip.mp4", "media", policy), "media")
+        self.assertEqual(reason("https://ads.example/pixel", "xhr", policy), "url")
+        self.assertIsNone(reason("https://cdn.example/keep/clip.mp4", "media", policy))
+
+    async def test_routes_are_aborted_or_continued_and_counted(self) -> None:
+        target = MagicMock(route=AsyncMock())
+        self.assertTrue(await self.main._install_resource_blocking(target, {}))
+        handler = target.route.await_args.args[1]
+
+        image = _route("https://lmarena.ai/a.png", "image")
+        script = _route("https://lmarena.ai/app.js", "script")
+        await handler(image)
+        await handler(script)
+
+        image.abort.assert_awaited_once_with("blockedbyclient")
+        script.continue_.assert_awaited_once()
+        stats = self.main.BROWSER_RESOURCE_BLOCKING_STATS
+        self.assertEqual((stats["blocked"], stats["blocked_image"], stats["allowed"]), (1, 1, 1))
+
+        disabled = MagicMock(route=AsyncMock())
+        self.assertFalse(await self.main._install_resource_blocking(disabled, {"browser_resource_blocking_enabled": False}))
+        disabled.route.assert_not_awaited()
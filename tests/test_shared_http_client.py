@@ -0,0 +1,40 @@
+import httpx
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestSharedHttpClient(BaseBridgeTest):
+    async def asyncTearDown(self) -> None:
+        await self.main.close_shared_http_client()
+        await super().asyncTearDown()
+
+    async def test_client_is_reused_until_closed(self) -> None:
+        client = self.main.get_shared_http_client()
+        self.assertIsInstance(client, httpx.AsyncClient)
+        self.assertIs(self.main.get_shared_http_client(), client)
+        self.assertTrue(self.main.get_shared_http_client_stats()["open"])
+
+        await self.main.close_shared_http_client()
+        self.assertTrue(client.is_closed)
+        self.assertFalse(self.main.get_shared_http_client_stats()["open"])
+        self.assertIsNot(self.main.get_shared_http_client(), client)
+
+    async def test_responses_do_not_leak_cookies_between_requests(self) -> None:
+        client = self.main.get_shared_http_client()
+        request = httpx.Request("GET", "https://lmarena.ai/")
+        response = httpx.Response(
+            200, headers={"set-cookie": "arena-auth-prod-v1=secret; Domain=lmarena.ai; Path=/"}, request=request
+        )
+        client.cookies.extract_cookies(response)
+        self.assertEqual(len(client.cookies), 0)
+
+    async def test_limits_come_from_config(self) -> None:
+        client = self.main._build_shared_http_client(
+            {"http_max_connections": 8, "http_max_keepalive_connections": 50, "http2_enabled": False}
+        )
+        try:
+            pool = client._transport._pool
+            self.assertEqual(pool._max_connections, 8)
+            self.assertEqual(pool._max_keepalive_connections, 8)
+        finally:
+            await client.aclose()
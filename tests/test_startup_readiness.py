@@ -0,0 +1,108 @@
+import asyncio
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestStartupReadiness(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.main._reset_startup_components()
+        self.initial_data_release = asyncio.Event()
+
+        async def _slow_initial_data():
+            await self.initial_data_release.wait()
+
+        def _start_farm(config: dict) -> bool:
+            # A farm worker reports its browser up over the chunk queue shortly after being spawned.
+            asyncio.get_running_loop().call_soon(self.main._set_startup_component, "proxy_worker", "ready")
+            return True
+
+        self._patches = [
+            patch.object(self.main, "get_initial_data", _slow_initial_data),
+            patch.object(self.main, "maybe_refresh_expired_auth_tokens", AsyncMock(return_value=None)),
+            patch.object(self.main, "CAMOUFOX_PROXY_FARM", MagicMock(start=MagicMock(side_effect=_start_farm), close=AsyncMock())),
+        ]
+        for p in self._patches:
+            p.start()
+
+    async def asyncTearDown(self) -> None:
+        self.initial_data_release.set()
+        await self.main._cancel_background_task(self.main._STARTUP_WARMUP_TASK)
+        self.main._STARTUP_WARMUP_TASK = None
+        for p in reversed(self._patches):
+            p.stop()
+        await super().asyncTearDown()
+
+    async def _get(self, path: str) -> httpx.Response:
+        transport = httpx.ASGITransport(app=self.main.app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path)
+
+    async def test_startup_returns_before_warm_up_finishes(self) -> None:
+        background = {
+            name: AsyncMock()
+            for name in (
+                "prewarm_shared_http_client",
+                "periodic_refresh_task",
+                "usage_stats_flush_task",
+                "auth_token_refresh_task",
+                "recaptcha_pool_refill_task",
+                "browser_fetch_pool_reaper_task",
+            )
+        }
+        background["save_models"] = MagicMock()
+        with patch.dict(os.environ), patch.multiple(self.main, **background):
+            os.environ.pop("PYTEST_CURRENT_TEST", None)
+            await asyncio.wait_for(self.main.startup_event(), timeout=2)
+
+        warmup = self.main._STARTUP_WARMUP_TASK
+        self.assertIsNotNone(warmup)
+        for _ in range(50):
+            if self.main.STARTUP_COMPONENTS["proxy_worker"]["status"] == "ready":
+                break
+            await asyncio.sleep(0.01)
+        self.assertFalse(warmup.done())
+        self.assertEqual(self.main.STARTUP_COMPONENTS["initial_data"]["status"], "running")
+        self.assertEqual(self.main.STARTUP_COMPONENTS["auth_refresh"]["status"], "ready")
+        # The proxy worker does not wait for the initial-data browser.
+        self.assertEqual(self.main.STARTUP_COMPONENTS["proxy_worker"]["status"], "ready")
+
+        self.initial_data_release.set()
+        await asyncio.wait_for(warmup, timeout=2)
+        self.assertEqual(self.main.STARTUP_COMPONENTS["initial_data"]["status"], "ready")
+
+    async def test_readiness_gates_on_models_and_proxy_worker(self) -> None:
+        live = await self._get("/api/v1/health/live")
+        self.assertEqual(live.status_code, 200)
+        self.assertEqual(live.json()["status"], "alive")
+
+        with patch.object(self.main, "get_models", return_value=[{"publicName": "m", "id": "1"}]):
+            warming = await self._get("/api/v1/health/ready")
+            self.assertEqual(warming.status_code, 503)
+            body = json.loads(warming.content)
+            self.assertEqual(body["status"], "warming_up")
+            self.assertTrue(body["models_loaded"])
+            self.assertEqual(body["components"]["proxy_worker"]["status"], "pending")
+
+            self.main._set_startup_component("proxy_worker", "ready")
+            ready = await self._get("/api/v1/health/ready")
+            self.assertEqual(ready.status_code, 200)
+            self.assertEqual(ready.json()["status"], "ready")
+
+        with patch.object(self.main, "get_models", return_value=[]):
+            self.assertEqual((await self._get("/api/v1/health/ready")).status_code, 503)
+
+    async def test_failed_component_is_reported(self) -> None:
+        with patch.object(self.main, "get_initial_data", AsyncMock(side_effect=RuntimeError("no browser"))):
+            self.initial_data_release.set()
+            await self.main.startup_warmup_task()
+
+        initial = self.main.get_startup_readiness()["components"]["initial_data"]
+        self.assertEqual(initial["status"], "failed")
+        self.assertEqual(initial["error"], "no browser")
+        self.assertIsNotNone(initial["finished_at"])
@@ -0,0 +1,49 @@
+import json
+from collections import defaultdict
+from pathlib import Path
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestUsageStatsPersistence(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self._orig_stats_file = self.main.USAGE_STATS_FILE
+        self._orig_stats = self.main.model_usage_stats
+        self._stats_path = Path(self._temp_dir.name) / "usage_stats.json"
+        self.main.USAGE_STATS_FILE = str(self._stats_path)
+        self.main.model_usage_stats = defaultdict(int)
+        self.main._USAGE_STATS_DIRTY = False
+
+    async def asyncTearDown(self) -> None:
+        self.main.USAGE_STATS_FILE = self._orig_stats_file
+        self.main.model_usage_stats = self._orig_stats
+        self.main._USAGE_STATS_DIRTY = False
+        await super().asyncTearDown()
+
+    async def test_record_does_not_touch_disk_until_flush(self) -> None:
+        config_before = self._config_path.read_text(encoding="utf-8")
+
+        self.main.record_model_usage("model-a")
+        self.main.record_model_usage("model-a")
+        self.main.record_model_usage("model-b")
+
+        self.assertFalse(self._stats_path.exists())
+        self.assertEqual(self._config_path.read_text(encoding="utf-8"), config_before)
+
+        self.assertTrue(self.main.flush_usage_stats())
+        self.assertEqual(json.loads(self._stats_path.read_text(encoding="utf-8")), {"model-a": 2, "model-b": 1})
+        # Nothing new to write.
+        self.assertFalse(self.main.flush_usage_stats())
+        self.assertEqual(self._config_path.read_text(encoding="utf-8"), config_before)
+
+    async def test_load_migrates_legacy_config_stats(self) -> None:
+        self.setup_config({"usage_stats": {"legacy-model": 5}})
+
+        self.main.load_usage_stats()
+        self.assertEqual(self.main.model_usage_stats["legacy-model"], 5)
+
+        self.assertTrue(self.main.flush_usage_stats())
+        self.main.model_usage_stats = defaultdict(int)
+        self.main.load_usage_stats()
+        self.assertEqual(dict(self.main.model_usage_stats), {"legacy-model": 5})
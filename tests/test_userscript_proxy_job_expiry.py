@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestUserscriptProxyJobExpiry(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.main._USERSCRIPT_PROXY_JOB_DEADLINES.clear()
+        self.main.USERSCRIPT_PROXY_JOB_EXPIRY_STATS.clear()
+        self.clock = 1000.0
+        self._clock_patch = patch.object(self.main.time, "monotonic", lambda: self.clock)
+        self._clock_patch.start()
+
+    async def asyncTearDown(self) -> None:
+        self._clock_patch.stop()
+        await super().asyncTearDown()
+
+    async def _new_job(self) -> str:
+        resp = await self.main.fetch_lmarena_stream_via_userscript_proxy("POST", "https://lmarena.ai/x", {})
+        return resp.job_id
+
+    def test_timeouts_default_from_ttl_and_are_overridable(self) -> None:
+        timeouts = self.main._get_userscript_proxy_job_timeouts(
+            {"userscript_proxy_job_ttl_seconds": 60, "userscript_proxy_job_signup_timeout_seconds": 20}
+        )
+        self.assertEqual(timeouts, {"queued": 60.0, "picked_up": 60.0, "signup": 20.0, "fetch": 300.0, "done": 60.0})
+
+    async def test_jobs_expire_per_phase_and_are_counted(self) -> None:
+        self.setup_config({"userscript_proxy_job_ttl_seconds": 60})
+        jobs = self.main._USERSCRIPT_PROXY_JOBS
+        queued = await self._new_job()
+        picked = await self._new_job()
+        fetching = await self._new_job()
+
+        self.clock += 30
+        self.main._claim_userscript_proxy_job(picked)
+        self.main._set_userscript_proxy_job_phase(fetching, jobs[fetching], "fetch")
+
+        self.clock += 31
+        self.main._cleanup_userscript_proxy_jobs()
+        self.assertNotIn(queued, jobs)
+        self.assertIn(picked, jobs)  # its picked_up budget started at the claim
+
+        self.clock += 30
+        self.main._cleanup_userscript_proxy_jobs()
+        self.assertNotIn(picked, jobs)
+        self.assertIn(fetching, jobs)
+
+        await self.main.push_proxy_chunk(fetching, {"status": 200, "lines": [], "done": True})
+        self.clock += 61
+        self.main._cleanup_userscript_proxy_jobs()
+        self.assertNotIn(fetching, jobs)
+
+        stats = self.main.get_userscript_proxy_job_stats()
+        self.assertEqual(stats["expired"], {"queued": 1, "picked_up": 1, "signup": 0, "fetch": 0, "done": 1})
+        self.assertEqual(stats["active"], 0)
+
+    async def test_unobserved_phase_change_gets_a_fresh_deadline(self) -> None:
+        self.setup_config({"userscript_proxy_job_ttl_seconds": 60})
+        job_id = await self._new_job()
+        job = self.main._USERSCRIPT_PROXY_JOBS[job_id]
+        # Set directly, the way the in-process Camoufox worker marks pickups.
+        job["phase"] = "picked_up"
+
+        self.clock += 61
+        self.main._cleanup_userscript_proxy_jobs()
+        self.assertIn(job_id, self.main._USERSCRIPT_PROXY_JOBS)
+        self.assertEqual(job["_expiry_phase"], "picked_up")
+
+        self.clock += 61
+        self.main._cleanup_userscript_proxy_jobs()
+        self.assertNotIn(job_id, self.main._USERSCRIPT_PROXY_JOBS)
+        self.assertEqual(self.main.USERSCRIPT_PROXY_JOB_EXPIRY_STATS["picked_up"], 1)
+
+    async def test_cleanup_skips_jobs_that_are_not_due(self) -> None:
+        for _ in range(50):
+            await self._new_job()
+        deadlines = list(self.main._USERSCRIPT_PROXY_JOB_DEADLINES)
+
+        with patch.object(self.main, "_userscript_proxy_job_expiry_phase", side_effect=AssertionError("scanned")):
+            self.main._cleanup_userscript_proxy_jobs()
+
+        self.assertEqual(self.main._USERSCRIPT_PROXY_JOB_DEADLINES, deadlines)
+        self.assertEqual(len(self.main._USERSCRIPT_PROXY_JOBS), 50)
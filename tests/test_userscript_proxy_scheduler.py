@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import httpx
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class TestUserscriptProxyScheduler(BaseBridgeTest):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.main.USERSCRIPT_PROXY_SCHEDULER = self.main.UserscriptProxyScheduler()
+        self.scheduler = self.main.USERSCRIPT_PROXY_SCHEDULER
+
+    async def asyncTearDown(self) -> None:
+        await self.scheduler.close()
+        await super().asyncTearDown()
+
+    async def _enqueue(self, job_id: str) -> dict:
+        job = {
+            "payload": {"id": job_id},
+            "lines_queue": asyncio.Queue(),
+            "done_event": asyncio.Event(),
+            "status_event": asyncio.Event(),
+            "picked_up_event": asyncio.Event(),
+            "phase": "queued",
+            "done": False,
+            "created_at": time.time(),
+        }
+        self.main._USERSCRIPT_PROXY_JOBS[job_id] = job
+        await self.main._get_userscript_proxy_queue().put(job_id)
+        return job
+
+    async def test_poll_returns_up_to_capacity_jobs(self) -> None:
+        for i in range(4):
+            await self._enqueue(f"job-{i}")
+
+        transport = httpx.ASGITransport(app=self.main.app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.post("/api/v1/userscript/poll", json={"poller_id": "tab-1", "capacity": 3, "timeout_seconds": 1})
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual([j["job_id"] for j in resp.json()["jobs"]], ["job-0", "job-1", "job-2"])
+
+            # At capacity: nothing more until a job finishes.
+            full = await client.post("/api/v1/userscript/poll", json={"poller_id": "tab-1", "timeout_seconds": 0})
+            self.assertEqual(full.status_code, 204)
+
+            await client.post("/api/v1/userscript/push", json={"job_id": "job-0", "status": 200, "lines": [], "done": True})
+            resp = await client.post("/api/v1/userscript/poll", json={"poller_id": "tab-1", "timeout_seconds": 1})
+            self.assertEqual([j["job_id"] for j in resp.json()["jobs"]], ["job-3"])
+
+        poller = self.scheduler.snapshot()["pollers"]["tab-1"]
+        self.assertEqual((poller["capacity"], poller["in_flight"], poller["jobs"]), (3, 3, 4))
+        self.assertIsNotNone(poller["fetch_start_latency_seconds"])
+
+    async def test_faster_healthier_poller_is_preferred(self) -> None:
+        slow = self.scheduler.register("slow", 1)
+        slow.update(pickup_ewma=2.0, fetch_ewma=3.0)
+        flaky = self.scheduler.register("flaky", 1)
+        flaky.update(pickup_ewma=0.1, fetch_ewma=0.2, error_ewma=0.9)
+        fast = self.scheduler.register("fast", 1)
+        fast.update(pickup_ewma=0.1, fetch_ewma=0.2)
+
+        waits = {pid: asyncio.create_task(self.scheduler.acquire(pid, 1.0)) for pid in ("slow", "flaky", "fast")}
+        await asyncio.sleep(0.05)
+        await self._enqueue("job-a")
+        claimed = await asyncio.wait_for(waits["fast"], timeout=2)
+        self.assertEqual([job_id for job_id, _ in claimed], ["job-a"])
+
+        await self._enqueue("job-b")
+        claimed = await asyncio.wait_for(waits["slow"], timeout=2)
+        self.assertEqual([job_id for job_id, _ in claimed], ["job-b"])
+        self.assertEqual(await waits["flaky"], [])
+
+    async def test_missed_heartbeat_requeues_unstarted_jobs(self) -> None:
+        started = await self._enqueue("job-a")
+        unstarted = await self._enqueue("job-b")
+        self.scheduler.register("tab-1", 2)
+        claimed = await self.scheduler.acquire("tab-1", 1.0)
+        self.assertEqual(len(claimed), 2)
+        await self.main.push_proxy_chunk("job-a", {"status": 200, "lines": ['a0:"x"']})
+
+        self.scheduler._pollers["tab-1"]["last_seen"] -= 1000
+        await self.scheduler._expire_pollers()
+
+        self.assertNotIn("tab-1", self.scheduler.snapshot()["pollers"])
+        self.assertEqual(started["error"], "userscript proxy poller missed heartbeat")
+        self.assertFalse(unstarted["done"])
+        self.assertEqual(unstarted["phase"], "queued")
+        self.assertEqual(self.main._get_userscript_proxy_queue().get_nowait(), "job-b")
+        self.assertEqual(self.scheduler.stats["requeued"], 1)
@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+from tests._stream_test_utils import BaseBridgeTest
+
+
+class _FakeWebSocketClient:
+    """Drives the app's ASGI WebSocket route in the test's own event loop."""
+
+    def __init__(self, app, path: str = "/api/v1/userscript/ws") -> None:
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        self.outgoing: asyncio.Queue = asyncio.Queue()
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "server": ("test", 80),
+            "client": ("127.0.0.1", 1234),
+            "subprotocols": [],
+        }
+        self.incoming.put_nowait({"type": "websocket.connect"})
+        self.task = asyncio.create_task(app(scope, self.incoming.get, self.outgoing.put))
+
+    def send(self, message: dict) -> None:
+        self.incoming.put_nowait({"type": "websocket.receive", "text": json.dumps(message)})
+
+    async def receive(self) -> dict:
+        while True:
+            event = await asyncio.wait_for(self.outgoing.get(), timeout=2)
+            if event["type"] == "websocket.send":
+                return json.loads(event["text"])
+            if event["type"] == "websocket.close":
+                return {"type": "__close__", "code": event.get("code")}
+
+    async def disconnect(self) -> None:
+        self.incoming.put_nowait({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.wait_for(self.task, timeout=2)
+
+
+class TestUserscriptProxyWebSocket(BaseBridgeTest):
+    async def _enqueue(self, job_id: str) -> dict:
+        job = {
+            "payload": {"url": job_id},
+            "lines_queue": asyncio.Queue(),
+            "done_event": asyncio.Event(),
+            "status_event": asyncio.Event(),
+            "picked_up_event": asyncio.Event(),
+            "phase": "queued",
+            "done": False,
+        }
+        self.main._USERSCRIPT_PROXY_JOBS[job_id] = job
+        await self.main._get_userscript_proxy_queue().put(job_id)
+        return job
+
+    async def _connect(self, max_jobs: int = 2) -> _FakeWebSocketClient:
+        client = _FakeWebSocketClient(self.main.app)
+        accept = await asyncio.wait_for(client.outgoing.get(), timeout=2)
+        self.assertEqual(accept["type"], "websocket.accept")
+        client.send({"type": "hello", "max_jobs": max_jobs})
+        welcome = await client.receive()
+        self.assertEqual(welcome["type"], "welcome")
+        return client
+
+    async def test_wrong_secret_is_rejected(self) -> None:
+        self.setup_config({"userscript_proxy_secret": "s3cret"})
+        client = _FakeWebSocketClient(self.main.app)
+        await asyncio.wait_for(client.outgoing.get(), timeout=2)
+        client.send({"type": "hello", "secret": "nope"})
+        self.assertEqual(await client.receive(), {"type": "__close__", "code": 1008})
+        await asyncio.wait_for(client.task, timeout=2)
+
+    async def test_jobs_are_multiplexed_and_frames_acked(self) -> None:
+        job_a = await self._enqueue("job-a")
+        job_b = await self._enqueue("job-b")
+        job_c = await self._enqueue("job-c")
+        client = await self._connect(max_jobs=2)
+
+        dispatched = [await client.receive(), await client.receive()]
+        self.assertEqual([m["job_id"] for m in dispatched], ["job-a", "job-b"])
+        self.assertEqual(dispatched[0]["payload"], {"url": "job-a"})
+        self.assertTrue(job_a["picked_up_event"].is_set())
+        # Two jobs in flight: the third stays queued.
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.main._get_userscript_proxy_queue().qsize(), 1)
+
+        client.send({"type": "lines", "job_id": "job-a", "seq": 2, "lines": ['a0:"x"']})
+        client.send({"type": "status", "job_id": "job-a", "seq": 1, "status": 200, "headers": {"a": "b"}, "id": 7})
+        self.assertEqual(await client.receive(), {"type": "ack", "id": 7})
+        # A re-sent frame is ignored.
+        client.send({"type": "lines", "job_id": "job-a", "seq": 2, "lines": ['a0:"x"']})
+        client.send({"type": "done", "job_id": "job-a", "seq": 3})
+        client.send({"type": "lines", "job_id": "job-b", "lines": ['b0:"y"']})
+
+        self.assertEqual((await client.receive())["job_id"], "job-c")
+        self.assertEqual(job_a["status_code"], 200)
+        self.assertEqual(job_a["headers"], {"a": "b"})
+        lines = []
+        while not job_a["lines_queue"].empty():
+            lines.append(job_a["lines_queue"].get_nowait())
+        self.assertEqual(lines, ['a0:"x"', None])
+        self.assertEqual(await job_b["lines_queue"].get(), 'b0:"y"')
+
+        client.send({"type": "ping"})
+        self.assertEqual((await client.receive())["type"], "pong")
+        await client.disconnect()
+
+        # A job that was already streaming can't be replayed; one that never started goes back on the queue.
+        self.assertEqual(job_b["error"], "userscript proxy websocket disconnected")
+        self.assertFalse(job_c["done"])
+        self.assertEqual(job_c["phase"], "queued")
+        self.assertEqual(self.main._get_userscript_proxy_queue().get_nowait(), "job-c")
+        self.assertEqual(self.main.USERSCRIPT_PROXY_WS_STATS["active_connections"], 0)